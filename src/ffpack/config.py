@@ -16,6 +16,11 @@ class GlobalConfig:
         seed: scalar
             Seed for random number generator. 
             Default value is None.
+        rng: numpy.random.Generator
+            Default random number generator of the stochastic functions called 
+            without randomSeed and rng. It is created by setSeed or can be 
+            assigned directly.
+            Default value is None, the global legacy random state is used.
         atol: scalar
             Absolute tolerance in digits.
             Default value is 8.
@@ -33,6 +38,9 @@ class GlobalConfig:
         '''
         # Seed for random number generator
         self.seed = None
+        # Seed sequence for spawning and the default random number generator
+        self.seedSequence = np.random.SeedSequence( self.seed )
+        self.rng = None
         # Absolute tolerance in digits
         self.atol = 8
         # Relative tolerance in digits
@@ -44,6 +52,10 @@ class GlobalConfig:
         '''
         Set seed for random number generator
 
+        Both the global legacy random state of numpy and the default random 
+        number generator rng are reseeded. Setting seed to None removes the 
+        default random number generator.
+
         Parameters
         ----------
         seed: scalar
@@ -61,6 +73,131 @@ class GlobalConfig:
         if isinstance(seed, (int, type(None))):
             self.seed = seed
             np.random.seed( self.seed )
+            self.seedSequence = np.random.SeedSequence( self.seed )
+            self.rng = None if seed is None else np.random.default_rng( self.seedSequence )
+
+    def spawnRng( self, n ):
+        '''
+        Spawn independent random number generators for child workers
+
+        The generators are created from children of the seed sequence of the 
+        default generator, so a run with the same seed gets the same generators 
+        regardless of how the work is distributed. The seed sequence counts the 
+        children it has spawned, so the generators depend on the number of 
+        generators spawned since the last call of setSeed, which resets the 
+        count.
+
+        Parameters
+        ----------
+        n: integer
+            Number of generators to spawn.
+
+        Returns
+        -------
+        rst: list of numpy.random.Generator
+            Independent random number generators.
+
+        Raises
+        ------
+        ValueError
+            If n is not an integer or is less than 1.
+
+        Examples
+        --------
+        >>> from ffpack.config import globalConfig
+        >>> globalConfig.setSeed( 0 )
+        >>> rngs = globalConfig.spawnRng( 4 )
+        '''
+        if not isinstance( n, int ) or n < 1:
+            raise ValueError( "n should be an int and at least 1" )
+        return [ np.random.default_rng( child ) for child in self.seedSequence.spawn( n ) ]
+
+
+def getRng( randomSeed=None, rng=None ):
+    '''
+    Get the source of random numbers for a stochastic function
+
+    Parameters
+    ----------
+    randomSeed: integer, optional
+        Random seed for the global legacy random state. If randomSeed is none or is 
+        not an integer, globalConfig.rng will be used if it is set, otherwise the 
+        global legacy random state.
+    rng: numpy.random.Generator, optional
+        Random number generator. If rng is given, randomSeed is ignored and the 
+        global legacy random state is not touched.
+
+    Returns
+    -------
+    rst: numpy.random.Generator or module
+        The rng if it is given, otherwise the numpy.random module after seeding 
+        with an integer randomSeed, otherwise globalConfig.rng if it is set, 
+        otherwise the numpy.random module.
+
+    Raises
+    ------
+    ValueError
+        If rng is not a numpy.random.Generator.
+
+    Examples
+    --------
+    >>> from ffpack.config import getRng
+    >>> rng = getRng( randomSeed=2023 )
+    >>> samples = rng.normal( 0, 1, 10 )
+    '''
+    if rng is not None:
+        if not isinstance( rng, np.random.Generator ):
+            raise ValueError( "rng should be a numpy.random.Generator" )
+        return rng
+    if not isinstance( randomSeed, int ) and globalConfig.rng is not None:
+        return globalConfig.rng
+    if isinstance( randomSeed, ( int, type( None ) ) ):
+        np.random.seed( randomSeed )
+    return np.random
+
+
+def getSeedSequence( randomSeed=None, rng=None ):
+    '''
+    Get the root seed sequence for a stochastic function with its own generators
+
+    The sources are taken in the same order as getRng: rng, randomSeed, 
+    globalConfig.rng, and fresh entropy from the operating system in place of 
+    the global legacy random state.
+
+    Parameters
+    ----------
+    randomSeed: integer, optional
+        Random seed for the seed sequence. If randomSeed is none or is not an 
+        integer, the seed sequence is drawn from globalConfig.rng if it is set, 
+        otherwise from fresh entropy from the operating system.
+    rng: numpy.random.Generator, optional
+        Random number generator. If rng is given, the seed sequence is drawn from 
+        rng and randomSeed is ignored.
+
+    Returns
+    -------
+    rst: numpy.random.SeedSequence
+        Root seed sequence.
+
+    Raises
+    ------
+    ValueError
+        If rng is not a numpy.random.Generator.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from ffpack.config import getSeedSequence
+    >>> seedSequence = getSeedSequence( randomSeed=2023 )
+    >>> rngs = [ np.random.default_rng( child ) for child in seedSequence.spawn( 4 ) ]
+    '''
+    if rng is None and isinstance( randomSeed, int ):
+        return np.random.SeedSequence( randomSeed )
+    if rng is None:
+        rng = globalConfig.rng
+    if rng is None:
+        return np.random.SeedSequence()
+    return np.random.SeedSequence( getRng( rng=rng ).integers( 2 ** 32, size=4 ).tolist() )
 
 
 globalConfig = GlobalConfig()
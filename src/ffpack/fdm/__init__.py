@@ -1 +1,5 @@
 from .minerModel import *
+from .hotSpotDamage import *
+from .criticalPlane import *
+from .lifeDistribution import *
+from .spectralDamage import *
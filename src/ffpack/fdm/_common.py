@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+
+'''
+Helpers shared by the fatigue damage models.
+'''
+
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from ffpack.lcc import astmCounting
+
+
+def tiledMinerDamage( numHistories, historiesOfTile, slope, intercept, fatigueLimit,
+                      tileSize, numWorkers ):
+    # Palmgren-miner damage of the stress histories counted tile by tile, where
+    # historiesOfTile( tile ) gives the stress histories of the rows in the tile
+    rst = np.zeros( numHistories )
+
+    def damageOfTile( start ):
+        tile = slice( start, start + tileSize )
+        ranges, counts = astmCounting.astmRainflowCountingBatch( historiesOfTile( tile ) )
+        invN = np.power( 10.0, -( slope * ranges + intercept ) )
+        invN[ ranges <= fatigueLimit ] = 0.0
+        rst[ tile ] = np.sum( counts * invN, axis=1 )
+
+    starts = range( 0, numHistories, tileSize )
+    if numWorkers == 1:
+        for start in starts:
+            damageOfTile( start )
+    else:
+        with ThreadPoolExecutor( max_workers=numWorkers ) as executor:
+            list( executor.map( damageOfTile, starts ) )
+    return rst
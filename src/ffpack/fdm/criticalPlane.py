@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+
+'''
+Critical plane method searches the material plane with the largest fatigue damage 
+under a multiaxial stress history. The normal or shear stress history of each 
+candidate plane is counted by the ASTM rainflow counting and the damage is 
+calculated by the Palmgren-miner model.
+'''
+
+import numpy as np
+from ffpack import utils
+from ._common import tiledMinerDamage
+
+
+def criticalPlaneSearch( stressHistory, snData, fatigueLimit, stressType="normal", 
+                         numTheta=19, numPhi=36, numPsi=18, refine=False, 
+                         numRefine=5, tileSize=64, numWorkers=1 ):
+    '''
+    Critical plane search with the Palmgren-miner damage model.
+
+    The plane is defined by the normal vector 
+    n = [ sin( theta ) cos( phi ), sin( theta ) sin( phi ), cos( theta ) ].
+    For the shear stress, the direction in the plane is defined by 
+    t = cos( psi ) * e1 + sin( psi ) * e2, where 
+    e1 = [ cos( theta ) cos( phi ), cos( theta ) sin( phi ), -sin( theta ) ] and
+    e2 = [ -sin( phi ), cos( phi ), 0 ].
+
+    Parameters
+    ----------
+    stressHistory: 2d or 3d array
+        Stress tensor history either in Voigt notation with dimension of T by 6, 
+        e.g., [ [ sxx, syy, szz, sxy, syz, sxz ], ... ], or in full tensor with 
+        dimension of T by 3 by 3.
+    snData: 2d array
+        Experimental SN data in 2D matrix,
+        e.g., [ [ N1, S1 ], [ N2, S2 ], ..., [ Ni, Si ] ]
+    fatigueLimit: scalar
+        Fatigue limit indicating the minimum S that can cause fatigue.
+    stressType: string, optional
+        "normal" for the normal stress or "shear" for the shear stress on the plane.
+    numTheta: integer, optional
+        Number of theta angles in [ 0, pi / 2 ].
+    numPhi: integer, optional
+        Number of phi angles in [ 0, 2 * pi ).
+    numPsi: integer, optional
+        Number of psi angles in [ 0, pi ), only used for the shear stress.
+    refine: bool, optional
+        If refine is set to True, a finer grid of numRefine points in each angle 
+        within one coarse step around the critical plane will be searched.
+    numRefine: integer, optional
+        Number of points in each angle for the refined search.
+    tileSize: integer, optional
+        Number of planes projected and counted together. The peak memory of each 
+        worker is proportional to tileSize times the length of stressHistory.
+    numWorkers: integer, optional
+        Number of workers counting the tiles in parallel.
+
+    Returns
+    -------
+    rst: scalar
+        Fatigue damage on the critical plane.
+    criticalPlane: 1d array
+        Angles of the critical plane, e.g., [ theta, phi, psi ].
+        psi is 0 for the normal stress.
+    planeDamages: 1d array
+        Fatigue damage on each candidate plane of the coarse grid.
+    planes: 2d array
+        Angles of each candidate plane of the coarse grid, 
+        e.g., [ [ theta1, phi1, psi1 ], ... ].
+
+    Raises
+    ------
+    ValueError
+        If stressHistory is not in dimension of T by 6 or T by 3 by 3.
+        If the length of stressHistory is less than 2.
+        If stressType is not "normal" or "shear".
+        If numTheta, numPhi, numPsi, numRefine, tileSize or numWorkers 
+        is less than 1.
+
+    Examples
+    --------
+    >>> from ffpack.fdm import criticalPlaneSearch
+    >>> stressHistory = [ [ 10.0, 2.0, 0.0, 1.0, 0.0, 0.0 ],
+    ...                   [ -5.0, 1.0, 0.0, -3.0, 0.0, 0.0 ],
+    ...                   [ 12.0, -2.0, 0.0, 4.0, 0.0, 0.0 ],
+    ...                   [ -8.0, 0.0, 0.0, -1.0, 0.0, 0.0 ] ]
+    >>> snData = [ [ 10, 30 ], [ 1000000, 2 ] ]
+    >>> fatigueLimit = 1.0
+    >>> rst, criticalPlane, planeDamages, planes = criticalPlaneSearch( 
+    ...     stressHistory, snData, fatigueLimit )
+    '''
+    # Edge case check
+    stressHistory = np.array( stressHistory, dtype=float )
+    if len( stressHistory.shape ) == 3 and stressHistory.shape[ 1: ] == ( 3, 3 ):
+        stressHistory = stressHistory[ :, [ 0, 1, 2, 0, 1, 0 ], [ 0, 1, 2, 1, 2, 2 ] ]
+    if len( stressHistory.shape ) != 2 or stressHistory.shape[ 1 ] != 6:
+        raise ValueError( "Input stressHistory should be in dimension of "
+                          "T by 6 or T by 3 by 3" )
+    if stressHistory.shape[ 0 ] < 2:
+        raise ValueError( "Input stressHistory length should be at least 2" )
+    if stressType not in [ "normal", "shear" ]:
+        raise ValueError( "stressType should be normal or shear" )
+    for name, val in [ [ "numTheta", numTheta ], [ "numPhi", numPhi ], 
+                       [ "numPsi", numPsi ], [ "numRefine", numRefine ],
+                       [ "tileSize", tileSize ], [ "numWorkers", numWorkers ] ]:
+        if not isinstance( val, int ) or val < 1:
+            raise ValueError( name + " should be an integer larger than 0" )
+    if stressType == "normal":
+        numPsi = 1
+
+    snCurveFitter = utils.SnCurveFitter( snData, fatigueLimit=fatigueLimit )
+    slope, intercept = snCurveFitter.fitter.coef
+
+    def projectionCoefs( planes ):
+        theta, phi, psi = planes.T
+        n = np.stack( [ np.sin( theta ) * np.cos( phi ), 
+                        np.sin( theta ) * np.sin( phi ), 
+                        np.cos( theta ) ], axis=1 )
+        if stressType == "normal":
+            t = n
+        else:
+            e1 = np.stack( [ np.cos( theta ) * np.cos( phi ), 
+                             np.cos( theta ) * np.sin( phi ), 
+                             -np.sin( theta ) ], axis=1 )
+            e2 = np.stack( [ -np.sin( phi ), np.cos( phi ), np.zeros_like( phi ) ], axis=1 )
+            t = np.cos( psi )[ :, None ] * e1 + np.sin( psi )[ :, None ] * e2
+        # t . sigma . n in Voigt notation
+        return np.stack( [ t[ :, 0 ] * n[ :, 0 ], t[ :, 1 ] * n[ :, 1 ], t[ :, 2 ] * n[ :, 2 ],
+                           t[ :, 0 ] * n[ :, 1 ] + t[ :, 1 ] * n[ :, 0 ],
+                           t[ :, 1 ] * n[ :, 2 ] + t[ :, 2 ] * n[ :, 1 ],
+                           t[ :, 0 ] * n[ :, 2 ] + t[ :, 2 ] * n[ :, 0 ] ], axis=1 )
+
+    def damageOfPlanes( planes ):
+        # Stress histories of the planes projected tile by tile
+        return tiledMinerDamage( len( planes ),
+                                 lambda tile: projectionCoefs( planes[ tile ] ) @ stressHistory.T,
+                                 slope, intercept, fatigueLimit, tileSize, numWorkers )
+
+    def angleGrid( thetas, phis, psis ):
+        grid = np.meshgrid( thetas, phis, psis, indexing="ij" )
+        return np.stack( [ g.ravel() for g in grid ], axis=1 )
+
+    thetas = np.linspace( 0, np.pi / 2, numTheta )
+    phis = np.linspace( 0, 2 * np.pi, numPhi, endpoint=False )
+    psis = np.linspace( 0, np.pi, numPsi, endpoint=False )
+    planes = angleGrid( thetas, phis, psis )
+    planeDamages = damageOfPlanes( planes )
+
+    criticalIdx = np.argmax( planeDamages )
+    rst = planeDamages[ criticalIdx ]
+    criticalPlane = planes[ criticalIdx ]
+
+    if refine:
+        steps = [ np.pi / 2 / max( numTheta - 1, 1 ), 2 * np.pi / numPhi, np.pi / numPsi ]
+        localAngles = [ center + np.linspace( -step, step, numRefine ) 
+                        for center, step in zip( criticalPlane, steps ) ]
+        if stressType == "normal":
+            localAngles[ 2 ] = np.zeros( 1 )
+        localPlanes = angleGrid( *localAngles )
+        localDamages = damageOfPlanes( localPlanes )
+        localIdx = np.argmax( localDamages )
+        if localDamages[ localIdx ] > rst:
+            rst = localDamages[ localIdx ]
+            criticalPlane = localPlanes[ localIdx ]
+
+    return rst, criticalPlane, planeDamages, planes
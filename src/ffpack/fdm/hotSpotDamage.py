@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+
+'''
+Hot-spot damage mapping evaluates the fatigue damage at many hot spots whose 
+stress histories are linear combinations of a few load channels, e.g., the 
+unit-load influence coefficients from a finite element model. The stress 
+histories are generated, counted and reduced to damage tile by tile, so only 
+one tile of stress histories is kept in memory for each worker.
+'''
+
+import numpy as np
+from ffpack import utils
+from ._common import tiledMinerDamage
+
+
+def hotSpotDamageMapping( coeffs, loads, snData, fatigueLimit, tileSize=256, 
+                          numWorkers=1 ):
+    '''
+    Palmgren-miner damage of each hot spot with the ASTM rainflow counting.
+
+    The stress history of hot spot i is coeffs[ i ] @ loads. 
+
+    Parameters
+    ----------
+    coeffs: 2d array
+        Influence coefficient matrix in dimension of M by K, 
+        where M is the number of hot spots and K is the number of load channels.
+    loads: 2d array
+        Load histories in dimension of K by T, 
+        where T is the length of the load histories.
+    snData: 2d array
+        Experimental SN data in 2D matrix,
+        e.g., [ [ N1, S1 ], [ N2, S2 ], ..., [ Ni, Si ] ]
+    fatigueLimit: scalar
+        Fatigue limit indicating the minimum S that can cause fatigue.
+    tileSize: integer, optional
+        Number of hot spots processed together. The peak memory of each worker 
+        is proportional to tileSize times T.
+    numWorkers: integer, optional
+        Number of workers processing the tiles in parallel.
+
+    Returns
+    -------
+    rst: 1d array
+        Fatigue damage of each hot spot calculated based on the 
+        Palmgren-miner model.
+
+    Raises
+    ------
+    ValueError
+        If coeffs or loads is not a 2d array.
+        If the dimensions of coeffs and loads are mismatched.
+        If the length of loads is less than 2.
+        If tileSize or numWorkers is less than 1.
+
+    Examples
+    --------
+    >>> from ffpack.fdm import hotSpotDamageMapping
+    >>> coeffs = [ [ 1.0, 0.5 ], [ 0.2, 2.0 ], [ 1.5, 1.5 ] ]
+    >>> loads = [ [ -2.0, 1.0, -3.0, 5.0, -1.0, 3.0, -4.0, 4.0, -2.0 ],
+    ...           [ 1.0, -2.0, 3.0, -1.0, 2.0, -3.0, 1.0, -1.0, 0.0 ] ]
+    >>> snData = [ [ 10, 30 ], [ 1000, 10 ] ]
+    >>> fatigueLimit = 2.0
+    >>> rst = hotSpotDamageMapping( coeffs, loads, snData, fatigueLimit )
+    '''
+    # Edge case check
+    coeffs = np.array( coeffs, dtype=float )
+    loads = np.array( loads, dtype=float )
+    if len( coeffs.shape ) != 2:
+        raise ValueError( "Input coeffs dimension should be 2" )
+    if len( loads.shape ) != 2:
+        raise ValueError( "Input loads dimension should be 2" )
+    if coeffs.shape[ 1 ] != loads.shape[ 0 ]:
+        raise ValueError( "Number of columns in coeffs should be the same as "
+                          "number of rows in loads" )
+    if loads.shape[ 1 ] < 2:
+        raise ValueError( "Input loads length should be at least 2" )
+    if not isinstance( tileSize, int ) or tileSize < 1:
+        raise ValueError( "tileSize should be an integer larger than 0" )
+    if not isinstance( numWorkers, int ) or numWorkers < 1:
+        raise ValueError( "numWorkers should be an integer larger than 0" )
+
+    snCurveFitter = utils.SnCurveFitter( snData, fatigueLimit=fatigueLimit )
+    slope, intercept = snCurveFitter.fitter.coef
+
+    return tiledMinerDamage( coeffs.shape[ 0 ], lambda tile: coeffs[ tile ] @ loads,
+                             slope, intercept, fatigueLimit, tileSize, numWorkers )
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+
+'''
+Fatigue life distribution with the Palmgren-miner damage model. The scatter of 
+the SN curve and the uncertainty of the critical damage are sampled by Monte Carlo
+simulation while the load cycle counting result stays the same.
+'''
+
+import numpy as np
+from ffpack.config import getRng
+
+
+def minerLifeDistribution( lccData, slopeDist, interceptDist, fatigueLimit, 
+                           criticalDamageDist=1.0, numSamples=100000, 
+                           quantiles=( 0.05, 0.5, 0.95 ), chunkSize=4096, 
+                           randomSeed=None, rng=None ):
+    '''
+    Monte Carlo fatigue life distribution based on the Palmgren-miner model.
+
+    The SN curve is log10( N ) = slope * S + intercept, which is the same form 
+    fitted by SnCurveFitter. The fatigue life is the number of repetitions of 
+    the counted load history until the damage reaches the critical damage.
+
+    Parameters
+    ----------
+    lccData: 2d array
+        Load cycle counting results in a 2D matrix,
+        e.g., [ [ value, count ], ... ]
+    slopeDist: distribution or scalar
+        Distribution of the slope of the SN curve. It should be the freezed 
+        distribution object with rvs. We recommend to use scipy.stats functions.
+        A scalar is used as a constant slope.
+    interceptDist: distribution or scalar
+        Distribution of the intercept of the SN curve.
+        A scalar is used as a constant intercept.
+    fatigueLimit: scalar
+        Fatigue limit indicating the minimum S that can cause fatigue.
+    criticalDamageDist: distribution or scalar, optional
+        Distribution of the critical damage of the Palmgren-miner model.
+        Default to the constant 1.0.
+    numSamples: integer, optional
+        Number of Monte Carlo samples.
+    quantiles: 1d array, optional
+        Quantiles of the fatigue life to be calculated.
+    chunkSize: integer, optional
+        Number of samples evaluated together. The peak memory is proportional 
+        to chunkSize times the length of lccData.
+    randomSeed: integer, optional
+        Random seed for the global legacy random state. If randomSeed is none or is 
+        not an integer, globalConfig.rng will be used if it is set, otherwise the 
+        global legacy random state. 
+    rng: numpy.random.Generator, optional
+        Random number generator. If rng is given, the random numbers are drawn 
+        from rng and randomSeed is ignored.
+
+    Returns
+    -------
+    rst: 1d array
+        Fatigue life at each quantile.
+    lifeSamples: 1d array
+        Fatigue life of each sample. inf is returned if the sample has no damage.
+
+    Raises
+    ------
+    ValueError
+        If the lccData dimension is not 2.
+        If the lccData length is less than 1.
+        If the range or the count in lccData is less than or equal 0.
+        If the fatigueLimit is less than or equal 0.
+        If the numSamples or chunkSize is less than 1.
+        If the quantiles are not within [ 0, 1 ].
+
+    Examples
+    --------
+    >>> from ffpack.fdm import minerLifeDistribution
+    >>> from scipy import stats
+    >>> lccData = [ [ 1, 100 ], [ 2, 10 ] ]
+    >>> slopeDist = stats.norm( loc=-1.0, scale=0.05 )
+    >>> interceptDist = stats.norm( loc=5.0, scale=0.2 )
+    >>> fatigueLimit = 0.5
+    >>> rst, lifeSamples = minerLifeDistribution( lccData, slopeDist, 
+    ...                                           interceptDist, fatigueLimit )
+    '''
+    # Edge case check
+    lccData = np.array( lccData, dtype=float )
+    if len( lccData.shape ) != 2:
+        raise ValueError( "Input lccData dimension should be 2" )
+    if lccData.shape[ 0 ] < 1:
+        raise ValueError( "Input lccData length should be at least 1" )
+    if lccData.shape[ 1 ] != 2:
+        raise ValueError( "Each pair length in lccData should be 2" )
+    if np.any( lccData[ :, 0 ] <= 0 ):
+        raise ValueError( "Range should be larger than 0" )
+    if np.any( lccData[ :, 1 ] <= 0 ):
+        raise ValueError( "Counts should be larger than 0" )
+    if fatigueLimit <= 0:
+        raise ValueError( "fatigueLimit should be larger than 0" )
+    if not isinstance( numSamples, int ) or numSamples < 1:
+        raise ValueError( "numSamples should be an integer larger than 0" )
+    if not isinstance( chunkSize, int ) or chunkSize < 1:
+        raise ValueError( "chunkSize should be an integer larger than 0" )
+    quantiles = np.array( quantiles, dtype=float )
+    if np.any( quantiles < 0 ) or np.any( quantiles > 1 ):
+        raise ValueError( "quantiles should be within [ 0, 1 ]" )
+
+    rng = getRng( randomSeed, rng )
+    randomState = rng if isinstance( rng, np.random.Generator ) else None
+
+    def drawSamples( dist ):
+        if hasattr( dist, "rvs" ):
+            return np.asarray( dist.rvs( size=numSamples, random_state=randomState ), 
+                               dtype=float )
+        return np.full( numSamples, dist, dtype=float )
+
+    slopes = drawSamples( slopeDist )
+    intercepts = drawSamples( interceptDist )
+    criticalDamages = drawSamples( criticalDamageDist )
+
+    # Only the cycles above the fatigue limit cause damage
+    lccData = lccData[ lccData[ :, 0 ] > fatigueLimit ]
+    S = lccData[ :, 0 ]
+    counts = lccData[ :, 1 ]
+
+    damages = np.zeros( numSamples )
+    for start in range( 0, numSamples, chunkSize ):
+        chunk = slice( start, start + chunkSize )
+        logN = np.outer( slopes[ chunk ], S ) + intercepts[ chunk, None ]
+        damages[ chunk ] = np.power( 10.0, -logN ) @ counts
+
+    lifeSamples = np.full( numSamples, np.inf )
+    np.divide( criticalDamages, damages, out=lifeSamples, where=damages > 0 )
+    # Quantiles between two infinite lives are infinite
+    with np.errstate( invalid="ignore" ):
+        rst = np.quantile( lifeSamples, quantiles )
+    rst[ np.isnan( rst ) ] = np.inf
+    return rst, lifeSamples
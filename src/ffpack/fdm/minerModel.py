@@ -12,6 +12,31 @@ import numpy as np
 from ffpack import utils
 
 
+def _invalidRowsMessage( message, rows, maxRows=10, label="rows" ):
+    # Append the first maxRows invalid indices to the error message
+    shown = ", ".join( str( np.asarray( row ).tolist() ) for row in rows[ : maxRows ] )
+    if len( rows ) > maxRows:
+        shown += ", ... ( {} {} in total )".format( len( rows ), label )
+    return "{}, invalid {}: [ {} ]".format( message, label, shown )
+
+
+def _checkFatigueData( fatigueData, rowIndex=None ):
+    # Check all [ C, F ] pairs with array masks, rowIndex maps the invalid 
+    # row indices to the indices reported in the error message
+    if rowIndex is None:
+        rowIndex = lambda rows: rows
+    checks = [ [ fatigueData[ :, 0 ] < 0, 
+                 "Counting cycles should be larger than or equal 0" ],
+               [ fatigueData[ :, 1 ] <= 0, 
+                 "Failure cycles should be larger than 0" ],
+               [ fatigueData[ :, 0 ] > fatigueData[ :, 1 ], 
+                 "Failure cycles should be larger than or equal counting cycles" ] ]
+    for mask, message in checks:
+        if np.any( mask ):
+            raise ValueError( _invalidRowsMessage( message, 
+                                                   rowIndex( np.flatnonzero( mask ) ) ) )
+
+
 def minerDamageModelNaive( fatigueData ):
     '''
     Naive Palmgren-miner damage model directly calcuates the damage results.
@@ -36,6 +61,7 @@ def minerDamageModelNaive( fatigueData ):
         If counting cycles is less than 0.
         If number of failure cycles is less than or equal 0.
         If number of counting cycles is large than failure cycles.
+        The indices of the invalid rows are reported in the error message.
 
     
     Examples
@@ -50,20 +76,96 @@ def minerDamageModelNaive( fatigueData ):
         raise ValueError( "Input fatigueData dimension should be 2" )
     if fatigueData.shape[ 0 ] < 1:
         raise ValueError( "Input data length should be at least 1" )
-    for p in fatigueData:
-        if len( p ) != 2:
-            raise ValueError( "Each pair length in fatigueData should be 2" )
-        if p[ 0 ] < 0:
-            raise ValueError( "Counting cycles should be larger than or equal 0" )
-        if p[ 1 ] <= 0:
-            raise ValueError( "Failure cycles should be larger than 0" )
-        if p[ 0 ] > p[ 1 ]:
-            raise ValueError( "Failure cycles should be larger than "
-                              "or equal counting cycles" )
+    if fatigueData.shape[ 1 ] != 2:
+        raise ValueError( "Each pair length in fatigueData should be 2" )
+    _checkFatigueData( fatigueData )
 
     return np.sum( fatigueData[ :, 0 ] / fatigueData[ :, 1 ] )
 
 
+def minerDamageModelNaiveBatch( fatigueData, offsets=None ):
+    '''
+    Naive Palmgren-miner damage model for a batch of cases in one pass.
+
+    Parameters
+    ----------
+    fatigueData: 3d array, list of 2d arrays, or 2d array
+        Paired counting and experimental data of each case. It could be 
+        a 3d array in dimension of cases by rows by 2, 
+        e.g., [ [ [ C11, F11 ], [ C12, F12 ] ], [ [ C21, F21 ], [ C22, F22 ] ] ],
+        a list of 2d arrays with different lengths,
+        e.g., [ [ [ C11, F11 ] ], [ [ C21, F21 ], [ C22, F22 ] ] ],
+        or a 2d array of all cases concatenated together with offsets,
+        e.g., [ [ C11, F11 ], [ C21, F21 ], [ C22, F22 ] ].
+    offsets: 1d array, optional
+        Starting row of each case when fatigueData is a 2d array of 
+        all cases concatenated together, e.g., [ 0, 1 ].
+    
+    Returns
+    -------
+    rst: 1d array
+        Fatigue damage of each case calculated based on the Palmgren-miner model.
+    
+    Raises
+    ------
+    ValueError
+        If the pair length in fatigueData is not 2.
+        If any case has less than 1 row.
+        If offsets is not increasing from 0 for the 2d fatigueData.
+        If counting cycles is less than 0.
+        If number of failure cycles is less than or equal 0.
+        If number of counting cycles is large than failure cycles.
+        The invalid rows are reported as [ case, row ] in the error message.
+
+    Examples
+    --------
+    >>> from ffpack.fdm import minerDamageModelNaiveBatch
+    >>> fatigueData = [ [ [ 10, 100 ], [ 200, 2000 ] ], [ [ 1, 100 ], [ 2, 2000 ] ] ]
+    >>> rst = minerDamageModelNaiveBatch( fatigueData )
+    '''
+    # Edge case check
+    if offsets is None:
+        if len( fatigueData ) < 1:
+            raise ValueError( "Input fatigueData should have at least 1 case" )
+        try:
+            # Cases with the same length are handled as one 3d array
+            data3d = np.array( fatigueData, dtype=float )
+        except ValueError:
+            data3d = None
+        if data3d is not None and len( data3d.shape ) == 3:
+            if data3d.shape[ 2 ] != 2:
+                raise ValueError( "Each pair length in fatigueData should be 2" )
+            lengths = np.full( data3d.shape[ 0 ], data3d.shape[ 1 ] )
+            fatigueData = data3d.reshape( -1, 2 )
+        else:
+            cases = [ np.array( case, dtype=float ) for case in fatigueData ]
+            for case in cases:
+                if len( case.shape ) != 2 or case.shape[ 1 ] != 2:
+                    raise ValueError( "Each pair length in fatigueData should be 2" )
+            lengths = np.array( [ case.shape[ 0 ] for case in cases ] )
+            fatigueData = np.concatenate( cases, axis=0 )
+        offsets = np.concatenate( [ [ 0 ], np.cumsum( lengths )[ :-1 ] ] ).astype( int )
+    else:
+        fatigueData = np.array( fatigueData, dtype=float )
+        if len( fatigueData.shape ) != 2 or fatigueData.shape[ 1 ] != 2:
+            raise ValueError( "Each pair length in fatigueData should be 2" )
+        offsets = np.array( offsets, dtype=int )
+        if len( offsets.shape ) != 1 or offsets.shape[ 0 ] < 1 or offsets[ 0 ] != 0:
+            raise ValueError( "offsets should be a 1d array starting from 0" )
+        lengths = np.diff( np.append( offsets, fatigueData.shape[ 0 ] ) )
+    if np.any( lengths < 1 ):
+        raise ValueError( _invalidRowsMessage( "Each case should have at least 1 row", 
+                                               np.flatnonzero( lengths < 1 ), 
+                                               label="cases" ) )
+
+    def caseRowIndex( rows ):
+        caseIdx = np.searchsorted( offsets, rows, side="right" ) - 1
+        return np.stack( [ caseIdx, rows - offsets[ caseIdx ] ], axis=1 )
+    _checkFatigueData( fatigueData, caseRowIndex )
+
+    return np.add.reduceat( fatigueData[ :, 0 ] / fatigueData[ :, 1 ], offsets )
+
+
 def minerDamageModelClassic( lccData, snData, fatigueLimit ):
     '''
     Classical Palmgren-miner damage model calculates the damage results 
@@ -124,3 +226,97 @@ def minerDamageModelClassic( lccData, snData, fatigueLimit ):
             rst += p[ 1 ] / nFromSNCurve
 
     return rst 
+
+
+def minerDamageModelClassicBatch( lccData, snCoefs, fatigueLimit, chunkSize=512 ):
+    '''
+    Classical Palmgren-miner damage model evaluated for a batch of SN curves
+    with one load cycle counting result.
+
+    Each SN curve is described by the coefficients of the fitted line
+    log10( N ) = slope * S + intercept, which are the same coefficients used by
+    SnCurveFitter, i.e., snCurveFitter.fitter.coef.
+
+    Parameters
+    ----------
+    lccData: 2d array
+        Load cycle counting results in a 2D matrix,
+        e.g., [ [ value, count ], ... ]
+    snCoefs: 2d array
+        SN curve coefficients in a 2D matrix, 
+        e.g., [ [ slope1, intercept1 ], [ slope2, intercept2 ], ... ]
+    fatigueLimit: scalar or 1d array
+        Fatigue limit indicating the minimum S that can cause fatigue.
+        A 1d array defines the fatigue limit for each SN curve.
+    chunkSize: integer, optional
+        Number of SN curves evaluated together. The peak memory is 
+        proportional to chunkSize times the length of lccData.
+    
+    Returns
+    -------
+    rst: 1d array
+        Fatigue damage calculated based on the Palmgren-miner model 
+        for each SN curve.
+    
+    Raises
+    ------
+    ValueError
+        If the lccData dimension is not 2.
+        If the lccData length is less than 1.
+        If the range or the count in lccData is less than or equal 0.
+        If the snCoefs is not in dimension of m by 2.
+        If the fatigueLimit does not match the number of SN curves.
+        If the fatigueLimit is less than or equal 0.
+        If the chunkSize is less than 1.
+
+    Examples
+    --------
+    >>> from ffpack.fdm import minerDamageModelClassicBatch
+    >>> lccData = [ [ 1, 100 ], [ 2, 10 ] ]
+    >>> snCoefs = [ [ -1.0, 4.0 ], [ -1.5, 4.5 ] ]
+    >>> fatigueLimit = 0.5
+    >>> rst = minerDamageModelClassicBatch( lccData, snCoefs, fatigueLimit )
+    '''
+    # Edge case check
+    lccData = np.array( lccData, dtype=float )
+    if len( lccData.shape ) != 2:
+        raise ValueError( "Input lccData dimension should be 2" )
+    if lccData.shape[ 0 ] < 1:
+        raise ValueError( "Input lccData length should be at least 1" )
+    if lccData.shape[ 1 ] != 2:
+        raise ValueError( "Each pair length in lccData should be 2" )
+    if np.any( lccData[ :, 0 ] <= 0 ):
+        raise ValueError( "Range should be larger than 0" )
+    if np.any( lccData[ :, 1 ] <= 0 ):
+        raise ValueError( "Counts should be larger than 0" )
+
+    snCoefs = np.array( snCoefs, dtype=float )
+    if len( snCoefs.shape ) == 1:
+        snCoefs = snCoefs.reshape( 1, -1 )
+    if len( snCoefs.shape ) != 2 or snCoefs.shape[ 0 ] < 1 or snCoefs.shape[ 1 ] != 2:
+        raise ValueError( "Input snCoefs should be in dimension of m by 2" )
+    numCurves = snCoefs.shape[ 0 ]
+
+    fatigueLimit = np.array( fatigueLimit, dtype=float )
+    if fatigueLimit.ndim == 0:
+        fatigueLimit = np.full( numCurves, fatigueLimit )
+    if fatigueLimit.shape != ( numCurves, ):
+        raise ValueError( "fatigueLimit should be a scalar or have one value per SN curve" )
+    if np.any( fatigueLimit <= 0 ):
+        raise ValueError( "fatigueLimit should be larger than 0" )
+
+    if not isinstance( chunkSize, int ) or chunkSize < 1:
+        raise ValueError( "chunkSize should be an integer larger than 0" )
+
+    S = lccData[ :, 0 ]
+    counts = lccData[ :, 1 ]
+    rst = np.zeros( numCurves )
+    for start in range( 0, numCurves, chunkSize ):
+        chunk = slice( start, start + chunkSize )
+        # 1 / N = 10 ^ -( slope * S + intercept ) for all curves in the chunk
+        logN = np.outer( snCoefs[ chunk, 0 ], S ) + snCoefs[ chunk, 1 ][ :, None ]
+        invN = np.power( 10.0, -logN )
+        invN[ S[ None, : ] <= fatigueLimit[ chunk, None ] ] = 0.0
+        rst[ chunk ] = invN @ counts
+
+    return rst
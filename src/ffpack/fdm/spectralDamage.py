@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+
+'''
+Long-term spectral fatigue damage over a wave scatter diagram. The JONSWAP
+spectra of all the sea states are evaluated as one cells by frequencies array,
+multiplied by the squared response transfer function, reduced to spectral
+moments in bulk, and converted to narrow-band damage rates in closed form.
+'''
+
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from scipy import special
+from ffpack import lsm
+from ffpack import utils
+
+
+def _narrowBandDamageRate( m0, m2, slope, intercept, fatigueLimit ):
+    # Damage per unit time of a narrow-band Gaussian response with Rayleigh
+    # distributed stress ranges S of scale 2 sqrt( m0 ), counted at the zero
+    # up-crossing rate, for the SN curve log10( N ) = slope * S + intercept with
+    # no damage below the fatigue limit. With x = S / ( 2 sqrt( m0 ) ), the
+    # integral of x exp( -x^2 / 2 + c x ) from a to infinity is
+    # exp( -a^2 / 2 + c a ) + c sqrt( 2 pi ) exp( c^2 / 2 ) Q( a - c ).
+    rst = np.zeros( m0.shape )
+    valid = m0 > 0
+    scale = 2 * np.sqrt( m0[ valid ] )
+    c = -slope * np.log( 10 ) * scale
+    a = fatigueLimit / scale
+    integral = np.exp( -a * a / 2 + c * a ) + \
+        c * np.sqrt( 2 * np.pi ) * np.exp( c * c / 2 + special.log_ndtr( c - a ) )
+    zeroCrossingRate = np.sqrt( m2[ valid ] / m0[ valid ] ) / ( 2 * np.pi )
+    rst[ valid ] = zeroCrossingRate * np.power( 10.0, -intercept ) * integral
+    return rst
+
+
+def scatterDiagramFatigueDamage( scatterTable, w, transferFunction, snData,
+                                 fatigueLimit, duration, gamma=3.3, cellBlockSize=256,
+                                 numWorkers=1 ):
+    '''
+    Long-term Palmgren-miner damage weighted over a wave scatter diagram.
+
+    For each sea state, the JONSWAP spectrum with the peak frequency 2 pi / Tp
+    is scaled so that its zeroth moment on w is Hs^2 / 16, multiplied by
+    |transferFunction|^2 to give the stress response spectrum, and its moments
+    m0 and m2 give the narrow-band damage rate with Rayleigh distributed stress
+    ranges counted at the zero up-crossing rate.
+
+    Parameters
+    ----------
+    scatterTable: 2d array
+        Scatter diagram in form of [ [ Hs1, Tp1, p1 ], [ Hs2, Tp2, p2 ], ... ],
+        where Hs is the significant wave height, Tp is the peak period ( s ),
+        and p is the probability of occurrence. The probabilities are normalized
+        to sum to 1, so occurrence counts can be given directly.
+    w: 1d array
+        Increasing wave frequencies ( rad/s ) to evaluate the spectra.
+    transferFunction: 1d array
+        Stress response transfer function on w, real or complex.
+    snData: 2d array
+        Experimental SN data in 2D matrix,
+        e.g., [ [ N1, S1 ], [ N2, S2 ], ..., [ Ni, Si ] ]
+    fatigueLimit: scalar
+        Fatigue limit indicating the minimum S that can cause fatigue.
+    duration: scalar
+        Total exposure time ( s ).
+    gamma: scalar, optional
+        Peak enhancement factor of the JONSWAP spectrum.
+    cellBlockSize: integer, optional
+        Number of scatter diagram cells evaluated together. The peak memory of
+        each worker is proportional to cellBlockSize times the length of w.
+    numWorkers: integer, optional
+        Number of workers processing the cell blocks in parallel.
+
+    Returns
+    -------
+    damage: scalar
+        Lifetime fatigue damage weighted over the scatter diagram.
+    cellDamage: 1d array
+        Contribution of each scatter diagram cell to the lifetime damage.
+
+    Raises
+    ------
+    ValueError
+        If scatterTable is not in dimension of n by 3.
+        If Hs or p is negative, or Tp is not positive.
+        If the probabilities sum to 0.
+        If w is not an increasing 1d array with at least 2 elements.
+        If transferFunction and w are in different lengths.
+        If duration is negative.
+        If cellBlockSize or numWorkers is less than 1.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from ffpack.fdm import scatterDiagramFatigueDamage
+    >>> scatterTable = [ [ 1.5, 6.0, 0.3 ], [ 2.5, 8.0, 0.5 ], [ 4.0, 10.0, 0.2 ] ]
+    >>> w = np.linspace( 0.1, 3.0, 500 )
+    >>> transferFunction = 20.0 / np.sqrt( ( 1 - ( w / 1.2 ) ** 2 ) ** 2 + ( 0.1 * w ) ** 2 )
+    >>> snData = [ [ 1e5, 200 ], [ 1e7, 50 ] ]
+    >>> damage, cellDamage = scatterDiagramFatigueDamage( scatterTable, w,
+    ...     transferFunction, snData, 10.0, 20 * 365.25 * 24 * 3600 )
+    '''
+    # Edge case check
+    scatterTable = np.array( scatterTable, dtype=float )
+    if len( scatterTable.shape ) != 2 or scatterTable.shape[ 1 ] != 3 or \
+       scatterTable.shape[ 0 ] < 1:
+        raise ValueError( "scatterTable should be in dimension of n by 3" )
+    Hs, Tp, prob = scatterTable.T
+    if np.any( Hs < 0 ) or np.any( prob < 0 ):
+        raise ValueError( "Hs and p should not be negative" )
+    if np.any( Tp <= 0 ):
+        raise ValueError( "Tp should be positive" )
+    if np.sum( prob ) <= 0:
+        raise ValueError( "Sum of p should be positive" )
+    w = np.array( w, dtype=float )
+    if len( w.shape ) != 1 or w.shape[ 0 ] < 2 or np.any( np.diff( w ) <= 0 ):
+        raise ValueError( "w should be an increasing 1d array with at least 2 elements" )
+    transferFunction = np.asarray( transferFunction )
+    if transferFunction.shape != w.shape:
+        raise ValueError( "transferFunction and w should be in the same length" )
+    if duration < 0:
+        raise ValueError( "duration should not be negative" )
+    if not isinstance( cellBlockSize, int ) or cellBlockSize < 1:
+        raise ValueError( "cellBlockSize should be an integer larger than 0" )
+    if not isinstance( numWorkers, int ) or numWorkers < 1:
+        raise ValueError( "numWorkers should be an integer larger than 0" )
+
+    snCurveFitter = utils.SnCurveFitter( snData, fatigueLimit=fatigueLimit )
+    slope, intercept = snCurveFitter.fitter.coef
+
+    responseGain = np.square( np.abs( transferFunction ) )
+    spectralMoments = lsm.SpectralMoments( orders=( 0, 2 ) )
+    numCells = scatterTable.shape[ 0 ]
+    damageRate = np.zeros( numCells )
+
+    def damageOfBlock( start ):
+        block = slice( start, start + cellBlockSize )
+        # Unit JONSWAP shapes of the block scaled to the significant wave heights
+        shapes = lsm.jonswapSpectrum( w, 2 * np.pi / Tp[ block, None ], alpha=1.0,
+                                      gamma=gamma )
+        shapeM0 = spectralMoments.getMoments( w, shapes )[ :, 0 ]
+        scales = np.square( Hs[ block ] ) / 16 / shapeM0
+        responseSpectra = shapes * scales[ :, None ] * responseGain
+        m0, m2 = spectralMoments.getMoments( w, responseSpectra ).T
+        damageRate[ block ] = _narrowBandDamageRate( m0, m2, slope, intercept,
+                                                     fatigueLimit )
+
+    starts = range( 0, numCells, cellBlockSize )
+    if numWorkers == 1:
+        for start in starts:
+            damageOfBlock( start )
+    else:
+        with ThreadPoolExecutor( max_workers=numWorkers ) as executor:
+            list( executor.map( damageOfBlock, starts ) )
+
+    cellDamage = duration * prob / np.sum( prob ) * damageRate
+    return np.sum( cellDamage ), cellDamage
@@ -485,3 +485,86 @@ def astmRainflowRepeatHistoryCounting( data, aggregate=True ):
     rst = np.array( [ [ key, val ] for key, val in rstDict.items() ] )
     rst = rst[ rst[ :, 0 ].argsort() ]
     return rst.tolist()
+
+
+def astmRainflowCountingBatch( data ):
+    '''
+    ASTM rainflow counting in E1049-85: sec 5.4.4 for a batch of sequences.
+
+    Each row is counted in the same way as astmRainflowCounting, but all rows 
+    are counted together: the reversals of all rows are extracted with array 
+    operations and the rainflow stacks of all rows are advanced in lockstep.
+
+    Parameters
+    ----------
+    data: 2d array
+        Load sequence data for counting in rows, e.g., [ sequence1, sequence2, ... ].
+    
+    Returns
+    -------
+    ranges: 2d array
+        Cycle ranges of each row. 
+    counts: 2d array
+        Cycle counts of each row, 1 for full cycles and 0.5 for half cycles. 
+        Rows with fewer cycles than the longest row are padded with 0 counts.
+    
+    Raises
+    ------
+    ValueError
+        If the data length is less than 2 or the data dimension is not 2.
+
+    Examples
+    --------
+    >>> from ffpack.lcc import astmRainflowCountingBatch
+    >>> data = [ [ -2.0, 1.0, -3.0, 5.0, -1.0, 3.0, -4.0, 4.0, -2.0 ],
+    ...          [ 1.0, -2.0, 3.0, -1.0, 2.0, -3.0, 1.0, -1.0, 0.0 ] ]
+    >>> ranges, counts = astmRainflowCountingBatch( data )
+    '''
+    # Edge case check
+    data = np.array( data, dtype=float )
+    if len( data.shape ) != 2:
+        raise ValueError( "Input data dimension should be 2" )
+    if data.shape[ 1 ] <= 1:
+        raise ValueError( "Input data length should be at least 2")
+
+    # Remove the intermediate value first
+    reversals, lengths = sequenceFilter.sequencePeakValleyFilterBatch( data )
+    numRows, numReversals = reversals.shape
+
+    stack = np.zeros( ( numRows, numReversals ) )
+    stackSize = np.zeros( numRows, dtype=int )
+    ranges = np.zeros( ( numRows, numReversals - 1 ) )
+    counts = np.zeros( ( numRows, numReversals - 1 ) )
+    numCycles = np.zeros( numRows, dtype=int )
+    allRows = np.arange( numRows )
+    for k in range( numReversals ):
+        rows = allRows[ k < lengths ]
+        stack[ rows, stackSize[ rows ] ] = reversals[ rows, k ]
+        stackSize[ rows ] += 1
+        rows = rows[ stackSize[ rows ] >= 3 ]
+        while rows.size:
+            top = stackSize[ rows ]
+            X = np.abs( stack[ rows, top - 1 ] - stack[ rows, top - 2 ] )
+            Y = np.abs( stack[ rows, top - 2 ] - stack[ rows, top - 3 ] )
+            hit = X >= Y
+            rows, top, Y = rows[ hit ], top[ hit ], Y[ hit ]
+            # Y contains the starting point: half cycle, drop the starting point
+            # otherwise: full cycle, drop the two points of Y
+            half = top == 3
+            ranges[ rows, numCycles[ rows ] ] = Y
+            counts[ rows, numCycles[ rows ] ] = np.where( half, 0.5, 1.0 )
+            numCycles[ rows ] += 1
+            stack[ rows, top - 3 ] = np.where( half, stack[ rows, 1 ], stack[ rows, top - 1 ] )
+            stack[ rows, top - 2 ] = np.where( half, stack[ rows, 2 ], stack[ rows, top - 2 ] )
+            stackSize[ rows ] = np.where( half, 2, top - 2 )
+            rows = rows[ stackSize[ rows ] >= 3 ]
+
+    # Remaining ranges in the stacks are counted as half cycles
+    residue = np.abs( np.diff( stack, axis=1 ) )
+    rows, cols = np.nonzero( np.arange( numReversals - 1 )[ None, : ] < stackSize[ :, None ] - 1 )
+    ranges[ rows, numCycles[ rows ] + cols ] = residue[ rows, cols ]
+    counts[ rows, numCycles[ rows ] + cols ] = 0.5
+    numCycles += np.maximum( stackSize - 1, 0 )
+
+    maxCycles = numCycles.max()
+    return ranges[ :, :maxCycles ], counts[ :, :maxCycles ]
@@ -1,3 +1,6 @@
 from .randomWalk import *
 from .autoregressiveMovingAverage import *
 from .sequenceFromSpectrum import *
+from .sequenceStream import *
+from .autoregressiveMovingAverageFit import *
+from .markovChainSequence import *
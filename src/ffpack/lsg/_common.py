@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+
+'''
+Helpers shared by the load sequence generators and their streams.
+'''
+
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+
+
+def _isEquallySpaced( freq ):
+    # Check the spacing of freq is constant within the tolerance
+    diffs = np.diff( freq )
+    return np.all( np.abs( diffs - diffs[ 0 ] ) <= np.power( 10.0, -4 ) )
+
+
+def checkFreqInput( freq, equallySpaced=True ):
+    # Check freq is a non-negative strictly increasing 1d array, which is also
+    # equally spaced if equallySpaced is True
+    freq = np.array( freq, dtype=float )
+    if len( freq.shape ) != 1:
+        raise ValueError( "freq dimension should be 1" )
+    if freq.shape[ 0 ] < 3:
+        raise ValueError( "freq length should be at least 3" )
+    if freq[ 0 ] < 0:
+        raise ValueError( "freq array should be non-negative" )
+    if np.any( np.diff( freq ) <= 0 ):
+        raise ValueError( "freq array should be strictly increasing" )
+    if equallySpaced and not _isEquallySpaced( freq ):
+        raise ValueError( "freq array should be equally spaced increasing" )
+    return freq
+
+
+def _frequencyBandwidths( freq ):
+    # Bandwidth of each frequency between the midpoints to its neighbors, the
+    # end frequencies take the full spacing to their only neighbor so that an
+    # equally spaced freq gives the same bandwidth for every frequency
+    diffs = np.diff( freq )
+    return np.concatenate( [ diffs[ : 1 ], ( diffs[ : -1 ] + diffs[ 1: ] ) / 2,
+                             diffs[ -1: ] ] )
+
+
+def checkSpectrumInput( freq, psd, freqBandwidth, equallySpaced=True ):
+    # Check freq, psd and freqBandwidth, return them with the index step 
+    # for the frequencies used in the synthesis. If freq is not equally spaced,
+    # which is only allowed when equallySpaced is False, every frequency is used
+    # and freqBandwidth is an array with the bandwidth of each frequency
+
+    freq = checkFreqInput( freq, equallySpaced )
+
+    # edge case check for psd
+    psd = np.array( psd, dtype=float )
+    if len( psd.shape ) != 1:
+        raise ValueError( "psd dimension should be 1" )
+    if psd.shape[ 0 ] < 3:
+        raise ValueError( "psd length should be at least 3" )
+    
+    # edge case check for freq and psd length
+    if len( freq ) != len( psd ):
+        raise ValueError( "freq and psd should be in the same length" )
+
+    # edge case check for freqBandwidth
+    if freqBandwidth is not None:
+        if not isinstance( freqBandwidth, int ) and not isinstance( freqBandwidth, float ):
+            raise ValueError( "freqBandwidth should be a scalar" )
+        if freqBandwidth <= 0:
+            raise ValueError( "freqBandwidth should be positive" )
+
+    # deal with freqBandwidth
+    if not _isEquallySpaced( freq ):
+        if freqBandwidth is not None:
+            raise ValueError( "freqBandwidth should be None for unequally spaced freq" )
+        return freq, psd, _frequencyBandwidths( freq ), 1
+    if freqBandwidth is None or freqBandwidth < freq[ 1 ] - freq[ 0 ]:
+        freqBandwidth = freq[ 1 ] - freq[ 0 ]
+    next = round( freqBandwidth / ( freq[ 1 ] - freq[ 0 ] ) )
+    return freq, psd, freqBandwidth, next
+
+
+def spectralSynthesisDirect( ts, freq, coefs, phis, blockSize, numWorkers ):
+    # Sum coefs[ k ] * sin( 2 * pi * freq[ k ] * t + phis[ k ] ) block by block of 
+    # time, the peak memory of each worker is proportional to blockSize times 
+    # the number of frequencies
+    omegas = 2 * np.pi * freq
+    amps = np.zeros( len( ts ) )
+
+    def synthesizeBlock( start ):
+        block = slice( start, start + blockSize )
+        amps[ block ] = np.sin( np.outer( ts[ block ], omegas ) + phis ) @ coefs
+
+    starts = range( 0, len( ts ), blockSize )
+    if numWorkers == 1:
+        for start in starts:
+            synthesizeBlock( start )
+    else:
+        with ThreadPoolExecutor( max_workers=numWorkers ) as executor:
+            list( executor.map( synthesizeBlock, starts ) )
+    return amps
+
+
+def randomWalkSteps( randomInt, dim ):
+    # Convert random integers in [ 0, 2 * dim ) to one-hot unit steps, the last 
+    # dimension of the output is the data dimension
+    steps = np.zeros( randomInt.shape + ( dim, ), dtype=int )
+    np.put_along_axis( steps, ( randomInt % dim )[ ..., None ], 
+                       np.where( randomInt >= dim, 1, -1 )[ ..., None ], axis=-1 )
+    return steps
+
+
+def checkTransitionInput( transitionMatrix, levels ):
+    # Check the transition matrix is square and matches the levels
+    transitionMatrix = np.array( transitionMatrix, dtype=float )
+    levels = np.array( levels, dtype=float )
+    if len( levels.shape ) != 1 or levels.shape[ 0 ] < 2:
+        raise ValueError( "levels should be a 1d array with at least 2 elements" )
+    if transitionMatrix.shape != ( levels.shape[ 0 ], levels.shape[ 0 ] ):
+        raise ValueError( "transitionMatrix should be a square matrix matching levels" )
+    if np.any( transitionMatrix < 0 ):
+        raise ValueError( "transitionMatrix should not contain negative elements" )
+    return transitionMatrix, levels
+
+
+def _aliasTables( probs ):
+    # Vose alias tables for each row of probs, rows without mass are left empty
+    numRows, numCols = probs.shape
+    accept = np.ones( ( numRows, numCols ) )
+    alias = np.tile( np.arange( numCols ), ( numRows, 1 ) )
+    for i in range( numRows ):
+        total = probs[ i ].sum()
+        if total <= 0:
+            continue
+        scaled = probs[ i ] * numCols / total
+        small = [ j for j in range( numCols ) if scaled[ j ] < 1.0 ]
+        large = [ j for j in range( numCols ) if scaled[ j ] >= 1.0 ]
+        while small and large:
+            smallIdx, largeIdx = small.pop(), large.pop()
+            accept[ i, smallIdx ] = scaled[ smallIdx ]
+            alias[ i, smallIdx ] = largeIdx
+            scaled[ largeIdx ] -= 1.0 - scaled[ smallIdx ]
+            ( small if scaled[ largeIdx ] < 1.0 else large ).append( largeIdx )
+    return accept, alias
+
+
+def markovTables( transitionMatrix ):
+    # Flattened alias tables, the first half for the upward transitions from the
+    # minima and the second half for the downward transitions from the maxima
+    upAccept, upAlias = _aliasTables( np.triu( transitionMatrix, 1 ) )
+    downAccept, downAlias = _aliasTables( np.tril( transitionMatrix, -1 ) )
+    accept = np.concatenate( [ upAccept.ravel(), downAccept.ravel() ] )
+    alias = np.concatenate( [ upAlias.ravel(), downAlias.ravel() ] )
+    return accept.tolist(), alias.tolist()
+
+
+def markovTurningPointIndices( state, isMin, randoms, accept, alias, numLevels ):
+    # Walk the chain with one uniform random number per step, the integer part
+    # of randoms * numLevels picks the alias column and the fraction is the coin
+    scaled = np.asarray( randoms ) * numLevels
+    cols = np.minimum( scaled.astype( int ), numLevels - 1 )
+    coins = ( scaled - cols ).tolist()
+    offsets = ( cols + numLevels * numLevels *
+                ( ( np.arange( len( cols ) ) + ( not isMin ) ) % 2 ) ).tolist()
+    cols = cols.tolist()
+    rst = [ 0 ] * len( cols )
+    for i in range( len( cols ) ):
+        k = offsets[ i ] + state * numLevels
+        state = cols[ i ] if coins[ i ] < accept[ k ] else alias[ k ]
+        rst[ i ] = state
+    return np.array( rst, dtype=int ), state
+
+
+def initialState( transitionMatrix, levels, initLevel ):
+    # Index of the initial minimum, default to the lowest level going upwards
+    upMass = np.triu( transitionMatrix, 1 ).sum( axis=1 )
+    if initLevel is None:
+        candidates = np.nonzero( upMass > 0 )[ 0 ]
+        if len( candidates ) == 0:
+            raise ValueError( "transitionMatrix should contain upward transitions" )
+        return int( candidates[ 0 ] )
+    matches = np.nonzero( np.isclose( levels, initLevel ) )[ 0 ]
+    if len( matches ) == 0 or upMass[ matches[ 0 ] ] <= 0:
+        raise ValueError( "initLevel should be a level with upward transitions" )
+    return int( matches[ 0 ] )
+
+
+def checkTransitionRows( transitionMatrix ):
+    # Every level reached by a transition should be able to leave in the other
+    # direction, otherwise the chain gets stuck
+    upMass = np.triu( transitionMatrix, 1 ).sum( axis=1 )
+    downMass = np.tril( transitionMatrix, -1 ).sum( axis=1 )
+    reachedUp = np.triu( transitionMatrix, 1 ).sum( axis=0 ) > 0
+    reachedDown = np.tril( transitionMatrix, -1 ).sum( axis=0 ) > 0
+    if np.any( reachedUp & ( downMass <= 0 ) ) or np.any( reachedDown & ( upMass <= 0 ) ):
+        raise ValueError( "every maximum should move down and every minimum should move up" )
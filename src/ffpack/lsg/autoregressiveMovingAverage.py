@@ -1,9 +1,24 @@
 #!/usr/bin/env python3
 
 import numpy as np
+from scipy import signal
+from ffpack.config import getRng, getSeedSequence
 
 
-def arNormal( numSteps, obs, phis, mu, sigma, randomSeed=None ):
+def _autoregressiveFilter( drive, phis, init ):
+    # Run rst[ i ] = drive[ i ] + sum( phis[ j ] * rst[ i - j - 1 ] ) after init,
+    # values before the start of the sequence are taken as zero, rows of a 2d
+    # drive share the same init
+    init = np.asarray( init, dtype=float )
+    a = np.concatenate( [ [ 1.0 ], -np.asarray( phis, dtype=float ) ] )
+    zi = signal.lfiltic( [ 1.0 ], a, init[ ::-1 ][ : len( a ) - 1 ] )
+    zi = np.broadcast_to( zi, drive.shape[ : -1 ] + zi.shape )
+    rst, _ = signal.lfilter( [ 1.0 ], a, drive, axis=-1, zi=zi )
+    init = np.broadcast_to( init, drive.shape[ : -1 ] + init.shape )
+    return np.concatenate( [ init, rst ], axis=-1 )
+
+
+def arNormal( numSteps, obs, phis, mu, sigma, randomSeed=None, rng=None ):
     '''
     Generate load sequence by an autoregressive model.
 
@@ -22,8 +37,12 @@ def arNormal( numSteps, obs, phis, mu, sigma, randomSeed=None ):
     sigma: scalar
         Standard deviation of the white noise.
     randomSeed: integer, optional
-        Random seed. If randomSeed is none or is not an integer, the random seed in 
-        global config will be used. 
+        Random seed for the global legacy random state. If randomSeed is none or is 
+        not an integer, globalConfig.rng will be used if it is set, otherwise the 
+        global legacy random state. 
+    rng: numpy.random.Generator, optional
+        Random number generator. If rng is given, the random numbers are drawn 
+        from rng and randomSeed is ignored.
     
     Returns
     -------
@@ -54,23 +73,16 @@ def arNormal( numSteps, obs, phis, mu, sigma, randomSeed=None ):
         raise ValueError( "length of obs or phis should be at least 1" )
 
     p = len( obs )
-    if isinstance( randomSeed, ( int, type( None ) ) ):
-        np.random.seed( randomSeed )
-    eps = np.random.normal( mu, sigma, numSteps )
-
-    rst = [ 0 ] * numSteps
-    for i in range( numSteps ):
-        if i < p:
-            rst[ i ] = obs[ i ]
-        else:
-            rst[ i ] += eps[ i ]
-            for j in range( p ):
-                rst[ i ] += phis[ j ] * rst[ i - j - 1]
-    
-    return rst
+    rng = getRng( randomSeed, rng )
+    eps = np.asarray( rng.normal( mu, sigma, numSteps ), dtype=float )
+
+    obs = np.asarray( obs, dtype=float )
+    if numSteps <= p:
+        return obs[ : numSteps ].copy()
+    return _autoregressiveFilter( eps[ p: numSteps ], phis, obs )
 
 
-def maNormal( numSteps, c, thetas, mu, sigma, randomSeed=None ):
+def maNormal( numSteps, c, thetas, mu, sigma, randomSeed=None, rng=None ):
     '''
     Generate load sequence by a moving-average model.
 
@@ -89,8 +101,12 @@ def maNormal( numSteps, c, thetas, mu, sigma, randomSeed=None ):
     sigma: scalar
         Standard deviation of the white noise.
     randomSeed: integer, optional
-        Random seed. If randomSeed is none or is not an integer, the random seed in 
-        global config will be used. 
+        Random seed for the global legacy random state. If randomSeed is none or is 
+        not an integer, globalConfig.rng will be used if it is set, otherwise the 
+        global legacy random state. 
+    rng: numpy.random.Generator, optional
+        Random number generator. If rng is given, the random numbers are drawn 
+        from rng and randomSeed is ignored.
     
     Returns
     -------
@@ -120,23 +136,14 @@ def maNormal( numSteps, c, thetas, mu, sigma, randomSeed=None ):
     if len( thetas ) < 1:
         raise ValueError( "length of coefficients for the white noise should be at least 1" )
 
-    if isinstance( randomSeed, ( int, type( None ) ) ):
-        np.random.seed( randomSeed )
-    eps = np.random.normal( mu, sigma, numSteps )
-
-    rst = [ 0 ] * numSteps
-    q = len( thetas )
-    for i in range( numSteps ):
-        ept = eps[ i ]
-        for j in range( q ):
-            if ( i > j ): 
-                ept += thetas[ j ] * eps[ i - j - 1 ]
-        rst[ i ] = c + ept
-    
-    return rst
+    rng = getRng( randomSeed, rng )
+    eps = np.asarray( rng.normal( mu, sigma, numSteps ), dtype=float )
 
+    b = np.concatenate( [ [ 1.0 ], np.asarray( thetas, dtype=float ) ] )
+    return c + signal.lfilter( b, [ 1.0 ], eps[ : numSteps ] )
 
-def armaNormal( numSteps, obs, phis, thetas, mu, sigma, randomSeed=None ):
+
+def armaNormal( numSteps, obs, phis, thetas, mu, sigma, randomSeed=None, rng=None ):
     '''
     Generate load sequence by an autoregressive-moving-average model.
 
@@ -157,8 +164,12 @@ def armaNormal( numSteps, obs, phis, thetas, mu, sigma, randomSeed=None ):
     sigma: scalar
         Standard deviation of the white noise.
     randomSeed: integer, optional
-        Random seed. If randomSeed is none or is not an integer, the random seed in 
-        global config will be used. 
+        Random seed for the global legacy random state. If randomSeed is none or is 
+        not an integer, globalConfig.rng will be used if it is set, otherwise the 
+        global legacy random state. 
+    rng: numpy.random.Generator, optional
+        Random number generator. If rng is given, the random numbers are drawn 
+        from rng and randomSeed is ignored.
     
     Returns
     -------
@@ -190,35 +201,117 @@ def armaNormal( numSteps, obs, phis, thetas, mu, sigma, randomSeed=None ):
     if len( thetas ) < 1:
         raise ValueError( "length of coefficients for the white noise should be at least 1" )
 
-    p = len( phis )
-    q = len( thetas )
     n = len( obs )
-    if isinstance( randomSeed, ( int, type( None ) ) ):
-        np.random.seed( randomSeed )
-    eps = np.random.normal( mu, sigma, numSteps )
-
-    rst = [ 0 ] * numSteps
-    if ( n > 0 ):
-        for i in range( min( n, numSteps ) ):
-            rst[ i ] = obs[ i ]
+    rng = getRng( randomSeed, rng )
+    eps = np.asarray( rng.normal( mu, sigma, numSteps ), dtype=float )
+
+    obs = np.asarray( obs, dtype=float )
+    if numSteps <= n:
+        return obs[ : numSteps ].copy()
+    b = np.concatenate( [ [ 1.0 ], np.asarray( thetas, dtype=float ) ] )
+    drive = signal.lfilter( b, [ 1.0 ], eps[ : numSteps ] )
+    return _autoregressiveFilter( drive[ n: ], phis, obs )
+
+
+def armaNormalBatch( nRealizations, numSteps, obs, phis, thetas, mu, sigma, 
+                     randomSeed=None, chunkSize=None, rng=None ):
+    '''
+    Generate multiple independent load sequences by an autoregressive-moving-average 
+    model.
+
+    The white noise is generated by the normal distribution. Each realization draws
+    from its own stream spawned by np.random.SeedSequence, so the results only 
+    depend on the randomSeed and are not affected by the chunkSize.
+
+    Parameters
+    ----------
+    nRealizations: integer
+        Number of realizations for generating.
+    numSteps: integer 
+        Number of steps for generating.
+    obs: 1d array
+        Initial observed values, could be empty.
+    phis: 1d array
+        Coefficients for the autoregressive part.
+    thetas: 1d array
+        Coefficients for the white noise for the moving-average part.
+    mu: scalar
+        Mean of the white noise.
+    sigma: scalar
+        Standard deviation of the white noise.
+    randomSeed: integer, optional
+        Random seed for the root np.random.SeedSequence. If randomSeed is none or is 
+        not an integer, the root seed sequence is drawn from globalConfig.rng if it 
+        is set, otherwise from fresh entropy from the operating system. 
+    chunkSize: integer, optional
+        Number of realizations generated at the same time to bound the memory of 
+        the intermediate noise. If chunkSize is none, all realizations are 
+        generated at the same time.
+    rng: numpy.random.Generator, optional
+        Random number generator. If rng is given, the root seed sequence is drawn 
+        from rng and randomSeed is ignored.
     
-    for i in range( n, numSteps ):
-        epa = 0
-        for j in range( p ):
-            if ( i > j ): 
-                epa += phis[ j ] * rst[ i - j - 1 ]
-        
-        epm = 0
-        for j in range( q ):
-            if ( i > j ): 
-                epm += thetas[ j ] * eps[ i - j - 1 ]
-        
-        rst[ i ] = eps[ i ] + epa + epm 
+    Returns
+    -------
+    rst: 2d array
+        Generated sequences with shape ( nRealizations, numSteps ), each row 
+        includes the observed values.
+    
+    Raises
+    ------
+    ValueError
+        If the nRealizations is less than 1.
+        If the numSteps is less than 1.
+        If the phis is empty.
+        If the thetas is empty.
+        If the chunkSize is less than 1.
+
+    Examples
+    --------
+    >>> from ffpack.lsg import armaNormalBatch
+    >>> obs = [ 0, 1 ]
+    >>> phis = [ 0.5, 0.3 ]
+    >>> thetas = [ 0.8, 0.5 ]
+    >>> rst = armaNormalBatch( 100, 500, obs, phis, thetas, 0, 0.5, randomSeed=2023 )
+    '''
+    # Edge case check
+    if not isinstance( nRealizations, int ):
+        raise ValueError( "nRealizations should be int" )
+    if nRealizations < 1:
+        raise ValueError( "nRealizations should be at least 1" )
+    if not isinstance( numSteps, int ):
+        raise ValueError( "numSteps should be int" )
+    if numSteps < 1:
+        raise ValueError( "numSteps should be at least 1" )
+    if len( phis ) < 1:
+        raise ValueError( "length of phis should be at least 1" )
+    if len( thetas ) < 1:
+        raise ValueError( "length of coefficients for the white noise should be at least 1" )
+    if chunkSize is None:
+        chunkSize = nRealizations
+    if not isinstance( chunkSize, int ) or chunkSize < 1:
+        raise ValueError( "chunkSize should be an int and at least 1" )
+
+    obs = np.asarray( obs, dtype=float )
+    n = len( obs )
+    b = np.concatenate( [ [ 1.0 ], np.asarray( thetas, dtype=float ) ] )
+    streams = getSeedSequence( randomSeed, rng ).spawn( nRealizations )
+
+    rst = np.empty( ( nRealizations, numSteps ) )
+    for start in range( 0, nRealizations, chunkSize ):
+        stop = min( start + chunkSize, nRealizations )
+        eps = np.stack( [ np.random.default_rng( stream ).normal( mu, sigma, numSteps ) 
+                          for stream in streams[ start: stop ] ] )
+        if numSteps <= n:
+            rst[ start: stop ] = obs[ : numSteps ]
+            continue
+        drive = signal.lfilter( b, [ 1.0 ], eps, axis=1 )
+        rst[ start: stop ] = _autoregressiveFilter( drive[ :, n: ], phis, obs )
 
     return rst
 
 
-def arimaNormal( numSteps, c, phis, thetas, mu, sigma, randomSeed=None ):
+def arimaNormal( numSteps, c, phis, thetas, mu, sigma, randomSeed=None, rng=None ):
     '''
     Generate load sequence by an autoregressive integrated moving average model.
 
@@ -241,8 +334,12 @@ def arimaNormal( numSteps, c, phis, thetas, mu, sigma, randomSeed=None ):
     sigma: scalar
         Standard deviation of the white noise.
     randomSeed: integer, optional
-        Random seed. If randomSeed is none or is not an integer, the random seed in 
-        global config will be used. 
+        Random seed for the global legacy random state. If randomSeed is none or is 
+        not an integer, globalConfig.rng will be used if it is set, otherwise the 
+        global legacy random state. 
+    rng: numpy.random.Generator, optional
+        Random number generator. If rng is given, the random numbers are drawn 
+        from rng and randomSeed is ignored.
         
     Returns
     -------
@@ -277,24 +374,24 @@ def arimaNormal( numSteps, c, phis, thetas, mu, sigma, randomSeed=None ):
         raise ValueError( "length of coefficients for the white noise should be at least 1" )
 
     p = len( phis )
-    q = len( thetas )
-    if isinstance( randomSeed, ( int, type( None ) ) ):
-        np.random.seed( randomSeed )
-    eps = np.random.normal( mu, sigma, numSteps )
-
-    rst = [ 0 ] * numSteps
-    
-    for i in range( numSteps ):
-        epa = 0
-        for j in range( p ):
-            if ( i > j + 1 ): 
-                epa += phis[ j ] * ( rst[ i - j - 1 ] - rst[ i - j - 2 ] )
-        
-        epm = 0
-        for j in range( q ):
-            if ( i > j ): 
-                epm += thetas[ j ] * eps[ i - j - 1 ]
-        
-        rst[ i ] = c + eps[ i ] + epa + epm 
-
-    return rst
+    rng = getRng( randomSeed, rng )
+    eps = np.asarray( rng.normal( mu, sigma, numSteps ), dtype=float )
+
+    phis = np.asarray( phis, dtype=float )
+    b = np.concatenate( [ [ 1.0 ], np.asarray( thetas, dtype=float ) ] )
+    drive = c + signal.lfilter( b, [ 1.0 ], eps[ : numSteps ] )
+
+    # Differences are only used once both points exist, so the first p + 1 
+    # points are generated directly
+    m = min( p + 1, numSteps )
+    rst = np.zeros( numSteps )
+    for i in range( m ):
+        rst[ i ] = drive[ i ]
+        for j in range( i - 1 ):
+            rst[ i ] += phis[ j ] * ( rst[ i - j - 1 ] - rst[ i - j - 2 ] )
+    if numSteps == m:
+        return rst
+
+    # The first-order difference turns the AR( p ) part into an AR( p + 1 ) filter
+    diffPhis = np.concatenate( [ phis, [ 0.0 ] ] ) - np.concatenate( [ [ 0.0 ], phis ] )
+    return _autoregressiveFilter( drive[ m: ], diffPhis, rst[ : m ] )
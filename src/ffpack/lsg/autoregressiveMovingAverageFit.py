@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+
+'''
+Fit autoregressive and autoregressive-moving-average models to measured load
+records. The fitted coefficients follow the conventions of arNormal and
+armaNormal, i.e., rst[ i ] = eps[ i ] + sum( phis[ j ] * rst[ i - j - 1 ] )
++ sum( thetas[ j ] * eps[ i - j - 1 ] ) with eps drawn from N( mu, sigma ),
+so they can be passed to the generators directly.
+'''
+
+import numpy as np
+from scipy import signal
+from scipy.fft import next_fast_len
+
+
+def _checkFitInput( data, minLength ):
+    # Check the data is a 1d array with enough points
+    data = np.array( data, dtype=float )
+    if len( data.shape ) != 1:
+        raise ValueError( "data dimension should be 1" )
+    if data.shape[ 0 ] < minLength:
+        raise ValueError( "data length should be at least {}".format( minLength ) )
+    return data
+
+
+def _checkCriterion( criterion ):
+    if criterion not in [ "aic", "bic", None ]:
+        raise ValueError( "criterion should be aic, bic, or None" )
+
+
+def _informationCriterion( criterion, sigma2, numParams, n ):
+    # Information criterion from the innovation variance, smaller is better
+    if criterion == "aic":
+        return n * np.log( sigma2 ) + 2 * numParams
+    return n * np.log( sigma2 ) + numParams * np.log( n )
+
+
+def _autocovariance( data, maxLag ):
+    # Biased autocovariance of the demeaned data up to maxLag computed with FFT
+    n = len( data )
+    nfft = next_fast_len( 2 * n - 1 )
+    spectrum = np.fft.rfft( data - np.mean( data ), nfft )
+    return np.fft.irfft( np.abs( spectrum ) ** 2, nfft )[ : maxLag + 1 ] / n
+
+
+def _levinsonDurbin( acov, maxOrder ):
+    # Solve the Yule-Walker equations of all orders up to maxOrder, returns the
+    # coefficients and the innovation variance of each order
+    phis = np.zeros( 0 )
+    sigma2 = acov[ 0 ]
+    allPhis = [ ]
+    allSigma2 = np.zeros( maxOrder )
+    for k in range( 1, maxOrder + 1 ):
+        kappa = ( acov[ k ] - phis @ acov[ k - 1: 0: -1 ] ) / sigma2
+        phis = np.append( phis - kappa * phis[ :: -1 ], kappa )
+        sigma2 *= 1 - kappa ** 2
+        allPhis.append( phis )
+        allSigma2[ k - 1 ] = sigma2
+    return allPhis, allSigma2
+
+
+def arLevinsonDurbinFit( data, maxOrder, criterion="aic" ):
+    '''
+    Fit an autoregressive model to the data with the Levinson-Durbin recursion.
+
+    The autocovariances are computed with FFT, and the recursion fits all the
+    orders from 1 to maxOrder at once, so the cost is O( n log n + maxOrder^2 ).
+
+    Parameters
+    ----------
+    data: 1d array
+        Measured load record.
+    maxOrder: integer
+        Maximum order of the autoregressive model.
+    criterion: string, optional
+        "aic" or "bic" to select the order with the smallest information criterion,
+        or None to use maxOrder.
+
+    Returns
+    -------
+    phis: 1d array
+        Coefficients for the autoregressive model.
+    mu: scalar
+        Mean of the white noise.
+    sigma: scalar
+        Standard deviation of the white noise.
+
+    Raises
+    ------
+    ValueError
+        If the data is not a 1d array.
+        If the maxOrder is not an integer or is less than 1.
+        If the data length is not larger than 2 * maxOrder.
+        If the criterion is not aic, bic, or None.
+        If the data is constant.
+
+    Examples
+    --------
+    >>> from ffpack.lsg import arNormal, arLevinsonDurbinFit
+    >>> data = arNormal( 10000, [ 0, 1 ], [ 0.5, 0.3 ], 0, 0.5 )
+    >>> phis, mu, sigma = arLevinsonDurbinFit( data, 10 )
+    >>> rst = arNormal( 500, data[ -len( phis ) : ], phis, mu, sigma )
+    '''
+    # Edge case check
+    if not isinstance( maxOrder, int ) or maxOrder < 1:
+        raise ValueError( "maxOrder should be an int and at least 1" )
+    data = _checkFitInput( data, 2 * maxOrder + 1 )
+    _checkCriterion( criterion )
+
+    acov = _autocovariance( data, maxOrder )
+    if acov[ 0 ] <= 0:
+        raise ValueError( "data should not be constant" )
+    allPhis, allSigma2 = _levinsonDurbin( acov, maxOrder )
+
+    order = maxOrder
+    if criterion is not None:
+        orders = np.arange( 1, maxOrder + 1 )
+        order = orders[ np.argmin( _informationCriterion( criterion, allSigma2, orders,
+                                                          len( data ) ) ) ]
+    phis = allPhis[ order - 1 ]
+    mu = np.mean( data ) * ( 1 - np.sum( phis ) )
+    return phis, mu, np.sqrt( allSigma2[ order - 1 ] )
+
+
+def armaHannanRissanenFit( data, maxP, maxQ, criterion="aic", arOrder=None ):
+    '''
+    Fit an autoregressive-moving-average model to the data with the
+    Hannan-Rissanen algorithm [Hannan1982]_.
+
+    A long autoregressive model fitted by arLevinsonDurbinFit gives the estimated
+    innovations. The data is then regressed on its own lags and the lagged
+    innovations. The normal equations are assembled once for maxP and maxQ, and
+    every candidate order ( p, q ) with 1 <= p <= maxP and 1 <= q <= maxQ is
+    solved from a sub-block of them.
+
+    Parameters
+    ----------
+    data: 1d array
+        Measured load record.
+    maxP: integer
+        Maximum order of the autoregressive part.
+    maxQ: integer
+        Maximum order of the moving-average part.
+    criterion: string, optional
+        "aic" or "bic" to select the orders with the smallest information
+        criterion, or None to use maxP and maxQ.
+    arOrder: integer, optional
+        Order of the long autoregressive model. Default to
+        max( maxP + maxQ, 10 * log10( n ) ) where n is the data length.
+
+    Returns
+    -------
+    phis: 1d array
+        Coefficients for the autoregressive part.
+    thetas: 1d array
+        Coefficients for the white noise for the moving-average part.
+    mu: scalar
+        Mean of the white noise.
+    sigma: scalar
+        Standard deviation of the white noise.
+
+    Raises
+    ------
+    ValueError
+        If the data is not a 1d array.
+        If the maxP, maxQ, or arOrder is not an integer or is less than 1.
+        If the data is too short for the arOrder, maxP and maxQ.
+        If the criterion is not aic, bic, or None.
+        If the data is constant.
+
+    Examples
+    --------
+    >>> from ffpack.lsg import armaNormal, armaHannanRissanenFit
+    >>> data = armaNormal( 10000, [ ], [ 0.5 ], [ 0.4 ], 0, 0.5 )
+    >>> phis, thetas, mu, sigma = armaHannanRissanenFit( data, 3, 3 )
+    >>> rst = armaNormal( 500, [ ], phis, thetas, mu, sigma )
+
+    References
+    ----------
+    .. [Hannan1982] Hannan, E.J. and Rissanen, J., 1982. Recursive estimation of
+       mixed autoregressive-moving average order. Biometrika, 69(1), pp.81-94.
+    '''
+    # Edge case check
+    if not isinstance( maxP, int ) or maxP < 1:
+        raise ValueError( "maxP should be an int and at least 1" )
+    if not isinstance( maxQ, int ) or maxQ < 1:
+        raise ValueError( "maxQ should be an int and at least 1" )
+    _checkCriterion( criterion )
+    data = _checkFitInput( data, 1 )
+    n = len( data )
+    if arOrder is None:
+        arOrder = max( maxP + maxQ, int( np.ceil( 10 * np.log10( n ) ) ) )
+    if not isinstance( arOrder, int ) or arOrder < 1:
+        raise ValueError( "arOrder should be an int and at least 1" )
+    start = arOrder + max( maxP, maxQ )
+    if n <= max( start + maxP + maxQ, 2 * arOrder ):
+        raise ValueError( "data length is too short for arOrder, maxP and maxQ" )
+
+    # Estimate the innovations with a long autoregressive model
+    mean = np.mean( data )
+    centered = data - mean
+    longPhis, _, _ = arLevinsonDurbinFit( centered, arOrder, criterion=None )
+    residuals = signal.lfilter( np.append( 1.0, -longPhis ), [ 1.0 ], centered )
+
+    # Normal equations with all lags on a common sample
+    lags = [ centered[ start - j: n - j ] for j in range( 1, maxP + 1 ) ] + \
+           [ residuals[ start - j: n - j ] for j in range( 1, maxQ + 1 ) ]
+    design = np.stack( lags, axis=1 )
+    target = centered[ start: ]
+    gram = design.T @ design
+    moment = design.T @ target
+    energy = target @ target
+    numObs = len( target )
+
+    candidates = [ ( maxP, maxQ ) ]
+    if criterion is not None:
+        candidates = [ ( p, q ) for p in range( 1, maxP + 1 )
+                       for q in range( 1, maxQ + 1 ) ]
+    best = None
+    for p, q in candidates:
+        cols = np.r_[ 0: p, maxP: maxP + q ]
+        coefs = np.linalg.lstsq( gram[ np.ix_( cols, cols ) ], moment[ cols ],
+                                 rcond=None )[ 0 ]
+        sigma2 = max( ( energy - coefs @ moment[ cols ] ) / numObs,
+                      np.finfo( float ).tiny )
+        score = 0.0 if criterion is None else \
+            _informationCriterion( criterion, sigma2, p + q, numObs )
+        if best is None or score < best[ 0 ]:
+            best = ( score, coefs[ : p ], coefs[ p: ], sigma2 )
+
+    _, phis, thetas, sigma2 = best
+    mu = mean * ( 1 - np.sum( phis ) ) / ( 1 + np.sum( thetas ) )
+    return phis, thetas, mu, np.sqrt( sigma2 )
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+
+'''
+Regenerate turning-point sequences from a counting matrix with a Markov chain.
+The turning points alternate between minima and maxima: a minimum moves up to a
+higher level and a maximum moves down to a lower level, so each sequence has
+the same from-to transition content as the counting matrix.
+'''
+
+import numpy as np
+from ffpack.config import getRng
+from ._common import checkTransitionInput, markovTables, markovTurningPointIndices
+from ._common import initialState, checkTransitionRows
+
+
+def countingMatrixToTransitionMatrix( countingMatrix, matrixIndexKey ):
+    '''
+    Convert a cycle counting matrix to a Markov transition matrix between the
+    turning points.
+
+    Each cycle from level a to level b contributes the transitions a to b and
+    b to a, so the counts are symmetrized before normalizing. The upper triangle
+    of the transition matrix holds the probabilities for a minimum to move up,
+    and the lower triangle holds the probabilities for a maximum to move down.
+    The cycles with zero range on the diagonal are ignored.
+
+    Parameters
+    ----------
+    countingMatrix: 2d array
+        Counting matrix, e.g., from the counting matrix functions in ffpack.lsm.
+    matrixIndexKey: 1d array
+        Index keys for the counting matrix, either strings or scalars.
+
+    Returns
+    -------
+    transitionMatrix: 2d array
+        A matrix where transitionMatrix[ i ][ j ] for j > i is the probability
+        to move up from the minimum levels[ i ] to the maximum levels[ j ], and
+        for j < i is the probability to move down from the maximum levels[ i ]
+        to the minimum levels[ j ]. The upper and lower parts of each row sum to
+        1 or 0.
+    levels: 1d array
+        Sorted levels of the turning points.
+
+    Raises
+    ------
+    ValueError
+        If the countingMatrix is not a square matrix.
+        If the length of matrixIndexKey does not match the countingMatrix.
+        If the countingMatrix contains negative elements.
+        If the countingMatrix has no cycles with nonzero range.
+
+    Examples
+    --------
+    >>> from ffpack.lsm import astmRainflowCountingMatrix
+    >>> from ffpack.lsg import countingMatrixToTransitionMatrix
+    >>> data = [ -2.0, 1.0, -3.0, 5.0, -1.0, 3.0, -4.0, 4.0, -2.0 ]
+    >>> rst, matrixIndexKey = astmRainflowCountingMatrix( data )
+    >>> transitionMatrix, levels = countingMatrixToTransitionMatrix( rst, matrixIndexKey )
+    '''
+    countingMatrix = np.array( countingMatrix, dtype=float )
+    if len( countingMatrix.shape ) != 2 or \
+       countingMatrix.shape[ 0 ] != countingMatrix.shape[ 1 ]:
+        raise ValueError( "countingMatrix should be a square matrix" )
+    if len( matrixIndexKey ) != countingMatrix.shape[ 0 ]:
+        raise ValueError( "length of matrixIndexKey should match countingMatrix" )
+    if np.any( countingMatrix < 0 ):
+        raise ValueError( "countingMatrix should not contain negative elements" )
+
+    levels = np.array( [ float( str( key ).replace( ",", "" ) )
+                         for key in matrixIndexKey ] )
+    order = np.argsort( levels )
+    levels = levels[ order ]
+    counts = countingMatrix[ np.ix_( order, order ) ]
+    counts = counts + counts.T
+    np.fill_diagonal( counts, 0.0 )
+    if not np.any( counts > 0 ):
+        raise ValueError( "countingMatrix should contain cycles with nonzero range" )
+
+    up = np.triu( counts, 1 )
+    down = np.tril( counts, -1 )
+    upSum = up.sum( axis=1, keepdims=True )
+    downSum = down.sum( axis=1, keepdims=True )
+    transitionMatrix = np.divide( up, upSum, out=np.zeros_like( up ), where=upSum > 0 ) + \
+        np.divide( down, downSum, out=np.zeros_like( down ), where=downSum > 0 )
+    return transitionMatrix, levels
+
+
+def markovChainTurningPoints( numPoints, transitionMatrix, levels, initLevel=None,
+                              randomSeed=None, rng=None ):
+    '''
+    Generate a turning-point sequence by a Markov chain between the levels.
+
+    The sequence starts with a minimum and alternates between minima and maxima.
+    The next level is drawn with the alias method from one uniform random number
+    per turning point, and the random numbers are drawn in blocks, so 10^7
+    turning points take a few seconds.
+
+    Parameters
+    ----------
+    numPoints: integer
+        Number of turning points to generate.
+    transitionMatrix: 2d array
+        Transition matrix between the levels, e.g., from
+        countingMatrixToTransitionMatrix. Entries above the diagonal are the
+        upward weights from a minimum, and entries below the diagonal are the
+        downward weights from a maximum. Each part is normalized by row.
+    levels: 1d array
+        Levels of the turning points.
+    initLevel: scalar, optional
+        Level of the first turning point, which is a minimum. Default to the
+        lowest level with upward transitions.
+    randomSeed: integer, optional
+        Random seed for the global legacy random state. If randomSeed is none or is
+        not an integer, globalConfig.rng will be used if it is set, otherwise the
+        global legacy random state.
+    rng: numpy.random.Generator, optional
+        Random number generator. If rng is given, the random numbers are drawn
+        from rng and randomSeed is ignored.
+
+    Returns
+    -------
+    rst: 1d array
+        Generated turning-point sequence.
+
+    Raises
+    ------
+    ValueError
+        If the numPoints is not an integer or is less than 1.
+        If the levels is not a 1d array with at least 2 elements.
+        If the transitionMatrix is not a square matrix matching the levels.
+        If the transitionMatrix contains negative elements.
+        If a level reached by an upward ( downward ) transition cannot move
+        down ( up ).
+        If the initLevel is not a level with upward transitions.
+
+    Examples
+    --------
+    >>> from ffpack.lsm import astmRainflowCountingMatrix
+    >>> from ffpack.lsg import countingMatrixToTransitionMatrix, markovChainTurningPoints
+    >>> data = [ -2.0, 1.0, -3.0, 5.0, -1.0, 3.0, -4.0, 4.0, -2.0 ]
+    >>> rst, matrixIndexKey = astmRainflowCountingMatrix( data )
+    >>> transitionMatrix, levels = countingMatrixToTransitionMatrix( rst, matrixIndexKey )
+    >>> rst = markovChainTurningPoints( 1000, transitionMatrix, levels )
+    '''
+    # Edge case check
+    if not isinstance( numPoints, int ) or numPoints < 1:
+        raise ValueError( "numPoints should be an int and at least 1" )
+    transitionMatrix, levels = checkTransitionInput( transitionMatrix, levels )
+    checkTransitionRows( transitionMatrix )
+    state = initialState( transitionMatrix, levels, initLevel )
+
+    rng = getRng( randomSeed, rng )
+    accept, alias = markovTables( transitionMatrix )
+    rst = np.empty( numPoints, dtype=int )
+    rst[ 0 ] = state
+    blockSize = 65536
+    for start in range( 1, numPoints, blockSize ):
+        end = min( start + blockSize, numPoints )
+        # The point at start - 1 is a minimum if start - 1 is even
+        rst[ start: end ], state = markovTurningPointIndices(
+            state, ( start - 1 ) % 2 == 0, rng.random( end - start ),
+            accept, alias, len( levels ) )
+    return levels[ rst ]
@@ -1,9 +1,11 @@
 #!/usr/bin/env python3
 
 import numpy as np
+from ffpack.config import getRng
+from ._common import randomWalkSteps
 
 
-def randomWalkUniform( numSteps, dim=1, randomSeed=None ):
+def randomWalkUniform( numSteps, dim=1, randomSeed=None, numWalks=None, rng=None ):
     '''
     Generate load sequence by a random walk.
 
@@ -14,24 +16,34 @@ def randomWalkUniform( numSteps, dim=1, randomSeed=None ):
     dim: scalar, optional
         Data dimension.
     randomSeed: integer, optional
-        Random seed. If randomSeed is none or is not an integer, the random seed in 
-        global config will be used. 
+        Random seed for the global legacy random state. If randomSeed is none or is 
+        not an integer, globalConfig.rng will be used if it is set, otherwise the 
+        global legacy random state. 
+    numWalks: integer, optional
+        Number of independent walks generated at the same time. If numWalks is 
+        none, a single walk is generated.
+    rng: numpy.random.Generator, optional
+        Random number generator. If rng is given, the random numbers are drawn 
+        from rng and randomSeed is ignored.
     
     Returns
     -------
-    rst: 2d array
-        A 2d (numSteps by dim) matrix holding the coordinates 
-        of the position at each step.
+    rst: 2d or 3d array
+        A 2d ( numSteps + 1 by dim ) integer matrix holding the coordinates 
+        of the position at each step, starting from the origin. If numWalks is 
+        given, a 3d ( numWalks by numSteps + 1 by dim ) array is returned.
     
     Raises
     ------
     ValueError
         If the numSteps is less than 1 or the dim is less than 1.
+        If the numWalks is less than 1.
 
     Examples
     --------
     >>> from ffpack.lsg import randomWalkUniform
     >>> rst = randomWalkUniform( 5 )
+    >>> rst = randomWalkUniform( 5, dim=2, numWalks=100 )
 
     '''
     # Edge case check
@@ -41,16 +53,14 @@ def randomWalkUniform( numSteps, dim=1, randomSeed=None ):
         raise ValueError( "numSteps should be at least 1" )
     if dim < 1:
         raise ValueError( "dim should be at least 1" )
+    if numWalks is not None and ( not isinstance( numWalks, int ) or numWalks < 1 ):
+        raise ValueError( "numWalks should be an int and at least 1" )
 
-    if isinstance( randomSeed, ( int, type( None ) ) ):
-        np.random.seed( randomSeed )
+    rng = getRng( randomSeed, rng )
+    randint = rng.integers if isinstance( rng, np.random.Generator ) else rng.randint
     
-    rst = [ [ 0 ] * dim ]
-    for i in range( numSteps ):
-        randomInt = np.random.randint( 2 * dim )
-        randomDim = randomInt % dim
-        randomDir = 1 if randomInt >= dim else -1
-        lastCoords = np.copy( rst[ -1 ] )
-        lastCoords[ randomDim ] += randomDir
-        rst.append( lastCoords.tolist() )
+    shape = ( numSteps, ) if numWalks is None else ( numWalks, numSteps )
+    steps = randomWalkSteps( randint( 2 * dim, size=shape ), dim )
+    rst = np.zeros( shape[ : -1 ] + ( numSteps + 1, dim ), dtype=int )
+    np.cumsum( steps, axis=-2, out=rst[ ..., 1:, : ] )
     return rst
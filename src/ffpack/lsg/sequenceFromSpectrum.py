@@ -1,9 +1,32 @@
 #!/usr/bin/env python3
 
 import numpy as np
+from ffpack.config import getRng
+from ._common import checkFreqInput, checkSpectrumInput, spectralSynthesisDirect
 
 
-def spectralRepresentation( fs, time, freq, psd, freqBandwidth=None, randomSeed=None ):
+def _spectralSynthesisFft( n, fs, f0, df, amplitudes ):
+    # Take the imaginary part of sum( amplitudes[ k ] * exp( 2j * pi * ( f0 + k * df ) * t ) )
+    # on n samples with one inverse FFT over a period of fs / df samples, which is 
+    # tiled for longer records. Trailing dimensions of amplitudes are channels.
+    period = round( fs / df )
+    idx = np.arange( amplitudes.shape[ 0 ] )
+    shift = f0 / df
+    modulate = abs( shift - round( shift ) ) > 1e-8
+    if not modulate:
+        idx = idx + round( shift )
+    spectrum = np.zeros( ( period, ) + amplitudes.shape[ 1: ], dtype=complex )
+    np.add.at( spectrum, idx % period, amplitudes )
+    rst = np.take( period * np.fft.ifft( spectrum, axis=0 ), np.arange( n ) % period, 
+                   axis=0 )
+    if modulate:
+        modulation = np.exp( 2j * np.pi * f0 / fs * np.arange( n ) )
+        rst *= modulation.reshape( ( n, ) + ( 1, ) * ( rst.ndim - 1 ) )
+    return rst.imag
+
+
+def spectralRepresentation( fs, time, freq, psd, freqBandwidth=None, randomSeed=None, 
+                            method="direct", blockSize=4096, numWorkers=1, rng=None ):
     '''
     Generate a sequence from a given power spectrum density with spectral
     representation method.
@@ -16,15 +39,37 @@ def spectralRepresentation( fs, time, freq, psd, freqBandwidth=None, randomSeed=
         Total sampling time.
     freq: 1darray
         Frequency array for psd.
-        The freq array should be in equally spaced increasing. 
+        The freq array should be strictly increasing. It can be unequally spaced
+        for the "direct" method, and then each frequency takes the bandwidth
+        between the midpoints to its neighbors, except the first and the last
+        frequencies, which take the full spacing to their only neighbor rather
+        than half of it.
     psd: 1darray
         Power spectrum density array. 
     freqBandwidth: scalar, optional
         Frequency bandwidth used to generate the time series from psd.
-        Default to None, every frequency in freq will be used. 
+        Default to None, every frequency in freq will be used. It should be None
+        if freq is unequally spaced.
     randomSeed: integer, optional
-        Random seed. If randomSeed is none or is not an integer, the random seed in 
-        global config will be used. 
+        Random seed for the global legacy random state. If randomSeed is none or is 
+        not an integer, globalConfig.rng will be used if it is set, otherwise the 
+        global legacy random state. 
+    method: string, optional
+        "direct" sums the harmonics in the time domain. "fft" builds the complex 
+        amplitude spectrum and synthesizes one period of fs / df samples with an 
+        inverse FFT, where df is the spacing of the used frequencies, and tiles 
+        the period for longer records. Both methods give the same sequence up to 
+        floating-point precision.
+    blockSize: integer, optional
+        Number of time steps synthesized together by the "direct" method. The 
+        peak memory of each worker is proportional to blockSize times the number 
+        of used frequencies.
+    numWorkers: integer, optional
+        Number of workers synthesizing the time blocks in parallel for the 
+        "direct" method.
+    rng: numpy.random.Generator, optional
+        Random number generator. If rng is given, the random numbers are drawn 
+        from rng and randomSeed is ignored.
     
     Returns
     -------
@@ -41,7 +86,12 @@ def spectralRepresentation( fs, time, freq, psd, freqBandwidth=None, randomSeed=
         If freq or psd is not a 1darray or has less than 3 elements.
         If freq and psd are in different lengths.
         If freq contains negative elements.
-        If freq is not equally spaced increasing. 
+        If freq is not strictly increasing.
+        If freq is not equally spaced increasing for the "fft" method.
+        If freqBandwidth is given for unequally spaced freq.
+        If method is not "direct" or "fft".
+        If fs is not an integer multiple of df for the "fft" method.
+        If blockSize or numWorkers is less than 1.
 
     Examples
     --------
@@ -51,6 +101,10 @@ def spectralRepresentation( fs, time, freq, psd, freqBandwidth=None, randomSeed=
     >>> freq = [ 0, 0.1, 0.2, 0.3, 0.4, 0.5 ]
     >>> psd = [ 0.01, 2, 0.05, 0.04, 0.01, 0.03 ]
     >>> ts, amps = spectralRepresentation( fs, time, freq, psd, freqBandwidth=None )
+    >>> ts, amps = spectralRepresentation( fs, time, freq, psd, method="fft" )
+    >>> freq = [ 0, 0.1, 0.15, 0.3, 0.7 ]
+    >>> psd = [ 0.01, 2, 1.5, 0.04, 0.01 ]
+    >>> ts, amps = spectralRepresentation( fs, time, freq, psd )
     '''
     # edge case check for fs and time
     if not isinstance( fs, int ) and not isinstance( fs, float ):
@@ -62,58 +116,313 @@ def spectralRepresentation( fs, time, freq, psd, freqBandwidth=None, randomSeed=
     if time <= 0:
         raise ValueError( "time should be positive" )
     
-    # edge case check for freq
-    freq = np.array( freq, dtype=float )
-    if len( freq.shape ) != 1:
-        raise ValueError( "freq dimension should be 1" )
-    if freq.shape[ 0 ] < 3:
-        raise ValueError( "freq length should be at least 3" )
-    if freq[ 0 ] < 0 or freq[ 1 ] < 0:
-        raise ValueError( "freq array should be non-negative" )
-    if freq[ 1 ] <= freq[ 0 ]:
-        raise ValueError( "freq array should be strictly increasing" )
-    diff = freq[ 1 ] - freq[ 0 ]
-    tolerance = np.power( 10.0, -4 )
-    for i in range( 1, len( freq ) ):
-        if abs( freq[ i ] - freq[ i - 1 ] - diff ) > tolerance:
-            raise ValueError( "freq array should be equally spaced increasing" )
+    # edge case check for method
+    if method not in [ "direct", "fft" ]:
+        raise ValueError( "method should be direct or fft" )
+
+    freq, psd, freqBandwidth, next = checkSpectrumInput( freq, psd, freqBandwidth,
+                                                         equallySpaced=method == "fft" )
+    df = next * ( freq[ 1 ] - freq[ 0 ] )
+    if method == "fft" and abs( fs / df - round( fs / df ) ) > 1e-6 * fs / df:
+        raise ValueError( "fs should be an integer multiple of the frequency spacing "
+                          "for fft method" )
+    if not isinstance( blockSize, int ) or blockSize < 1:
+        raise ValueError( "blockSize should be an integer larger than 0" )
+    if not isinstance( numWorkers, int ) or numWorkers < 1:
+        raise ValueError( "numWorkers should be an integer larger than 0" )
+
+    n = round( fs * time )
+    ts = 1 / fs * np.arange( n, dtype=float )
+
+    # generate phase angle
+    rng = getRng( randomSeed, rng )
+    phis = -np.pi + 2 * np.pi * rng.standard_normal( len( freq ) )
+
+    coefs = np.sqrt( 2 * psd[ :: next ] * freqBandwidth )
+    if method == "fft":
+        amps = _spectralSynthesisFft( n, fs, freq[ 0 ], df, 
+                                      coefs * np.exp( 1j * phis[ :: next ] ) )
+    else:
+        amps = spectralSynthesisDirect( ts, freq[ :: next ], coefs, phis[ :: next ], 
+                                        blockSize, numWorkers )
+    return ts, amps
+
+
+def multivariateSpectralRepresentation( fs, time, freq, csd, randomSeed=None, rng=None ):
+    '''
+    Generate correlated multi-channel sequences from a given cross-spectral density 
+    matrix with spectral representation method [Deodatis1996]_.
+
+    The cross-spectral density matrix at each frequency is factorized as 
+    csd = H H^*, by Cholesky decomposition, or by eigenvalue decomposition if the 
+    matrix is only positive semi-definite. All channels are synthesized together 
+    with inverse FFTs.
+
+    Parameters
+    ----------
+    fs: scalar 
+        Sampling frequency.
+    time: scalar
+        Total sampling time.
+    freq: 1darray
+        Frequency array for csd.
+        The freq array should be in equally spaced increasing, and fs should be 
+        an integer multiple of the frequency spacing. 
+    csd: 3darray
+        One-sided cross-spectral density matrices in dimension of nfreq by m by m, 
+        where m is the number of channels. The matrix at each frequency should be 
+        Hermitian positive semi-definite, and only its lower triangle is used. 
+    randomSeed: integer, optional
+        Random seed for the global legacy random state. If randomSeed is none or is 
+        not an integer, globalConfig.rng will be used if it is set, otherwise the 
+        global legacy random state. 
+    rng: numpy.random.Generator, optional
+        Random number generator. If rng is given, the random numbers are drawn 
+        from rng and randomSeed is ignored.
     
-    # edge case check for psd
-    psd = np.array( psd, dtype=float )
-    if len( psd.shape ) != 1:
-        raise ValueError( "psd dimension should be 1" )
-    if psd.shape[ 0 ] < 3:
-        raise ValueError( "psd length should be at least 3" )
+    Returns
+    -------
+    ts: 1darray
+        Array containing all the time data for the time series.
+    amps: 2darray
+        Amplitude array in dimension of n by m containing the amplitudes of all 
+        channels corresponding to ts.
+
+    Raises
+    ------
+    ValueError
+        If the fs or time is not a scalar.
+        If freq is not a 1darray or has less than 3 elements.
+        If freq contains negative elements.
+        If freq is not equally spaced increasing. 
+        If fs is not an integer multiple of the frequency spacing.
+        If csd is not in dimension of nfreq by m by m.
+        If freq and csd are in different lengths.
+        If csd is not positive semi-definite.
+
+    Examples
+    --------
+    >>> from ffpack.lsg import multivariateSpectralRepresentation
+    >>> fs = 10
+    >>> time = 100
+    >>> freq = [ 0.1, 0.2, 0.3, 0.4, 0.5 ]
+    >>> psd = [ 0.01, 2, 0.05, 0.04, 0.01 ]
+    >>> coherence = [ [ 1.0, 0.6 ], [ 0.6, 1.0 ] ]
+    >>> csd = np.multiply.outer( psd, coherence )
+    >>> ts, amps = multivariateSpectralRepresentation( fs, time, freq, csd )
+
+    References
+    ----------
+    .. [Deodatis1996] Deodatis, G., 1996. Simulation of ergodic multivariate 
+       stochastic processes. Journal of Engineering Mechanics, 122(8), 
+       pp.778-787.
+    '''
+    # edge case check for fs and time
+    if not isinstance( fs, int ) and not isinstance( fs, float ):
+        raise ValueError( "fs should be a scalar" )
+    if fs <= 0:
+        raise ValueError( "fs should be positive" )
+    if not isinstance( time, int ) and not isinstance( time, float ):
+        raise ValueError( "time should be a scalar" )
+    if time <= 0:
+        raise ValueError( "time should be positive" )
+
+    freq = checkFreqInput( freq )
+    df = freq[ 1 ] - freq[ 0 ]
+    if abs( fs / df - round( fs / df ) ) > 1e-6 * fs / df:
+        raise ValueError( "fs should be an integer multiple of the frequency spacing" )
+
+    # edge case check for csd
+    csd = np.array( csd )
+    if len( csd.shape ) != 3 or csd.shape[ 1 ] != csd.shape[ 2 ] or csd.shape[ 1 ] < 1:
+        raise ValueError( "csd should be in dimension of nfreq by m by m" )
+    if csd.shape[ 0 ] != len( freq ):
+        raise ValueError( "freq and csd should be in the same length" )
+
+    # factorize all frequencies together, matrices that are only positive 
+    # semi-definite are factorized by eigenvalue decomposition
+    try:
+        hs = np.linalg.cholesky( csd )
+    except np.linalg.LinAlgError:
+        hs = np.zeros( csd.shape, dtype=np.result_type( csd, float ) )
+        for i in np.flatnonzero( np.any( csd != 0, axis=( 1, 2 ) ) ):
+            try:
+                hs[ i ] = np.linalg.cholesky( csd[ i ] )
+            except np.linalg.LinAlgError:
+                eigVals, eigVecs = np.linalg.eigh( csd[ i ] )
+                if np.any( eigVals < -1e-8 * max( np.max( np.abs( eigVals ) ), 1e-300 ) ):
+                    raise ValueError( "csd should be positive semi-definite at each "
+                                      "frequency" )
+                hs[ i ] = eigVecs * np.sqrt( np.clip( eigVals, 0, None ) )
+
+    n = round( fs * time )
+    ts = 1 / fs * np.arange( n, dtype=float )
+
+    # generate phase angle
+    rng = getRng( randomSeed, rng )
+    phis = rng.uniform( -np.pi, np.pi, ( len( freq ), csd.shape[ 1 ] ) )
+
+    amplitudes = np.sqrt( 2 * df ) * np.einsum( "ljk,lk->lj", hs, np.exp( 1j * phis ) )
+    amps = _spectralSynthesisFft( n, fs, freq[ 0 ], df, amplitudes )
+    return ts, amps
+
+
+def _waveNumber( omega, depth, g ):
+    # Wave numbers from the linear dispersion relation omega^2 = g k tanh( k d ), 
+    # solved by Newton iterations starting from the deep water wave numbers
+    k = omega * omega / g
+    if depth is None:
+        return k
+    k = np.maximum( k / np.sqrt( np.tanh( k * depth ) + 1e-300 ), 1e-300 )
+    for _ in range( 50 ):
+        tanhKd = np.tanh( k * depth )
+        residual = g * k * tanhKd - omega * omega
+        slope = g * tanhKd + g * k * depth * ( 1 - tanhKd * tanhKd )
+        step = residual / slope
+        k = k - step
+        if np.all( np.abs( step ) <= 1e-12 * k ):
+            break
+    return k
+
+
+def directionalSpectralRepresentation( fs, time, freq, theta, dirPsd, points=None, 
+                                       depth=None, g=9.81, randomSeed=None, rng=None ):
+    '''
+    Generate wave elevation sequences at multiple points from a directional 
+    spectrum with spectral representation method.
+
+    Each frequency-direction component is a long-crested wave 
+    A sin( 2 pi f t - k ( x cos( theta ) + y sin( theta ) ) + phi ) with the wave 
+    number k from the linear dispersion relation. The components of all the 
+    directions are summed into one complex amplitude per frequency and point, 
+    and all the points are synthesized together with inverse FFTs.
+
+    The memory of the summation is proportional to nfreq * ntheta * m. The 
+    variance at a point equals the integral of dirPsd only in expectation over 
+    the random phases, since the components of different directions at the 
+    same frequency interfere.
+
+    Parameters
+    ----------
+    fs: scalar 
+        Sampling frequency.
+    time: scalar
+        Total sampling time.
+    freq: 1darray
+        Frequency ( Hz ) array for dirPsd.
+        The freq array should be in equally spaced increasing, and fs should be 
+        an integer multiple of the frequency spacing. 
+    theta: 1darray
+        Increasing wave direction ( rad ) array for dirPsd.
+    dirPsd: 2darray
+        One-sided directional spectrum in dimension of nfreq by ntheta, per Hz 
+        and per radian. A spectrum S( w, theta ) per rad/s from 
+        ffpack.lsm.directionalSpectrum with w = 2 pi freq should be multiplied 
+        by 2 pi.
+    points: 2darray, optional
+        Horizontal coordinates ( m ) of the points in dimension of m by 2, 
+        e.g., [ [ x1, y1 ], [ x2, y2 ], ... ]. Default to None, the sequence is 
+        generated at the origin only.
+    depth: scalar, optional
+        Water depth ( m ). Default to None, the deep water dispersion relation 
+        is used.
+    g: scalar, optional
+        Acceleration due to gravity.
+    randomSeed: integer, optional
+        Random seed for the global legacy random state. If randomSeed is none or is 
+        not an integer, globalConfig.rng will be used if it is set, otherwise the 
+        global legacy random state. 
+    rng: numpy.random.Generator, optional
+        Random number generator. If rng is given, the random numbers are drawn 
+        from rng and randomSeed is ignored.
     
-    # edge case check for freq and psd length
-    if len( freq ) != len( psd ):
-        raise ValueError( "freq and psd should be in the same length" )
-
-    # edge case check for freqBandwidth
-    if freqBandwidth is not None:
-        if not isinstance( freqBandwidth, int ) and not isinstance( freqBandwidth, float ):
-            raise ValueError( "freqBandwidth should be a scalar" )
-        if freqBandwidth <= 0:
-            raise ValueError( "freqBandwidth should be positive" )
-
-    # deal with freqBandwidth
-    if freqBandwidth is None or freqBandwidth < freq[ 1 ] - freq[ 0 ]:
-        freqBandwidth = freq[ 1 ] - freq[ 0 ]
-    next = round( freqBandwidth / ( freq[ 1 ] - freq[ 0 ] ) )
+    Returns
+    -------
+    ts: 1darray
+        Array containing all the time data for the time series.
+    amps: 1darray or 2darray
+        Amplitude array corresponding to ts at the origin if points is None, 
+        otherwise in dimension of n by m for all the points.
+
+    Raises
+    ------
+    ValueError
+        If the fs or time is not a scalar or is not positive.
+        If freq is not a 1darray or has less than 3 elements.
+        If freq contains negative elements.
+        If freq is not equally spaced increasing. 
+        If fs is not an integer multiple of the frequency spacing.
+        If theta is not an increasing 1darray with at least 2 elements.
+        If dirPsd is not in dimension of nfreq by ntheta.
+        If dirPsd contains negative elements.
+        If points is not in dimension of m by 2.
+        If depth is not positive.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from ffpack.lsm import jonswapSpectrum, cos2sSpreading, directionalSpectrum
+    >>> from ffpack.lsg import directionalSpectralRepresentation
+    >>> freq = np.arange( 1, 200 ) * 0.005
+    >>> theta = np.linspace( -np.pi, np.pi, 37 )
+    >>> dirPsd = 2 * np.pi * directionalSpectrum( jonswapSpectrum( 2 * np.pi * freq, 0.6 ),
+    ...                                           cos2sSpreading( theta, s=5 ) )
+    >>> points = [ [ 0, 0 ], [ 50, 0 ], [ 0, 50 ] ]
+    >>> ts, amps = directionalSpectralRepresentation( 2, 600, freq, theta, dirPsd, 
+    ...                                               points=points )
+    '''
+    # edge case check for fs and time
+    if not isinstance( fs, int ) and not isinstance( fs, float ):
+        raise ValueError( "fs should be a scalar" )
+    if fs <= 0:
+        raise ValueError( "fs should be positive" )
+    if not isinstance( time, int ) and not isinstance( time, float ):
+        raise ValueError( "time should be a scalar" )
+    if time <= 0:
+        raise ValueError( "time should be positive" )
+
+    freq = checkFreqInput( freq )
+    df = freq[ 1 ] - freq[ 0 ]
+    if abs( fs / df - round( fs / df ) ) > 1e-6 * fs / df:
+        raise ValueError( "fs should be an integer multiple of the frequency spacing" )
+
+    # edge case check for theta, dirPsd and points
+    theta = np.array( theta, dtype=float )
+    if len( theta.shape ) != 1 or theta.shape[ 0 ] < 2 or np.any( np.diff( theta ) <= 0 ):
+        raise ValueError( "theta should be an increasing 1darray with at least 2 "
+                          "elements" )
+    dirPsd = np.array( dirPsd, dtype=float )
+    if dirPsd.shape != ( len( freq ), len( theta ) ):
+        raise ValueError( "dirPsd should be in dimension of nfreq by ntheta" )
+    if np.any( dirPsd < 0 ):
+        raise ValueError( "dirPsd should not contain negative elements" )
+    origin = points is None
+    points = np.zeros( ( 1, 2 ) ) if origin else np.array( points, dtype=float )
+    if len( points.shape ) != 2 or points.shape[ 1 ] != 2 or points.shape[ 0 ] < 1:
+        raise ValueError( "points should be in dimension of m by 2" )
+    if depth is not None and depth <= 0:
+        raise ValueError( "depth should be positive" )
 
     n = round( fs * time )
     ts = 1 / fs * np.arange( n, dtype=float )
-    amps = np.zeros( n )
 
     # generate phase angle
-    if isinstance( randomSeed, ( int, type( None ) ) ):
-        np.random.seed( randomSeed )
-    phis = -np.pi + 2 * np.pi * np.random.randn( len( freq ) )
-
-    i = 0
-    while i < len( freq ):
-        for j in range( n ):
-            amps[ j ] += np.sqrt( 2 * psd[ i ] * freqBandwidth ) * \
-                np.sin( 2 * np.pi * freq[ i ] * ts[ j ] + phis[ i ] )
-        i += next
+    rng = getRng( randomSeed, rng )
+    phis = rng.uniform( -np.pi, np.pi, dirPsd.shape )
+
+    # trapezoid direction bandwidths, the end points get half bandwidths
+    dtheta = np.zeros( len( theta ) )
+    dtheta[ : -1 ] += np.diff( theta ) / 2
+    dtheta[ 1: ] += np.diff( theta ) / 2
+
+    # sum the directions into one complex amplitude per frequency and point
+    k = _waveNumber( 2 * np.pi * freq, depth, g )
+    projections = np.cos( theta )[ :, None ] * points[ :, 0 ] + \
+        np.sin( theta )[ :, None ] * points[ :, 1 ]
+    components = np.sqrt( 2 * dirPsd * df * dtheta ) * np.exp( 1j * phis )
+    amplitudes = np.einsum( "ij,ijp->ip", components, 
+                            np.exp( -1j * k[ :, None, None ] * projections ) )
+    amps = _spectralSynthesisFft( n, fs, freq[ 0 ], df, amplitudes )
+    if origin:
+        amps = amps[ :, 0 ]
     return ts, amps
@@ -0,0 +1,611 @@
+#!/usr/bin/env python3
+
+'''
+Stateful streams of the load sequence generators. Each stream keeps the filter
+states, phases or chain states between calls, so a long sequence can be
+generated block by block with bounded memory. The blocks are requested with
+nextBlock( n ), named in camelCase as the rest of the package rather than
+next_block.
+'''
+
+import numpy as np
+from scipy import signal
+
+from ._common import checkSpectrumInput, spectralSynthesisDirect, randomWalkSteps
+from ._common import checkTransitionInput, markovTables, markovTurningPointIndices
+from ._common import initialState, checkTransitionRows
+from ffpack.config import getRng, getSeedSequence
+
+
+def _checkBlockSize( n ):
+    # Check the number of samples requested for the next block
+    if not isinstance( n, int ):
+        raise ValueError( "n should be int" )
+    if n < 1:
+        raise ValueError( "n should be at least 1" )
+
+
+def _observedWarmup( obs ):
+    # Warmup samples taken from the initial observed values
+    return lambda drive, warmup: obs[ len( warmup ) ]
+
+
+def _integratedWarmup( phis ):
+    # Warmup samples of the first-order difference recursion before enough
+    # points exist for the AR( p + 1 ) filter
+    def warmupSample( drive, warmup ):
+        i = len( warmup )
+        rst = drive
+        for j in range( i - 1 ):
+            rst += phis[ j ] * ( warmup[ i - j - 1 ] - warmup[ i - j - 2 ] )
+        return rst
+    return warmupSample
+
+
+def _initRandomGenerator( randomSeed, rng ):
+    # Each stream owns its generator so that other random draws cannot break
+    # the continuity between blocks, unless the caller passes its own rng
+    if rng is not None:
+        return getRng( rng=rng )
+    return np.random.default_rng( getSeedSequence( randomSeed ) )
+
+
+class _FilterStream:
+    '''
+    Stream of a moving-average filter followed by an autoregressive filter.
+
+    The first numWarmup samples are given by warmupSample( drive, warmup ), where
+    drive is the moving-average output and warmup is the list of the previous
+    warmup samples, after which the autoregressive filter starts with the warmup
+    samples as initial conditions.
+    '''
+    def __init__( self, c, phis, thetas, mu, sigma, numWarmup, warmupSample, randomSeed,
+                  rng ):
+        self.c = c
+        self.mu = mu
+        self.sigma = sigma
+        self.maB = np.concatenate( [ [ 1.0 ], np.asarray( thetas, dtype=float ) ] )
+        self.maZi = np.zeros( len( self.maB ) - 1 )
+        self.arA = np.concatenate( [ [ 1.0 ], -np.asarray( phis, dtype=float ) ] )
+        self.arZi = None
+        self.numWarmup = numWarmup
+        self.warmupSample = warmupSample
+        self.warmup = [ ]
+        self.rng = _initRandomGenerator( randomSeed, rng )
+        if numWarmup == 0:
+            self.arZi = np.zeros( len( self.arA ) - 1 )
+
+    def nextBlock( self, n ):
+        '''
+        Generate the next block of the sequence.
+
+        Parameters
+        ----------
+        n: integer
+            Number of samples in the block.
+
+        Returns
+        -------
+        rst: 1d array
+            Next n samples of the sequence, continuous with the previous block.
+
+        Raises
+        ------
+        ValueError
+            If the n is not an integer or is less than 1.
+
+        Examples
+        --------
+        >>> block = stream.nextBlock( 1000 )
+        '''
+        _checkBlockSize( n )
+        eps = self.rng.normal( self.mu, self.sigma, n )
+        drive, self.maZi = signal.lfilter( self.maB, [ 1.0 ], eps, zi=self.maZi )
+        drive += self.c
+
+        rst = np.empty( n )
+        i = 0
+        while self.arZi is None and i < n:
+            rst[ i ] = self.warmupSample( drive[ i ], self.warmup )
+            self.warmup.append( rst[ i ] )
+            i += 1
+            if len( self.warmup ) == self.numWarmup:
+                pastVals = self.warmup[ ::-1 ][ : len( self.arA ) - 1 ]
+                self.arZi = signal.lfiltic( [ 1.0 ], self.arA, pastVals )
+        if i < n:
+            rst[ i: ], self.arZi = signal.lfilter( [ 1.0 ], self.arA, drive[ i: ],
+                                                   zi=self.arZi )
+        return rst
+
+
+class ArNormalStream( _FilterStream ):
+    '''
+    Streaming load sequence generator by an autoregressive model.
+
+    The white noise is generated by the normal distribution. The concatenated
+    blocks follow the same recursion as arNormal.
+    '''
+    def __init__( self, obs, phis, mu, sigma, randomSeed=None, rng=None ):
+        '''
+        Initialize the streaming autoregressive generator.
+
+        Parameters
+        ----------
+        obs: 1d array
+            Initial observed values, returned as the first samples.
+        phis: 1d array
+            Coefficients for the autoregressive model.
+        mu: scalar
+            Mean of the white noise.
+        sigma: scalar
+            Standard deviation of the white noise.
+        randomSeed: integer, optional
+            Random seed for the generator owned by the stream. If randomSeed is
+            none or is not an integer, the generator is seeded from
+            globalConfig.rng if it is set, otherwise from fresh entropy from
+            the operating system.
+        rng: numpy.random.Generator, optional
+            Random number generator. If rng is given, the random numbers are
+            drawn from rng and randomSeed is ignored.
+
+        Raises
+        ------
+        ValueError
+            If lengths of obs and phis are not equal.
+            If the obs or phis is empty.
+            If rng is not a numpy.random.Generator.
+
+        Examples
+        --------
+        >>> from ffpack.lsg import ArNormalStream
+        >>> stream = ArNormalStream( [ 0, 1 ], [ 0.5, 0.3 ], 0, 0.5 )
+        >>> block = stream.nextBlock( 1000 )
+        '''
+        if len( obs ) != len( phis ):
+            raise ValueError( "lengths of obs and phis should be same" )
+        if len( obs ) < 1:
+            raise ValueError( "length of obs or phis should be at least 1" )
+        self.obs = np.array( obs, dtype=float )
+        super().__init__( 0.0, phis, [ ], mu, sigma, len( obs ),
+                          _observedWarmup( self.obs ), randomSeed, rng )
+
+
+class MaNormalStream( _FilterStream ):
+    '''
+    Streaming load sequence generator by a moving-average model.
+
+    The white noise is generated by the normal distribution. The concatenated
+    blocks follow the same recursion as maNormal.
+    '''
+    def __init__( self, c, thetas, mu, sigma, randomSeed=None, rng=None ):
+        '''
+        Initialize the streaming moving-average generator.
+
+        Parameters
+        ----------
+        c: scalar
+            Mean of the series.
+        thetas: 1d array
+            Coefficients for the white noise in the moving-average model.
+        mu: scalar
+            Mean of the white noise.
+        sigma: scalar
+            Standard deviation of the white noise.
+        randomSeed: integer, optional
+            Random seed for the generator owned by the stream. If randomSeed is
+            none or is not an integer, the generator is seeded from
+            globalConfig.rng if it is set, otherwise from fresh entropy from
+            the operating system.
+        rng: numpy.random.Generator, optional
+            Random number generator. If rng is given, the random numbers are
+            drawn from rng and randomSeed is ignored.
+
+        Raises
+        ------
+        ValueError
+            If mean of the series is not a scalar.
+            If the thetas is empty.
+            If rng is not a numpy.random.Generator.
+
+        Examples
+        --------
+        >>> from ffpack.lsg import MaNormalStream
+        >>> stream = MaNormalStream( 0, [ 0.8, 0.5 ], 0, 0.5 )
+        >>> block = stream.nextBlock( 1000 )
+        '''
+        if not isinstance( c, int ) and not isinstance( c, float ):
+            raise ValueError( "mean of the series should be a scalar" )
+        if len( thetas ) < 1:
+            raise ValueError( "length of coefficients for the white noise should be at least 1" )
+        super().__init__( c, [ ], thetas, mu, sigma, 0, None, randomSeed, rng )
+
+
+class ArmaNormalStream( _FilterStream ):
+    '''
+    Streaming load sequence generator by an autoregressive-moving-average model.
+
+    The white noise is generated by the normal distribution. The concatenated
+    blocks follow the same recursion as armaNormal.
+    '''
+    def __init__( self, obs, phis, thetas, mu, sigma, randomSeed=None, rng=None ):
+        '''
+        Initialize the streaming autoregressive-moving-average generator.
+
+        Parameters
+        ----------
+        obs: 1d array
+            Initial observed values returned as the first samples, could be empty.
+        phis: 1d array
+            Coefficients for the autoregressive part.
+        thetas: 1d array
+            Coefficients for the white noise for the moving-average part.
+        mu: scalar
+            Mean of the white noise.
+        sigma: scalar
+            Standard deviation of the white noise.
+        randomSeed: integer, optional
+            Random seed for the generator owned by the stream. If randomSeed is
+            none or is not an integer, the generator is seeded from
+            globalConfig.rng if it is set, otherwise from fresh entropy from
+            the operating system.
+        rng: numpy.random.Generator, optional
+            Random number generator. If rng is given, the random numbers are
+            drawn from rng and randomSeed is ignored.
+
+        Raises
+        ------
+        ValueError
+            If the phis is empty.
+            If the thetas is empty.
+            If rng is not a numpy.random.Generator.
+
+        Examples
+        --------
+        >>> from ffpack.lsg import ArmaNormalStream
+        >>> stream = ArmaNormalStream( [ 0, 1 ], [ 0.5, 0.3 ], [ 0.8, 0.5 ], 0, 0.5 )
+        >>> block = stream.nextBlock( 1000 )
+        '''
+        if len( phis ) < 1:
+            raise ValueError( "length of phis should be at least 1" )
+        if len( thetas ) < 1:
+            raise ValueError( "length of coefficients for the white noise should be at least 1" )
+        self.obs = np.array( obs, dtype=float )
+        super().__init__( 0.0, phis, thetas, mu, sigma, len( obs ),
+                          _observedWarmup( self.obs ), randomSeed, rng )
+
+
+class ArimaNormalStream( _FilterStream ):
+    '''
+    Streaming load sequence generator by an autoregressive integrated moving
+    average model.
+
+    The white noise is generated by the normal distribution. First-order
+    difference is used. The concatenated blocks follow the same recursion as
+    arimaNormal.
+    '''
+    def __init__( self, c, phis, thetas, mu, sigma, randomSeed=None, rng=None ):
+        '''
+        Initialize the streaming autoregressive integrated moving average generator.
+
+        Parameters
+        ----------
+        c: scalar
+            Mean of the series.
+        phis: 1d array
+            Coefficients for the autoregressive part.
+        thetas: 1d array
+            Coefficients for the white noise for the moving-average part.
+        mu: scalar
+            Mean of the white noise.
+        sigma: scalar
+            Standard deviation of the white noise.
+        randomSeed: integer, optional
+            Random seed for the generator owned by the stream. If randomSeed is
+            none or is not an integer, the generator is seeded from
+            globalConfig.rng if it is set, otherwise from fresh entropy from
+            the operating system.
+        rng: numpy.random.Generator, optional
+            Random number generator. If rng is given, the random numbers are
+            drawn from rng and randomSeed is ignored.
+
+        Raises
+        ------
+        ValueError
+            If mean of the series is not a scalar.
+            If the phis is empty.
+            If the thetas is empty.
+            If rng is not a numpy.random.Generator.
+
+        Examples
+        --------
+        >>> from ffpack.lsg import ArimaNormalStream
+        >>> stream = ArimaNormalStream( 0.0, [ 0.5, 0.3 ], [ 0.8, 0.5 ], 0, 0.5 )
+        >>> block = stream.nextBlock( 1000 )
+        '''
+        if not isinstance( c, int ) and not isinstance( c, float ):
+            raise ValueError( "mean of the series should be a scalar" )
+        if len( phis ) < 1:
+            raise ValueError( "length of phis should be at least 1" )
+        if len( thetas ) < 1:
+            raise ValueError( "length of coefficients for the white noise should be at least 1" )
+        self.phis = np.array( phis, dtype=float )
+        # The first-order difference turns the AR( p ) part into an AR( p + 1 ) filter
+        diffPhis = np.concatenate( [ self.phis, [ 0.0 ] ] ) - \
+            np.concatenate( [ [ 0.0 ], self.phis ] )
+        super().__init__( c, diffPhis, thetas, mu, sigma, len( phis ) + 1,
+                          _integratedWarmup( self.phis ), randomSeed, rng )
+
+
+class RandomWalkUniformStream:
+    '''
+    Streaming load sequence generator by a uniform random walk.
+    '''
+    def __init__( self, dim=1, randomSeed=None, rng=None ):
+        '''
+        Initialize the streaming random walk generator starting from the origin.
+
+        Parameters
+        ----------
+        dim: integer, optional
+            Data dimension.
+        randomSeed: integer, optional
+            Random seed for the generator owned by the stream. If randomSeed is
+            none or is not an integer, the generator is seeded from
+            globalConfig.rng if it is set, otherwise from fresh entropy from
+            the operating system.
+        rng: numpy.random.Generator, optional
+            Random number generator. If rng is given, the random numbers are
+            drawn from rng and randomSeed is ignored.
+
+        Raises
+        ------
+        ValueError
+            If the dim is not an integer or is less than 1.
+            If rng is not a numpy.random.Generator.
+
+        Examples
+        --------
+        >>> from ffpack.lsg import RandomWalkUniformStream
+        >>> stream = RandomWalkUniformStream( dim=2 )
+        >>> block = stream.nextBlock( 1000 )
+        '''
+        if not isinstance( dim, int ):
+            raise ValueError( "dim should be int" )
+        if dim < 1:
+            raise ValueError( "dim should be at least 1" )
+        self.dim = dim
+        self.position = np.zeros( dim, dtype=int )
+        self.rng = _initRandomGenerator( randomSeed, rng )
+
+    def nextBlock( self, n ):
+        '''
+        Generate the next block of the random walk.
+
+        Parameters
+        ----------
+        n: integer
+            Number of steps in the block.
+
+        Returns
+        -------
+        rst: 2d array
+            A 2d ( n by dim ) matrix holding the coordinates of the position after
+            each step, continuous with the previous block.
+
+        Raises
+        ------
+        ValueError
+            If the n is not an integer or is less than 1.
+
+        Examples
+        --------
+        >>> block = stream.nextBlock( 1000 )
+        '''
+        _checkBlockSize( n )
+        steps = randomWalkSteps( self.rng.integers( 2 * self.dim, size=n ), self.dim )
+        rst = self.position + np.cumsum( steps, axis=0 )
+        self.position = rst[ -1 ].copy()
+        return rst
+
+
+class SpectralRepresentationStream:
+    '''
+    Streaming sequence generator from a given power spectrum density with
+    spectral representation method.
+
+    The phase of each frequency component is carried between blocks and wrapped
+    to [ 0, 2 pi ), so the signal stays continuous and accurate for arbitrarily
+    long runs.
+    '''
+    def __init__( self, fs, freq, psd, freqBandwidth=None, randomSeed=None,
+                  chunkSize=4096, rng=None ):
+        '''
+        Initialize the streaming spectral representation generator.
+
+        Parameters
+        ----------
+        fs: scalar
+            Sampling frequency.
+        freq: 1darray
+            Frequency array for psd.
+            The freq array should be in equally spaced increasing.
+        psd: 1darray
+            Power spectrum density array.
+        freqBandwidth: scalar, optional
+            Frequency bandwidth used to generate the time series from psd.
+            Default to None, every frequency in freq will be used.
+        randomSeed: integer, optional
+            Random seed for the generator owned by the stream. If randomSeed is
+            none or is not an integer, the generator is seeded from
+            globalConfig.rng if it is set, otherwise from fresh entropy from
+            the operating system.
+        chunkSize: integer, optional
+            Number of samples synthesized at the same time to bound the memory.
+        rng: numpy.random.Generator, optional
+            Random number generator. If rng is given, the random numbers are
+            drawn from rng and randomSeed is ignored.
+
+        Raises
+        ------
+        ValueError
+            If the fs is not a scalar or is not positive.
+            If freq or psd is not a 1darray or has less than 3 elements.
+            If freq and psd are in different lengths.
+            If freq contains negative elements.
+            If freq is not equally spaced increasing.
+            If the chunkSize is less than 1.
+            If rng is not a numpy.random.Generator.
+
+        Examples
+        --------
+        >>> from ffpack.lsg import SpectralRepresentationStream
+        >>> freq = [ 0, 0.1, 0.2, 0.3, 0.4, 0.5 ]
+        >>> psd = [ 0.01, 2, 0.05, 0.04, 0.01, 0.03 ]
+        >>> stream = SpectralRepresentationStream( 100, freq, psd )
+        >>> block = stream.nextBlock( 1000 )
+        '''
+        if not isinstance( fs, int ) and not isinstance( fs, float ):
+            raise ValueError( "fs should be a scalar" )
+        if fs <= 0:
+            raise ValueError( "fs should be positive" )
+        if not isinstance( chunkSize, int ) or chunkSize < 1:
+            raise ValueError( "chunkSize should be an int and at least 1" )
+        freq, psd, freqBandwidth, next = checkSpectrumInput( freq, psd, freqBandwidth )
+
+        self.rng = _initRandomGenerator( randomSeed, rng )
+        phis = -np.pi + 2 * np.pi * self.rng.standard_normal( len( freq ) )
+        self.fs = fs
+        self.chunkSize = chunkSize
+        self.freq = freq[ :: next ]
+        self.coefs = np.sqrt( 2 * psd[ :: next ] * freqBandwidth )
+        self.phase = np.mod( phis[ :: next ], 2 * np.pi )
+
+    def nextBlock( self, n ):
+        '''
+        Generate the next block of the sequence.
+
+        Parameters
+        ----------
+        n: integer
+            Number of samples in the block.
+
+        Returns
+        -------
+        amps: 1d array
+            Next n samples of the sequence, continuous with the previous block.
+
+        Raises
+        ------
+        ValueError
+            If the n is not an integer or is less than 1.
+
+        Examples
+        --------
+        >>> block = stream.nextBlock( 1000 )
+        '''
+        _checkBlockSize( n )
+        ts = np.arange( n ) / self.fs
+        amps = spectralSynthesisDirect( ts, self.freq, self.coefs, self.phase, 
+                                        self.chunkSize, 1 )
+        self.phase = np.mod( self.phase + 2 * np.pi * self.freq * n / self.fs, 2 * np.pi )
+        return amps
+
+
+class MarkovChainTurningPointStream:
+    '''
+    Streaming turning-point sequence generator by a Markov chain between the
+    levels.
+
+    The current level and whether it is a minimum or a maximum are carried
+    between blocks, so the concatenated blocks follow the same chain as
+    markovChainTurningPoints, e.g., for writing long rig drive files in chunks.
+    '''
+    def __init__( self, transitionMatrix, levels, initLevel=None, randomSeed=None,
+                  rng=None ):
+        '''
+        Initialize the streaming Markov chain generator.
+
+        Parameters
+        ----------
+        transitionMatrix: 2d array
+            Transition matrix between the levels, e.g., from
+            countingMatrixToTransitionMatrix. Entries above the diagonal are the
+            upward weights from a minimum, and entries below the diagonal are the
+            downward weights from a maximum.
+        levels: 1d array
+            Levels of the turning points.
+        initLevel: scalar, optional
+            Level of the first turning point, which is a minimum. Default to the
+            lowest level with upward transitions.
+        randomSeed: integer, optional
+            Random seed for the generator owned by the stream. If randomSeed is
+            none or is not an integer, the generator is seeded from
+            globalConfig.rng if it is set, otherwise from fresh entropy from
+            the operating system.
+        rng: numpy.random.Generator, optional
+            Random number generator. If rng is given, the random numbers are
+            drawn from rng and randomSeed is ignored.
+
+        Raises
+        ------
+        ValueError
+            If the levels is not a 1d array with at least 2 elements.
+            If the transitionMatrix is not a square matrix matching the levels.
+            If the transitionMatrix contains negative elements.
+            If a level reached by an upward ( downward ) transition cannot move
+            down ( up ).
+            If the initLevel is not a level with upward transitions.
+            If rng is not a numpy.random.Generator.
+
+        Examples
+        --------
+        >>> from ffpack.lsg import MarkovChainTurningPointStream
+        >>> transitionMatrix = [ [ 0, 0.5, 0.5 ], [ 1, 0, 1 ], [ 0.5, 0.5, 0 ] ]
+        >>> stream = MarkovChainTurningPointStream( transitionMatrix, [ -1, 0, 1 ] )
+        >>> block = stream.nextBlock( 1000 )
+        '''
+        transitionMatrix, self.levels = checkTransitionInput( transitionMatrix, levels )
+        checkTransitionRows( transitionMatrix )
+        self.state = initialState( transitionMatrix, self.levels, initLevel )
+        self.accept, self.alias = markovTables( transitionMatrix )
+        self.isMin = True
+        self.started = False
+        self.rng = _initRandomGenerator( randomSeed, rng )
+
+    def nextBlock( self, n ):
+        '''
+        Generate the next block of turning points.
+
+        Parameters
+        ----------
+        n: integer
+            Number of turning points in the block.
+
+        Returns
+        -------
+        rst: 1d array
+            Next n turning points, continuous with the previous block.
+
+        Raises
+        ------
+        ValueError
+            If the n is not an integer or is less than 1.
+
+        Examples
+        --------
+        >>> block = stream.nextBlock( 1000 )
+        '''
+        _checkBlockSize( n )
+        rst = np.empty( n, dtype=int )
+        i = 0
+        if not self.started:
+            # The first block starts with the initial level itself
+            rst[ 0 ] = self.state
+            self.started = True
+            i = 1
+        if i < n:
+            rst[ i: ], self.state = markovTurningPointIndices(
+                self.state, self.isMin, self.rng.random( n - i ),
+                self.accept, self.alias, len( self.levels ) )
+            self.isMin = self.isMin == ( ( n - i ) % 2 == 0 )
+        return self.levels[ rst ]
@@ -2,3 +2,7 @@ from .cycleCountingMatrix import *
 from .waveSpectra import *
 from .windSpectra import *
 from .sequenceSpectra import *
+from .spectralMoments import *
+from .directionalSpectra import *
+from .spectrumTemplate import *
+from .spectralPipeline import *
@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+
+'''
+Directional wave spectra S( w, theta ) = S( w ) D( theta ) on frequency-direction
+grids. The frequency part S( w ) is evaluated once with the wave spectra, e.g.,
+jonswapSpectrum( w, wp ), the spreading part D( theta ) is evaluated once with
+the spreading functions, and the two parts are combined by broadcasting.
+'''
+
+import numpy as np
+from scipy import special
+from .waveSpectra import _checkSpectrumInput, _spectrumResult
+from .spectralMoments import _trapezoidWeights
+
+
+def _wrapAngle( theta ):
+    # Wrap angles to [ -pi, pi )
+    return np.mod( theta + np.pi, 2 * np.pi ) - np.pi
+
+
+def cos2sSpreading( theta, thetaMean=0.0, s=10.0 ):
+    '''
+    Cosine-2s directional spreading function [Longuet1963]_.
+
+    D( theta ) = Gamma( s + 1 ) / ( 2 sqrt( pi ) Gamma( s + 1/2 ) )
+    cos^2s( ( theta - thetaMean ) / 2 ), which integrates to 1 over
+    [ -pi, pi ].
+
+    Parameters
+    ----------
+    theta: scalar or array
+        Wave direction ( rad ).
+    thetaMean: scalar or array, optional
+        Mean wave direction ( rad ).
+    s: scalar or array, optional
+        Spreading parameter, a larger s gives a narrower spreading.
+
+    Returns
+    -------
+    rst: scalar or array
+        Spreading function value at theta. The shape is the broadcast shape of
+        the array inputs.
+
+    Raises
+    ------
+    ValueError
+        If theta, thetaMean or s is not a scalar or an array, or is empty.
+        If the inputs cannot be broadcast together.
+        If s is negative.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from ffpack.lsm import cos2sSpreading
+    >>> theta = np.linspace( -np.pi, np.pi, 73 )
+    >>> rst = cos2sSpreading( theta, thetaMean=0.5, s=10 )
+
+    References
+    ----------
+    .. [Longuet1963] Longuet-Higgins, M.S., Cartwright, D.E. and Smith, N.D.,
+       1963. Observations of the directional spectrum of sea waves using the
+       motions of a floating buoy. Ocean Wave Spectra, pp.111-136.
+    '''
+    theta, thetaMean, s = _checkSpectrumInput( theta=theta, thetaMean=thetaMean, s=s )
+    if np.any( s < 0 ):
+        raise ValueError( "s should not be negative" )
+
+    logNorm = special.gammaln( s + 1 ) - special.gammaln( s + 0.5 ) - \
+        np.log( 2 * np.sqrt( np.pi ) )
+    cosHalf = np.abs( np.cos( _wrapAngle( theta - thetaMean ) / 2 ) )
+    rst = np.exp( logNorm ) * np.power( cosHalf, 2 * s )
+    return _spectrumResult( rst )
+
+
+def wrappedNormalSpreading( theta, thetaMean=0.0, sigma=0.5 ):
+    '''
+    Wrapped normal directional spreading function.
+
+    The normal density with standard deviation sigma is wrapped around the
+    circle, so it integrates to 1 over [ -pi, pi ] for any sigma.
+
+    Parameters
+    ----------
+    theta: scalar or array
+        Wave direction ( rad ).
+    thetaMean: scalar or array, optional
+        Mean wave direction ( rad ).
+    sigma: scalar or array, optional
+        Directional spread ( rad ).
+
+    Returns
+    -------
+    rst: scalar or array
+        Spreading function value at theta. The shape is the broadcast shape of
+        the array inputs.
+
+    Raises
+    ------
+    ValueError
+        If theta, thetaMean or sigma is not a scalar or an array, or is empty.
+        If the inputs cannot be broadcast together.
+        If sigma is not positive.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from ffpack.lsm import wrappedNormalSpreading
+    >>> theta = np.linspace( -np.pi, np.pi, 73 )
+    >>> rst = wrappedNormalSpreading( theta, thetaMean=0.5, sigma=0.4 )
+    '''
+    theta, thetaMean, sigma = _checkSpectrumInput( theta=theta, thetaMean=thetaMean,
+                                                   sigma=sigma )
+    if np.any( sigma <= 0 ):
+        raise ValueError( "sigma should be positive" )
+
+    # Sum the images of the normal density shifted by multiples of 2 pi, the
+    # images beyond 8 sigma are negligible
+    numImages = int( np.ceil( 8 * np.max( sigma ) / ( 2 * np.pi ) ) ) + 1
+    shifts = 2 * np.pi * np.arange( -numImages, numImages + 1 )
+    delta = _wrapAngle( theta - thetaMean )[ ..., None ] + shifts
+    sigma = sigma[ ..., None ]
+    rst = np.sum( np.exp( -0.5 * np.square( delta / sigma ) ), axis=-1 ) / \
+        ( sigma[ ..., 0 ] * np.sqrt( 2 * np.pi ) )
+    return _spectrumResult( rst )
+
+
+def directionalSpectrum( psd, spreading ):
+    '''
+    Combine a frequency spectrum and a spreading function into a directional
+    spectrum.
+
+    Parameters
+    ----------
+    psd: nd array
+        Frequency spectrum S( w ) with the frequencies on the last axis, e.g.,
+        jonswapSpectrum( w, wp ). Leading dimensions are batches such as sea
+        states.
+    spreading: nd array
+        Spreading function D( theta ) with the directions on the last axis, e.g.,
+        cos2sSpreading( theta ). Leading dimensions broadcast against the leading
+        dimensions of psd.
+
+    Returns
+    -------
+    rst: nd array
+        Directional spectrum S( w ) D( theta ) in dimension of ... by nw by
+        ntheta.
+
+    Raises
+    ------
+    ValueError
+        If psd or spreading is a scalar or is empty.
+        If the leading dimensions of psd and spreading cannot be broadcast.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from ffpack.lsm import jonswapSpectrum, cos2sSpreading, directionalSpectrum
+    >>> w = np.linspace( 0.1, 3.0, 500 )
+    >>> theta = np.linspace( -np.pi, np.pi, 73 )
+    >>> rst = directionalSpectrum( jonswapSpectrum( w, 0.5 ), cos2sSpreading( theta ) )
+    '''
+    psd = np.asarray( psd, dtype=float )
+    spreading = np.asarray( spreading, dtype=float )
+    if psd.ndim < 1 or spreading.ndim < 1 or psd.size == 0 or spreading.size == 0:
+        raise ValueError( "psd and spreading should be nonempty arrays" )
+    try:
+        np.broadcast( psd[ ..., 0 ], spreading[ ..., 0 ] )
+    except ValueError:
+        raise ValueError( "leading dimensions of psd and spreading should be "
+                          "broadcastable" )
+    return psd[ ..., :, None ] * spreading[ ..., None, : ]
+
+
+def _checkGrid( values, name ):
+    # Check the grid is an increasing 1d array
+    values = np.array( values, dtype=float )
+    if len( values.shape ) != 1 or values.shape[ 0 ] < 2:
+        raise ValueError( "{} should be a 1darray with at least 2 elements".format( name ) )
+    if np.any( np.diff( values ) <= 0 ):
+        raise ValueError( "{} should be increasing".format( name ) )
+    return values
+
+
+def _directionalWeights( w, theta, dirPsd ):
+    # Trapezoid weights on both axes of the directional spectrum
+    w = _checkGrid( w, "w" )
+    theta = _checkGrid( theta, "theta" )
+    dirPsd = np.asarray( dirPsd, dtype=float )
+    if dirPsd.ndim < 2 or dirPsd.shape[ -2: ] != ( len( w ), len( theta ) ):
+        raise ValueError( "dirPsd should be in dimension of ... by nw by ntheta" )
+    return w, theta, dirPsd, _trapezoidWeights( w ), _trapezoidWeights( theta )
+
+
+def directionalMoments( w, theta, dirPsd, orders=( 0, 1, 2, 4 ), heading=None ):
+    '''
+    Calculate the spectral moments of a directional spectrum in one weighted pass.
+
+    Parameters
+    ----------
+    w: 1darray
+        Increasing wave frequencies.
+    theta: 1darray
+        Increasing wave directions ( rad ).
+    dirPsd: nd array
+        Directional spectrum in dimension of ... by nw by ntheta.
+    orders: 1d array, optional
+        Orders of the spectral moments.
+    heading: scalar, optional
+        If heading is given, the spectrum is weighted by
+        cos^2( theta - heading ), i.e., the moments of a kinematic component
+        projected on the heading direction. Default to None, no weighting.
+
+    Returns
+    -------
+    rst: nd array
+        Spectral moments with the orders on the last axis, i.e.,
+        rst[ ..., i ] = double integral of w^orders[ i ] * dirPsd over w and theta.
+
+    Raises
+    ------
+    ValueError
+        If w or theta is not an increasing 1darray with at least 2 elements.
+        If dirPsd is not in dimension of ... by nw by ntheta.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from ffpack.lsm import jonswapSpectrum, cos2sSpreading
+    >>> from ffpack.lsm import directionalSpectrum, directionalMoments
+    >>> w = np.linspace( 0.1, 3.0, 500 )
+    >>> theta = np.linspace( -np.pi, np.pi, 73 )
+    >>> dirPsd = directionalSpectrum( jonswapSpectrum( w, 0.5 ), cos2sSpreading( theta ) )
+    >>> rst = directionalMoments( w, theta, dirPsd, heading=np.pi / 4 )
+    '''
+    w, theta, dirPsd, wWeights, thetaWeights = _directionalWeights( w, theta, dirPsd )
+    orders = np.array( orders, dtype=float )
+    if heading is not None:
+        thetaWeights = thetaWeights * np.square( np.cos( theta - heading ) )
+    freqWeights = wWeights[ :, None ] * np.power( w[ :, None ], orders )
+    return np.einsum( "...ij,j,ik->...k", dirPsd, thetaWeights, freqWeights )
+
+
+def directionalMeanAndSpread( w, theta, dirPsd ):
+    '''
+    Calculate the mean direction and the circular directional spread of a
+    directional spectrum.
+
+    Parameters
+    ----------
+    w: 1darray
+        Increasing wave frequencies.
+    theta: 1darray
+        Increasing wave directions ( rad ).
+    dirPsd: nd array
+        Directional spectrum in dimension of ... by nw by ntheta.
+
+    Returns
+    -------
+    meanDirection: scalar or array
+        Energy weighted mean direction ( rad ) in [ -pi, pi ].
+    spread: scalar or array
+        Circular spread sqrt( 2 ( 1 - R ) ) ( rad ), where R is the mean
+        resultant length of the directional energy distribution.
+
+    Raises
+    ------
+    ValueError
+        If w or theta is not an increasing 1darray with at least 2 elements.
+        If dirPsd is not in dimension of ... by nw by ntheta.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from ffpack.lsm import jonswapSpectrum, wrappedNormalSpreading
+    >>> from ffpack.lsm import directionalSpectrum, directionalMeanAndSpread
+    >>> w = np.linspace( 0.1, 3.0, 500 )
+    >>> theta = np.linspace( -np.pi, np.pi, 73 )
+    >>> dirPsd = directionalSpectrum( jonswapSpectrum( w, 0.5 ),
+    ...                               wrappedNormalSpreading( theta, 0.3, 0.4 ) )
+    >>> meanDirection, spread = directionalMeanAndSpread( w, theta, dirPsd )
+    '''
+    w, theta, dirPsd, wWeights, thetaWeights = _directionalWeights( w, theta, dirPsd )
+    weights = thetaWeights * np.stack( [ np.ones( len( theta ) ), np.cos( theta ),
+                                         np.sin( theta ) ] )
+    m0, c, s = np.moveaxis( np.einsum( "...ij,i,kj->...k", dirPsd, wWeights, weights ),
+                            -1, 0 )
+    resultant = np.sqrt( c * c + s * s ) / m0
+    meanDirection = np.arctan2( s, c )
+    spread = np.sqrt( 2 * np.maximum( 1 - resultant, 0 ) )
+    return _spectrumResult( meanDirection ), _spectrumResult( spread )
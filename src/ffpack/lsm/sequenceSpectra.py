@@ -2,6 +2,7 @@
 
 import numpy as np
 from scipy import signal
+from .spectralMoments import _trapezoidWeights
 
 
 def periodogramSpectrum( data, fs ):
@@ -90,3 +91,409 @@ def welchSpectrum( data, fs, nperseg=1024 ):
 
     ( freq, psd ) = signal.welch( data, fs, nperseg=nperseg )
     return freq, psd
+
+
+def _segmentSpectra( segments, window ):
+    # FFT of the constant detrended and windowed segments on the last axis
+    segments = segments - np.mean( segments, axis=-1, keepdims=True )
+    return np.fft.rfft( segments * window, axis=-1 )
+
+
+def _oneSidedFactors( nperseg ):
+    # Factors doubling the frequencies other than zero and Nyquist frequency
+    factors = np.full( nperseg // 2 + 1, 2.0 )
+    factors[ 0 ] = 1.0
+    if nperseg % 2 == 0:
+        factors[ -1 ] = 1.0
+    return factors
+
+
+def _segmentPeriodograms( segments, window, scale ):
+    # One-sided periodograms of the segments in the rows, following the density 
+    # scaling of scipy.signal.welch
+    spectra = _segmentSpectra( segments, window )
+    return np.real( spectra * np.conj( spectra ) ) * scale * \
+        _oneSidedFactors( len( window ) )
+
+
+def _overlappedSegments( data, nperseg, step ):
+    # Read-only view of the complete overlapped segments on the last axis of data
+    numSegments = ( data.shape[ -1 ] - nperseg ) // step + 1
+    stride = data.strides[ -1 ]
+    return np.lib.stride_tricks.as_strided( 
+        data, shape=data.shape[ : -1 ] + ( numSegments, nperseg ),
+        strides=data.strides[ : -1 ] + ( step * stride, stride ), writeable=False )
+
+
+class OnlineWelch:
+    '''
+    Online power spectral density estimator with Welch's method for unbounded
+    records.
+
+    The record is given chunk by chunk. Every complete segment is detrended,
+    windowed and transformed once, and the unfinished overlap tail is kept
+    for the next chunk, so the memory does not grow with the record length.
+    With the running mean, the spectrum is the same as `scipy.signal.welch` on
+    the concatenated chunks.
+    '''
+    def __init__( self, fs, nperseg=1024, noverlap=None, window="hann", 
+                  forgetting=None ):
+        '''
+        Initialize the online Welch estimator.
+
+        Parameters
+        ----------
+        fs: scalar
+            Sampling frequency.
+        nperseg: integer, optional
+            Length of each segment. Defaults to 1024.
+        noverlap: integer, optional
+            Number of points to overlap between segments. Defaults to 
+            nperseg // 2.
+        window: string or tuple, optional
+            Window passed to `scipy.signal.get_window`. Defaults to "hann".
+        forgetting: scalar, optional
+            Forgetting factor in ( 0, 1 ) for the exponentially weighted mean 
+            of the segment periodograms, the weight of a segment is multiplied 
+            by forgetting for each newer segment. Defaults to None, the running 
+            mean of all the segments is used.
+
+        Raises
+        ------
+        ValueError
+            If fs is not a scalar or is not positive.
+            If nperseg is not an integer or is less than 1.
+            If noverlap is not an integer in [ 0, nperseg ).
+            If forgetting is not in ( 0, 1 ).
+
+        Examples
+        --------
+        >>> from ffpack.lsm import OnlineWelch
+        >>> onlineWelch = OnlineWelch( 2000, nperseg=1024 )
+        '''
+        if not isinstance( fs, int ) and not isinstance( fs, float ):
+            raise ValueError( "fs should be a scalar" )
+        if fs <= 0:
+            raise ValueError( "fs should be positive" )
+        if not isinstance( nperseg, int ) or nperseg < 1:
+            raise ValueError( "nperseg should be an int and at least 1" )
+        if noverlap is None:
+            noverlap = nperseg // 2
+        if not isinstance( noverlap, int ) or noverlap < 0 or noverlap >= nperseg:
+            raise ValueError( "noverlap should be an int in [ 0, nperseg )" )
+        if forgetting is not None and not 0 < forgetting < 1:
+            raise ValueError( "forgetting should be in ( 0, 1 )" )
+
+        self.fs = fs
+        self.nperseg = nperseg
+        self.step = nperseg - noverlap
+        self.window = signal.get_window( window, nperseg )
+        self.scale = 1.0 / ( fs * np.sum( self.window * self.window ) )
+        self.forgetting = forgetting
+        self.freq = np.fft.rfftfreq( nperseg, 1 / fs )
+        self.tail = np.zeros( 0 )
+        self.accumulated = np.zeros( len( self.freq ) )
+        self.totalWeight = 0.0
+        self.numSegments = 0
+
+    def update( self, data ):
+        '''
+        Add the next chunk of the record.
+
+        Parameters
+        ----------
+        data: 1darray
+            Next chunk of the record in any length.
+
+        Raises
+        ------
+        ValueError
+            If data is not a 1darray.
+
+        Examples
+        --------
+        >>> onlineWelch.update( data )
+        '''
+        data = np.asarray( data, dtype=float )
+        if len( data.shape ) != 1:
+            raise ValueError( "Input data dimension should be 1" )
+
+        buffer = np.concatenate( [ self.tail, data ] )
+        if len( buffer ) < self.nperseg:
+            self.tail = buffer
+            return
+        periodograms = _segmentPeriodograms( 
+            _overlappedSegments( buffer, self.nperseg, self.step ), 
+            self.window, self.scale )
+        numNew = periodograms.shape[ 0 ]
+        if self.forgetting is None:
+            self.accumulated += np.sum( periodograms, axis=0 )
+            self.totalWeight += numNew
+        else:
+            weights = np.power( self.forgetting, np.arange( numNew - 1, -1, -1 ) )
+            decay = np.power( self.forgetting, numNew )
+            self.accumulated = decay * self.accumulated + weights @ periodograms
+            self.totalWeight = decay * self.totalWeight + np.sum( weights )
+        self.numSegments += numNew
+        self.tail = buffer[ numNew * self.step: ].copy()
+
+    def getSpectrum( self ):
+        '''
+        Get the current power spectral density.
+
+        Returns
+        -------
+        freq: 1darray
+            frequency components.
+        psd: 1darray
+            Power spectral density averaged over the segments so far.
+
+        Raises
+        ------
+        ValueError
+            If no complete segment has been added.
+
+        Examples
+        --------
+        >>> freq, psd = onlineWelch.getSpectrum()
+        '''
+        if self.numSegments == 0:
+            raise ValueError( "at least one complete segment should be added" )
+        return self.freq.copy(), self.accumulated / self.totalWeight
+
+
+def welchCsdMatrix( data, fs, nperseg=1024, noverlap=None, window="hann", 
+                    chunkSize=256 ):
+    '''
+    Cross-spectral density matrix of multi-channel data with Welch's method.
+
+    The segment FFTs of each channel are computed once, and all the channel 
+    pairs are formed together with one batched einsum per chunk of segments, 
+    so csd[ :, i, j ] is the same as `scipy.signal.csd( data[ :, i ], 
+    data[ :, j ], fs )` with the same segments.
+
+    Parameters
+    ----------
+    data: 2darray
+        Multi-channel sequence in dimension of n by m, where m is the number of 
+        channels.
+    fs: scalar
+        Sampling frequency.
+    nperseg: integer, optional
+        Length of each segment. Defaults to 1024. If nperseg is larger than n, 
+        n is used.
+    noverlap: integer, optional
+        Number of points to overlap between segments. Defaults to nperseg // 2.
+    window: string or tuple, optional
+        Window passed to `scipy.signal.get_window`. Defaults to "hann".
+    chunkSize: integer, optional
+        Number of segments transformed at the same time to bound the memory, 
+        which is proportional to chunkSize * nperseg * m.
+
+    Returns
+    -------
+    freq: 1darray
+        frequency components.
+    csd: 3darray
+        One-sided cross-spectral density matrices in dimension of nfreq by m 
+        by m, csd[ :, i, j ] is the cross-spectral density of channel i and 
+        channel j, and the diagonal is the power spectral density.
+
+    Raises
+    ------
+    ValueError
+        If data is not a 2darray or has less than 2 rows or 1 column.
+        If fs is not a scalar or is not positive.
+        If nperseg is not an integer or is less than 1.
+        If noverlap is not an integer in [ 0, nperseg ).
+        If chunkSize is not an integer or is less than 1.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from ffpack.lsm import welchCsdMatrix
+    >>> data = np.random.default_rng( 2023 ).normal( size=( 10000, 3 ) )
+    >>> freq, csd = welchCsdMatrix( data, 100, nperseg=256 )
+    '''
+    data = np.array( data, dtype=float )
+    if len( data.shape ) != 2:
+        raise ValueError( "Input data dimension should be 2" )
+    if data.shape[ 0 ] < 2 or data.shape[ 1 ] < 1:
+        raise ValueError( "Input data should have at least 2 rows and 1 column" )
+    if not isinstance( fs, int ) and not isinstance( fs, float ):
+        raise ValueError( "fs should be a scalar" )
+    if fs <= 0:
+        raise ValueError( "fs should be positive" )
+    if not isinstance( nperseg, int ) or nperseg < 1:
+        raise ValueError( "nperseg should be an int and at least 1" )
+    nperseg = min( nperseg, data.shape[ 0 ] )
+    if noverlap is None:
+        noverlap = nperseg // 2
+    if not isinstance( noverlap, int ) or noverlap < 0 or noverlap >= nperseg:
+        raise ValueError( "noverlap should be an int in [ 0, nperseg )" )
+    if not isinstance( chunkSize, int ) or chunkSize < 1:
+        raise ValueError( "chunkSize should be an int and at least 1" )
+
+    win = signal.get_window( window, nperseg )
+    scale = 1.0 / ( fs * np.sum( win * win ) )
+    segments = _overlappedSegments( np.ascontiguousarray( data.T ), nperseg, 
+                                    nperseg - noverlap )
+    numSegments = segments.shape[ 1 ]
+    csd = np.zeros( ( nperseg // 2 + 1, data.shape[ 1 ], data.shape[ 1 ] ), 
+                    dtype=complex )
+    for start in range( 0, numSegments, chunkSize ):
+        spectra = _segmentSpectra( segments[ :, start: start + chunkSize ], win )
+        csd += np.einsum( "isf,jsf->fij", np.conj( spectra ), spectra )
+    csd *= ( scale / numSegments ) * _oneSidedFactors( nperseg )[ :, None, None ]
+    return np.fft.rfftfreq( nperseg, 1 / fs ), csd
+
+
+def coherenceMatrix( csd ):
+    '''
+    Magnitude squared coherence matrix from a cross-spectral density matrix.
+
+    Parameters
+    ----------
+    csd: 3darray
+        Cross-spectral density matrices in dimension of nfreq by m by m, e.g., 
+        from welchCsdMatrix.
+
+    Returns
+    -------
+    rst: 3darray
+        Coherence |csd[ :, i, j ]|^2 / ( csd[ :, i, i ] csd[ :, j, j ] ) in 
+        dimension of nfreq by m by m. Frequencies where a channel has zero 
+        power give zero coherence.
+
+    Raises
+    ------
+    ValueError
+        If csd is not in dimension of nfreq by m by m.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from ffpack.lsm import welchCsdMatrix, coherenceMatrix
+    >>> data = np.random.default_rng( 2023 ).normal( size=( 10000, 3 ) )
+    >>> freq, csd = welchCsdMatrix( data, 100, nperseg=256 )
+    >>> rst = coherenceMatrix( csd )
+    '''
+    csd = np.asarray( csd )
+    if len( csd.shape ) != 3 or csd.shape[ 1 ] != csd.shape[ 2 ]:
+        raise ValueError( "csd should be in dimension of nfreq by m by m" )
+
+    power = np.real( np.diagonal( csd, axis1=1, axis2=2 ) )
+    denominator = power[ :, :, None ] * power[ :, None, : ]
+    numerator = np.square( np.abs( csd ) )
+    return np.divide( numerator, denominator, out=np.zeros( numerator.shape ),
+                      where=denominator > 0 )
+
+
+def spectrogramSpectrum( data, fs, nperseg=256, noverlap=None, window="hann", 
+                         orders=( 0, 1, 2, 4 ), chunkSize=1024, out=None ):
+    '''
+    Short-time power spectral densities and spectral moments of sliding windows.
+
+    The windows are strided views of the data, and each chunk of windows is 
+    transformed with one batched FFT, so the psd of each window is the same as 
+    `scipy.signal.spectrogram` with the same window and overlap.
+
+    Parameters
+    ----------
+    data: 1darray
+        Sequence to calculate the short-time power spectral densities.
+    fs: scalar
+        Sampling frequency.
+    nperseg: integer, optional
+        Length of each window. Defaults to 256.
+    noverlap: integer, optional
+        Number of points to overlap between windows. Defaults to nperseg // 2.
+    window: string or tuple, optional
+        Window passed to `scipy.signal.get_window`. Defaults to "hann".
+    orders: 1d array, optional
+        Orders of the spectral moments of each window.
+    chunkSize: integer, optional
+        Number of windows transformed at the same time to bound the memory.
+    out: string or 2darray, optional
+        Output for the psd in dimension of nwin by nfreq. If out is a string, a 
+        memory-mapped .npy file is created at this path. If out is an array, 
+        e.g., a numpy.memmap, the psd is written into it. The psd is written 
+        chunk by chunk, so the full spectrogram never needs to be in memory. 
+        Defaults to None, a new array is returned.
+
+    Returns
+    -------
+    times: 1darray
+        Times of the window centers.
+    freq: 1darray
+        frequency components.
+    psd: 2darray
+        Power spectral density of each window in dimension of nwin by nfreq, 
+        the memory-mapped array if out is given.
+    moments: 2darray
+        Spectral moments of each window in dimension of nwin by len( orders ).
+
+    Raises
+    ------
+    ValueError
+        If data is not a 1darray or is shorter than nperseg.
+        If fs is not a scalar or is not positive.
+        If nperseg is not an integer or is less than 1.
+        If noverlap is not an integer in [ 0, nperseg ).
+        If chunkSize is not an integer or is less than 1.
+        If out is an array not in dimension of nwin by nfreq.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from ffpack.lsm import spectrogramSpectrum
+    >>> data = np.random.default_rng( 2023 ).normal( size=100000 )
+    >>> times, freq, psd, moments = spectrogramSpectrum( data, 100, nperseg=512 )
+    '''
+    data = np.asarray( data, dtype=float )
+    if len( data.shape ) != 1:
+        raise ValueError( "Input data dimension should be 1" )
+    if not isinstance( fs, int ) and not isinstance( fs, float ):
+        raise ValueError( "fs should be a scalar" )
+    if fs <= 0:
+        raise ValueError( "fs should be positive" )
+    if not isinstance( nperseg, int ) or nperseg < 1:
+        raise ValueError( "nperseg should be an int and at least 1" )
+    if data.shape[ 0 ] < nperseg:
+        raise ValueError( "Input data length should be at least nperseg" )
+    if noverlap is None:
+        noverlap = nperseg // 2
+    if not isinstance( noverlap, int ) or noverlap < 0 or noverlap >= nperseg:
+        raise ValueError( "noverlap should be an int in [ 0, nperseg )" )
+    if not isinstance( chunkSize, int ) or chunkSize < 1:
+        raise ValueError( "chunkSize should be an int and at least 1" )
+
+    step = nperseg - noverlap
+    win = signal.get_window( window, nperseg )
+    scale = 1.0 / ( fs * np.sum( win * win ) )
+    segments = _overlappedSegments( np.ascontiguousarray( data ), nperseg, step )
+    numWindows = segments.shape[ 0 ]
+    freq = np.fft.rfftfreq( nperseg, 1 / fs )
+    times = ( np.arange( numWindows ) * step + nperseg / 2 ) / fs
+
+    shape = ( numWindows, len( freq ) )
+    if out is None:
+        psd = np.empty( shape )
+    elif isinstance( out, str ):
+        psd = np.lib.format.open_memmap( out, mode="w+", dtype=float, shape=shape )
+    else:
+        psd = out
+        if tuple( psd.shape ) != shape:
+            raise ValueError( "out should be in dimension of nwin by nfreq" )
+
+    orders = np.array( orders, dtype=float )
+    weights = _trapezoidWeights( freq )[ :, None ] * np.power( freq[ :, None ], orders )
+    moments = np.empty( ( numWindows, len( orders ) ) )
+    for start in range( 0, numWindows, chunkSize ):
+        block = slice( start, start + chunkSize )
+        periodograms = _segmentPeriodograms( segments[ block ], win, scale )
+        psd[ block ] = periodograms
+        moments[ block ] = periodograms @ weights
+    if isinstance( psd, np.memmap ):
+        psd.flush()
+    return times, freq, psd, moments
@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+
+from collections import OrderedDict
+import numpy as np
+
+
+def _checkFreqPsd( freq, psd ):
+    # Check the frequencies are a 1d array and the psd has them on the last axis
+    freq = np.array( freq, dtype=float )
+    psd = np.asarray( psd, dtype=float )
+    if len( freq.shape ) != 1 or freq.shape[ 0 ] < 2:
+        raise ValueError( "freq should be a 1darray with at least 2 elements" )
+    if np.any( np.diff( freq ) <= 0 ):
+        raise ValueError( "freq should be increasing" )
+    if len( psd.shape ) < 1 or psd.shape[ -1 ] != freq.shape[ 0 ]:
+        raise ValueError( "last dimension of psd should match the length of freq" )
+    return freq, psd
+
+
+def _trapezoidWeights( freq ):
+    # Weights so that weights @ y equals np.trapz( y, freq )
+    df = np.diff( freq )
+    weights = np.zeros( len( freq ) )
+    weights[ : -1 ] += df / 2
+    weights[ 1: ] += df / 2
+    return weights
+
+
+def _arrayKey( value ):
+    # Hashable key for scalar or array parameters
+    value = np.asarray( value )
+    return ( value.dtype.str, value.shape, value.tobytes() )
+
+
+class SpectralMoments:
+    '''
+    Spectral moments and bandwidth parameters of power spectral densities.
+
+    All the moments are computed in one weighted pass over the frequencies, i.e.,
+    a matrix product of the psd with the trapezoid weights times the powers of
+    the frequencies, so a batch of psd on the same frequencies is evaluated at
+    once. The results for parametric spectra are memoized on the spectrum, the
+    frequencies and the spectrum parameters.
+    '''
+    _bandwidthOrders = ( 0, 1, 2, 4 )
+
+    def __init__( self, orders=( 0, 1, 2, 4 ), maxCacheSize=128 ):
+        '''
+        Initialize the spectral moments engine.
+
+        Parameters
+        ----------
+        orders: 1d array, optional
+            Orders of the spectral moments returned by getMoments.
+        maxCacheSize: integer, optional
+            Maximum number of parametric spectrum results kept in the cache. The
+            least recently used results are dropped first.
+
+        Raises
+        ------
+        ValueError
+            If the orders is empty or contains negative elements.
+            If the maxCacheSize is not an integer or is less than 0.
+
+        Examples
+        --------
+        >>> from ffpack.lsm import SpectralMoments
+        >>> spectralMoments = SpectralMoments( orders=[ 0, 2, 4 ] )
+        '''
+        orders = np.array( orders, dtype=float )
+        if len( orders.shape ) != 1 or orders.shape[ 0 ] < 1:
+            raise ValueError( "orders should be a 1darray with at least 1 element" )
+        if np.any( orders < 0 ):
+            raise ValueError( "orders should not contain negative elements" )
+        if not isinstance( maxCacheSize, int ) or maxCacheSize < 0:
+            raise ValueError( "maxCacheSize should be an int and at least 0" )
+
+        self.orders = orders
+        # The bandwidth orders are always computed in the same pass
+        self.allOrders = np.union1d( orders, self._bandwidthOrders )
+        self.orderIndex = np.searchsorted( self.allOrders, orders )
+        self.bandwidthIndex = np.searchsorted( self.allOrders, self._bandwidthOrders )
+        self.maxCacheSize = maxCacheSize
+        self.cache = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def _allMoments( self, freq, psd ):
+        freq, psd = _checkFreqPsd( freq, psd )
+        weights = _trapezoidWeights( freq )[ :, None ] * \
+            np.power( freq[ :, None ], self.allOrders )
+        return psd @ weights
+
+    def _bandwidthParameters( self, allMoments ):
+        return self.getBandwidthParametersFromMoments( allMoments[ ..., self.bandwidthIndex ] )
+
+    def getBandwidthParametersFromMoments( self, moments ):
+        '''
+        Calculate the bandwidth parameters from the moments m0, m1, m2, m4.
+
+        Parameters
+        ----------
+        moments: nd array
+            Spectral moments of the orders 0, 1, 2, 4 on the last axis, e.g.,
+            the result of getMoments with orders=[ 0, 1, 2, 4 ].
+
+        Returns
+        -------
+        rst: dict
+            Arrays in the shape of moments without the last axis for the same
+            keys as getBandwidthParameters.
+
+        Raises
+        ------
+        ValueError
+            If the last dimension of moments is not 4.
+
+        Examples
+        --------
+        >>> from ffpack.lsm import SpectralMoments, welchSpectrum
+        >>> data = [ 2, 5, 3, 6, 2, 4, 1, 6, 1, 3, 1, 5, 3, 6, 3, 6, 4, 5, 2 ]
+        >>> freq, psd = welchSpectrum( data, 2 )
+        >>> moments = SpectralMoments().getMoments( freq, psd )
+        >>> rst = SpectralMoments().getBandwidthParametersFromMoments( moments )
+        '''
+        moments = np.asarray( moments, dtype=float )
+        if len( moments.shape ) < 1 or moments.shape[ -1 ] != len( self._bandwidthOrders ):
+            raise ValueError( "last dimension of moments should be 4 for m0, m1, m2, m4" )
+        m0, m1, m2, m4 = np.moveaxis( moments, -1, 0 )
+        irregularityFactor = m2 / np.sqrt( m0 * m4 )
+        return { "m0": m0, "m1": m1, "m2": m2, "m4": m4,
+                 "alpha1": m1 / np.sqrt( m0 * m2 ),
+                 "irregularityFactor": irregularityFactor,
+                 "spectralWidth": np.sqrt( np.maximum( 1 - irregularityFactor ** 2, 0 ) ),
+                 "zeroCrossingRate": np.sqrt( m2 / m0 ),
+                 "peakRate": np.sqrt( m4 / m2 ) }
+
+    def getMoments( self, freq, psd ):
+        '''
+        Calculate the spectral moments of the orders given at initialization.
+
+        Parameters
+        ----------
+        freq: 1darray
+            Increasing frequencies of the psd.
+        psd: nd array
+            Power spectral density with the frequencies on the last axis, e.g., a
+            2d ( spectra by frequencies ) matrix for a batch of spectra.
+
+        Returns
+        -------
+        rst: nd array
+            Spectral moments with the orders on the last axis, i.e.,
+            rst[ ..., i ] = integral of freq^orders[ i ] * psd over freq.
+
+        Raises
+        ------
+        ValueError
+            If the freq is not a 1darray with at least 2 elements.
+            If the freq is not increasing.
+            If the last dimension of psd does not match the length of freq.
+
+        Examples
+        --------
+        >>> from ffpack.lsm import SpectralMoments, welchSpectrum
+        >>> data = [ 2, 5, 3, 6, 2, 4, 1, 6, 1, 3, 1, 5, 3, 6, 3, 6, 4, 5, 2 ]
+        >>> freq, psd = welchSpectrum( data, 2 )
+        >>> rst = SpectralMoments().getMoments( freq, psd )
+        '''
+        return self._allMoments( freq, psd )[ ..., self.orderIndex ]
+
+    def getBandwidthParameters( self, freq, psd ):
+        '''
+        Calculate the moments m0, m1, m2, m4 and the bandwidth parameters.
+
+        The rates are in cycles per unit time when freq is in Hz. For angular
+        frequencies the rates are in radians per unit time.
+
+        Parameters
+        ----------
+        freq: 1darray
+            Increasing frequencies of the psd.
+        psd: nd array
+            Power spectral density with the frequencies on the last axis.
+
+        Returns
+        -------
+        rst: dict
+            Arrays in the shape of psd without the last axis for the keys
+            m0, m1, m2, m4, alpha1 ( m1 / sqrt( m0 * m2 ) ), irregularityFactor
+            ( m2 / sqrt( m0 * m4 ) ), spectralWidth ( sqrt( 1 -
+            irregularityFactor^2 ) ), zeroCrossingRate ( sqrt( m2 / m0 ) ) and
+            peakRate ( sqrt( m4 / m2 ) ).
+
+        Raises
+        ------
+        ValueError
+            If the freq is not a 1darray with at least 2 elements.
+            If the freq is not increasing.
+            If the last dimension of psd does not match the length of freq.
+
+        Examples
+        --------
+        >>> from ffpack.lsm import SpectralMoments, welchSpectrum
+        >>> data = [ 2, 5, 3, 6, 2, 4, 1, 6, 1, 3, 1, 5, 3, 6, 3, 6, 4, 5, 2 ]
+        >>> freq, psd = welchSpectrum( data, 2 )
+        >>> rst = SpectralMoments().getBandwidthParameters( freq, psd )
+        >>> irregularityFactor = rst[ "irregularityFactor" ]
+        '''
+        return self._bandwidthParameters( self._allMoments( freq, psd ) )
+
+    def _cachedMoments( self, spectrum, freq, args, kwargs ):
+        # Memoized moments of all orders for a parametric spectrum, the callers
+        # only return copies so the cached arrays are never modified
+        key = ( spectrum, _arrayKey( np.asarray( freq, dtype=float ) ),
+                tuple( _arrayKey( arg ) for arg in args ),
+                tuple( ( k, _arrayKey( v ) ) for k, v in sorted( kwargs.items() ) ) )
+        if key in self.cache:
+            self.hits += 1
+            self.cache.move_to_end( key )
+            return self.cache[ key ]
+        self.misses += 1
+        allMoments = self._allMoments( freq, spectrum( freq, *args, **kwargs ) )
+        if self.maxCacheSize > 0:
+            self.cache[ key ] = allMoments
+            if len( self.cache ) > self.maxCacheSize:
+                self.cache.popitem( last=False )
+        return allMoments
+
+    def getParametricMoments( self, spectrum, freq, *args, **kwargs ):
+        '''
+        Calculate the spectral moments of a parametric spectrum with memoization.
+
+        Parameters
+        ----------
+        spectrum: function
+            Parametric spectrum called as spectrum( freq, \\*args, \\*\\*kwargs ),
+            e.g., jonswapSpectrum or iecSpectrum.
+        freq: 1darray
+            Increasing frequencies to evaluate the spectrum.
+        args, kwargs: scalar or array
+            Parameters of the spectrum. Arrays broadcast against freq give a
+            batch of spectra, e.g., wp[ :, None ] for a set of sea states.
+
+        Returns
+        -------
+        rst: nd array
+            Spectral moments with the orders on the last axis.
+
+        Raises
+        ------
+        ValueError
+            If the freq is not a 1darray with at least 2 elements.
+            If the freq is not increasing.
+            If the spectrum does not broadcast to the length of freq.
+
+        Examples
+        --------
+        >>> import numpy as np
+        >>> from ffpack.lsm import SpectralMoments, jonswapSpectrum
+        >>> spectralMoments = SpectralMoments()
+        >>> w = np.linspace( 0.1, 3.0, 2000 )
+        >>> rst = spectralMoments.getParametricMoments( jonswapSpectrum, w, 0.5,
+        ...                                             gamma=3.3 )
+        '''
+        return self._cachedMoments( spectrum, freq, args, kwargs )[ ..., self.orderIndex ]
+
+    def getParametricBandwidthParameters( self, spectrum, freq, *args, **kwargs ):
+        '''
+        Calculate the bandwidth parameters of a parametric spectrum with
+        memoization.
+
+        Parameters
+        ----------
+        spectrum: function
+            Parametric spectrum called as spectrum( freq, \\*args, \\*\\*kwargs ).
+        freq: 1darray
+            Increasing frequencies to evaluate the spectrum.
+        args, kwargs: scalar or array
+            Parameters of the spectrum.
+
+        Returns
+        -------
+        rst: dict
+            Same keys as getBandwidthParameters.
+
+        Raises
+        ------
+        ValueError
+            If the freq is not a 1darray with at least 2 elements.
+            If the freq is not increasing.
+            If the spectrum does not broadcast to the length of freq.
+
+        Examples
+        --------
+        >>> import numpy as np
+        >>> from ffpack.lsm import SpectralMoments, jonswapSpectrum
+        >>> spectralMoments = SpectralMoments()
+        >>> w = np.linspace( 0.1, 3.0, 2000 )
+        >>> rst = spectralMoments.getParametricBandwidthParameters( jonswapSpectrum,
+        ...                                                         w, 0.5 )
+        '''
+        return self._bandwidthParameters(
+            self._cachedMoments( spectrum, freq, args, kwargs ) )
+
+    def clearCache( self ):
+        '''
+        Remove all the memoized results and reset the hit and miss counters.
+
+        Examples
+        --------
+        >>> spectralMoments.clearCache()
+        '''
+        self.cache.clear()
+        self.hits = 0
+        self.misses = 0
@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+
+'''
+Lazy response spectrum pipeline: a load spectrum, a chain of transfer functions,
+and reductions to spectral moments. The squared gains of the transfer functions
+and the trapezoid weights of all the reductions are folded into one weight
+matrix when the pipeline is first evaluated, so each load case is reduced by a
+single matrix product over the frequencies that the reductions need, and the
+response spectrum is never formed.
+'''
+
+import numpy as np
+from .spectralMoments import _checkFreqPsd, _trapezoidWeights, SpectralMoments
+
+
+class SpectralPipeline:
+    '''
+    Composable pipeline from load spectra to reductions of the response spectra.
+
+    The stages are added with addTransferFunction, addMoments and
+    addBandwidthParameters, which return the pipeline so the calls can be
+    chained. Nothing is computed until evaluate is called. The compiled weight
+    matrix is kept and reused for all the following load cases, and it is only
+    rebuilt after a stage is added.
+    '''
+
+    def __init__( self, freq, spectrum=None ):
+        '''
+        Initialize the pipeline on a frequency grid.
+
+        Parameters
+        ----------
+        freq: 1d array
+            Increasing frequencies of the load spectra.
+        spectrum: function, optional
+            Parametric load spectrum called as spectrum( freq, \\*args,
+            \\*\\*kwargs ), e.g., jonswapSpectrum. If spectrum is given, evaluate
+            takes the spectrum parameters and the spectrum is only evaluated on
+            the frequencies needed by the reductions. Default to None, evaluate
+            takes the load psd on freq.
+
+        Raises
+        ------
+        ValueError
+            If freq is not an increasing 1d array with at least 2 elements.
+            If spectrum is not callable.
+
+        Examples
+        --------
+        >>> import numpy as np
+        >>> from ffpack.lsm import SpectralPipeline, jonswapSpectrum
+        >>> w = np.linspace( 0.1, 3.0, 2000 )
+        >>> pipeline = SpectralPipeline( w, jonswapSpectrum )
+        '''
+        freq = np.array( freq, dtype=float )
+        if len( freq.shape ) != 1 or freq.shape[ 0 ] < 2:
+            raise ValueError( "freq should be a 1darray with at least 2 elements" )
+        if np.any( np.diff( freq ) <= 0 ):
+            raise ValueError( "freq should be increasing" )
+        if spectrum is not None and not callable( spectrum ):
+            raise ValueError( "spectrum should be callable" )
+        self.freq = freq
+        self.spectrum = spectrum
+        self.gain = np.ones( len( freq ) )
+        self.reductions = [ ]
+        self.weights = None
+        self.active = None
+
+    def addTransferFunction( self, transferFunction ):
+        '''
+        Append a transfer function to the chain.
+
+        Parameters
+        ----------
+        transferFunction: function or 1d array
+            Transfer function H called as transferFunction( freq ) or its values
+            on freq, real or complex. The response spectrum is multiplied by
+            |H|^2.
+
+        Returns
+        -------
+        self: SpectralPipeline
+            The pipeline for chaining.
+
+        Raises
+        ------
+        ValueError
+            If the transfer function values do not match the length of freq.
+
+        Examples
+        --------
+        >>> pipeline = pipeline.addTransferFunction(
+        ...     lambda w: 1 / ( 1 - ( w / 1.2 ) ** 2 + 0.1j * w ) )
+        '''
+        if callable( transferFunction ):
+            transferFunction = transferFunction( self.freq )
+        transferFunction = np.asarray( transferFunction )
+        if transferFunction.shape != self.freq.shape:
+            raise ValueError( "transferFunction should match the length of freq" )
+        self.gain = self.gain * np.square( np.abs( transferFunction ) )
+        self.weights = None
+        return self
+
+    def _bandMask( self, band ):
+        # Frequencies of the grid inside the band
+        if band is None:
+            return np.ones( len( self.freq ), dtype=bool )
+        if len( band ) != 2 or band[ 0 ] >= band[ 1 ]:
+            raise ValueError( "band should be in form of ( low, high ) with low < high" )
+        mask = ( self.freq >= band[ 0 ] ) & ( self.freq <= band[ 1 ] )
+        if np.count_nonzero( mask ) < 2:
+            raise ValueError( "band should contain at least 2 frequencies of freq" )
+        return mask
+
+    def addMoments( self, name, orders=( 0, 1, 2, 4 ), band=None, function=None ):
+        '''
+        Append a reduction to the spectral moments of the response spectrum.
+
+        Parameters
+        ----------
+        name: string
+            Name of the reduction in the results of evaluate.
+        orders: 1d array, optional
+            Orders of the spectral moments.
+        band: 1d array, optional
+            Frequency band in form of ( low, high ). The moments are integrated
+            over the frequencies of freq inside the band. Default to None, the
+            whole grid.
+        function: function, optional
+            Function applied to the moments array, whose last axis is the
+            orders, e.g., to convert the moments to a damage rate. Default to
+            None, the moments are returned.
+
+        Returns
+        -------
+        self: SpectralPipeline
+            The pipeline for chaining.
+
+        Raises
+        ------
+        ValueError
+            If name is already used by another reduction.
+            If orders is empty or contains negative elements.
+            If band is not in form of ( low, high ) with low < high, or it
+            contains less than 2 frequencies of freq.
+            If function is not callable.
+
+        Examples
+        --------
+        >>> pipeline = pipeline.addMoments( "moments", orders=[ 0, 2 ],
+        ...                                 band=( 0.2, 2.0 ) )
+        '''
+        if name in [ reduction[ "name" ] for reduction in self.reductions ]:
+            raise ValueError( "name {} is already used".format( name ) )
+        orders = np.array( orders, dtype=float )
+        if len( orders.shape ) != 1 or orders.shape[ 0 ] < 1:
+            raise ValueError( "orders should be a 1darray with at least 1 element" )
+        if np.any( orders < 0 ):
+            raise ValueError( "orders should not contain negative elements" )
+        if function is not None and not callable( function ):
+            raise ValueError( "function should be callable" )
+        mask = self._bandMask( band )
+        self.reductions.append( { "name": name, "orders": orders, "mask": mask,
+                                  "function": function } )
+        self.weights = None
+        return self
+
+    def addBandwidthParameters( self, name, band=None ):
+        '''
+        Append a reduction to the bandwidth parameters of the response spectrum.
+
+        Parameters
+        ----------
+        name: string
+            Name of the reduction in the results of evaluate.
+        band: 1d array, optional
+            Frequency band in form of ( low, high ). Default to None, the whole
+            grid.
+
+        Returns
+        -------
+        self: SpectralPipeline
+            The pipeline for chaining.
+
+        Raises
+        ------
+        ValueError
+            If name is already used by another reduction.
+            If band is not in form of ( low, high ) with low < high, or it
+            contains less than 2 frequencies of freq.
+
+        Examples
+        --------
+        >>> pipeline = pipeline.addBandwidthParameters( "bandwidth" )
+        '''
+        return self.addMoments( name, ( 0, 1, 2, 4 ), band,
+                                SpectralMoments().getBandwidthParametersFromMoments )
+
+    def _compile( self ):
+        # Fold the gains and the trapezoid weights of all the reductions into one
+        # weight matrix restricted to the rows with nonzero weights
+        if len( self.reductions ) == 0:
+            raise ValueError( "pipeline should contain at least 1 reduction" )
+        columns = [ ]
+        for reduction in self.reductions:
+            mask = reduction[ "mask" ]
+            bandWeights = np.zeros( len( self.freq ) )
+            bandWeights[ mask ] = _trapezoidWeights( self.freq[ mask ] )
+            columns.append( ( bandWeights * self.gain )[ :, None ] *
+                            np.power( self.freq[ :, None ], reduction[ "orders" ] ) )
+        weights = np.concatenate( columns, axis=1 )
+        # Keep the first row if all the weights are zero, so the load spectrum
+        # is still evaluated to give the batch shape
+        rows = np.append( np.nonzero( np.any( weights != 0, axis=1 ) )[ 0 ], 0 )
+        self.active = slice( rows[ 0 ], max( rows[ -2: ] ) + 1 )
+        self.weights = np.ascontiguousarray( weights[ self.active ] )
+
+    def evaluate( self, *args, out=None, **kwargs ):
+        '''
+        Evaluate the reductions of the response spectrum for a load case.
+
+        Parameters
+        ----------
+        args, kwargs: array or scalar
+            If the pipeline has a spectrum, the parameters of the spectrum.
+            Arrays broadcast against freq give a batch of load cases, e.g.,
+            wp[ :, None ]. Otherwise the load psd with the frequencies of freq on
+            the last axis as the only positional argument.
+        out: nd array, optional
+            Float array to write the moments of all the reductions into, in the
+            shape of the batch dimensions plus the total number of orders of
+            the reductions, so repeated evaluations can reuse one buffer. The
+            moments in the results are views of out. Default to None, a new
+            array is allocated for each call and only the compiled weight
+            matrix is reused.
+
+        Returns
+        -------
+        rst: dict
+            Results of the reductions by name. The moments have the orders on
+            the last axis and the batch dimensions of the load psd before it.
+
+        Raises
+        ------
+        ValueError
+            If the pipeline contains no reduction.
+            If the last dimension of the load psd does not match the length of
+            freq.
+            If out is not a float array in the shape of the moments.
+
+        Examples
+        --------
+        >>> import numpy as np
+        >>> from ffpack.lsm import SpectralPipeline, jonswapSpectrum
+        >>> w = np.linspace( 0.1, 3.0, 2000 )
+        >>> pipeline = SpectralPipeline( w, jonswapSpectrum )
+        >>> pipeline = pipeline.addTransferFunction(
+        ...     lambda w: 1 / ( 1 - ( w / 1.2 ) ** 2 + 0.1j * w ) )
+        >>> pipeline = pipeline.addMoments( "moments", orders=[ 0, 2 ] )
+        >>> rst = pipeline.evaluate( np.array( [ 0.4, 0.5, 0.6 ] )[ :, None ], gamma=2.0 )
+        >>> moments = rst[ "moments" ]
+        >>> out = np.empty( ( 3, 2 ) )
+        >>> rst = pipeline.evaluate( np.array( [ 0.4, 0.5, 0.6 ] )[ :, None ], out=out )
+        '''
+        if self.weights is None:
+            self._compile()
+        if self.spectrum is None:
+            if len( args ) != 1 or len( kwargs ) != 0:
+                raise ValueError( "psd should be the only input without spectrum" )
+            _, psd = _checkFreqPsd( self.freq, args[ 0 ] )
+            psd = psd[ ..., self.active ]
+        else:
+            psd = np.asarray( self.spectrum( self.freq[ self.active ], *args, **kwargs ),
+                              dtype=float )
+            psd = np.broadcast_to( psd, psd.shape[ : -1 ] + ( self.weights.shape[ 0 ], ) )
+
+        shape = psd.shape[ : -1 ] + ( self.weights.shape[ 1 ], )
+        if out is not None and ( not isinstance( out, np.ndarray ) or out.shape != shape or
+                                 out.dtype != np.float64 ):
+            raise ValueError( "out should be a float array in the shape of {}".format( shape ) )
+        allMoments = np.matmul( psd, self.weights, out=out )
+        rst = { }
+        start = 0
+        for reduction in self.reductions:
+            end = start + len( reduction[ "orders" ] )
+            moments = allMoments[ ..., start: end ]
+            if reduction[ "function" ] is not None:
+                moments = reduction[ "function" ]( moments )
+            rst[ reduction[ "name" ] ] = moments
+            start = end
+        return rst
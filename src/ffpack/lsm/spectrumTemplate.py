@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+
+'''
+Parametric wave spectra bound to a fixed frequency grid for repeated evaluation,
+e.g., in optimization loops. The powers of the frequencies are computed once per
+grid, the terms that depend only on the peak parameters are kept for the most
+recent peak, and the results of recent parameter sets are memoized.
+'''
+
+from collections import OrderedDict
+import numpy as np
+
+
+# Parameter names and default values of the supported spectra in the order of
+# the positional arguments, None for the required parameters. The shape
+# parameters are the ones the expensive exponential terms depend on.
+_templateSpectra = {
+    "piersonMoskowitz": { "names": ( "Uw", "alpha", "beta", "g" ),
+                          "defaults": ( None, 0.0081, 0.74, 9.81 ),
+                          "shapeNames": ( "Uw", "beta", "g" ) },
+    "jonswap": { "names": ( "wp", "alpha", "beta", "gamma", "g" ),
+                 "defaults": ( None, 0.0081, 1.25, 3.3, 9.81 ),
+                 "shapeNames": ( "wp", "beta" ) },
+    "issc": { "names": ( "wp", "Hs" ),
+              "defaults": ( None, None ),
+              "shapeNames": ( "wp", ) },
+    "gaussianSwell": { "names": ( "wp", "Hs", "sigma" ),
+                       "defaults": ( None, None, None ),
+                       "shapeNames": ( "wp", "sigma" ) },
+}
+
+
+class SpectrumTemplate:
+    '''
+    Parametric wave spectrum on a fixed frequency grid.
+
+    The spectrum values are the same as the functions piersonMoskowitzSpectrum,
+    jonswapSpectrum, isscSpectrum and gaussianSwellSpectrum evaluated on the
+    grid with scalar parameters. Each spectrum is split into a shape, which
+    contains the exponential terms of the peak parameters, and a scale. The
+    shape of the most recent peak parameters is kept, so changing only the
+    scale parameters, e.g., alpha or Hs, costs one multiplication per frequency,
+    and changing gamma of the JONSWAP spectrum costs one exponential per
+    frequency.
+    '''
+
+    def __init__( self, w, spectrum="jonswap", maxCacheSize=128 ):
+        '''
+        Bind a frequency grid and a spectrum type.
+
+        Parameters
+        ----------
+        w: 1d array
+            Positive wave frequencies.
+        spectrum: string, optional
+            Spectrum type, "piersonMoskowitz", "jonswap", "issc" or
+            "gaussianSwell".
+        maxCacheSize: integer, optional
+            Maximum number of parameter sets whose results are kept in the cache.
+            The least recently used results are dropped first.
+
+        Raises
+        ------
+        ValueError
+            If w is not a nonempty 1d array or contains non-positive elements.
+            If spectrum is not a supported spectrum type.
+            If maxCacheSize is not an integer or is less than 0.
+
+        Examples
+        --------
+        >>> import numpy as np
+        >>> from ffpack.lsm import SpectrumTemplate
+        >>> w = np.linspace( 0.1, 3.0, 2000 )
+        >>> template = SpectrumTemplate( w, "jonswap" )
+        '''
+        w = np.array( w, dtype=float )
+        if len( w.shape ) != 1 or w.shape[ 0 ] < 1:
+            raise ValueError( "w should be a 1d array with at least 1 element" )
+        if np.any( w <= 0 ):
+            raise ValueError( "w should be positive" )
+        if spectrum not in _templateSpectra:
+            raise ValueError( "spectrum should be one of {}".format(
+                ", ".join( _templateSpectra ) ) )
+        if not isinstance( maxCacheSize, int ) or maxCacheSize < 0:
+            raise ValueError( "maxCacheSize should be an int and at least 0" )
+
+        self.w = w
+        self.spectrum = spectrum
+        self.maxCacheSize = maxCacheSize
+        self.cache = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+        # Parameter independent terms of the grid
+        self.invW4 = np.power( w, -4 )
+        self.invW5 = self.invW4 / w
+        self.shapeKey = None
+        self.shape = None
+
+    def _bindParameters( self, args, kwargs ):
+        # Match the positional and keyword parameters to the parameter names
+        names = _templateSpectra[ self.spectrum ][ "names" ]
+        defaults = _templateSpectra[ self.spectrum ][ "defaults" ]
+        if len( args ) > len( names ):
+            raise ValueError( "too many parameters for {}".format( self.spectrum ) )
+        params = dict( zip( names, defaults ) )
+        params.update( zip( names, args ) )
+        for name, value in kwargs.items():
+            if name not in params:
+                raise ValueError( "{} is not a parameter of {}".format(
+                    name, self.spectrum ) )
+            if name in names[ : len( args ) ]:
+                raise ValueError( "{} is given twice".format( name ) )
+            params[ name ] = value
+        for name in names:
+            if params[ name ] is None:
+                raise ValueError( "{} is required for {}".format( name, self.spectrum ) )
+            value = np.asarray( params[ name ], dtype=float )
+            if value.shape != ( ):
+                raise ValueError( "{} should be a scalar".format( name ) )
+            params[ name ] = float( value )
+        return params
+
+    def _computeShape( self, params ):
+        # Exponential terms of the shape parameters
+        w = self.w
+        if self.spectrum == "piersonMoskowitz":
+            peak4 = np.power( params[ "g" ] / params[ "Uw" ], 4 )
+            return ( self.invW5 * np.exp( -params[ "beta" ] * peak4 * self.invW4 ), )
+        if self.spectrum == "jonswap":
+            wp = params[ "wp" ]
+            base = self.invW5 * np.exp( -params[ "beta" ] * np.power( wp, 4 ) * self.invW4 )
+            sigma = np.where( w > wp, 0.09, 0.07 )
+            r = np.exp( -( w - wp ) * ( w - wp ) / ( 2 * wp * wp * sigma * sigma ) )
+            return ( base, r )
+        if self.spectrum == "issc":
+            wp4 = np.power( params[ "wp" ], 4 )
+            return ( wp4 * self.invW5 * np.exp( -1.25 * wp4 * self.invW4 ), )
+        pexp = np.power( ( w - params[ "wp" ] ) / ( 2 * np.pi * params[ "sigma" ] ), 2 ) / 2
+        return ( np.exp( -pexp ), )
+
+    def _scale( self, params ):
+        # Scalar factor multiplying the shape
+        if self.spectrum in [ "piersonMoskowitz", "jonswap" ]:
+            return params[ "alpha" ] * params[ "g" ] * params[ "g" ]
+        if self.spectrum == "issc":
+            return 5 / 16 * params[ "Hs" ] * params[ "Hs" ]
+        return params[ "Hs" ] * params[ "Hs" ] / \
+            ( 16 * params[ "sigma" ] * np.power( 2 * np.pi, 1.5 ) )
+
+    def _evaluate( self, params, out ):
+        # Combine the shape and the scale into out without temporaries
+        shapeNames = _templateSpectra[ self.spectrum ][ "shapeNames" ]
+        shapeKey = tuple( params[ name ] for name in shapeNames )
+        if shapeKey != self.shapeKey:
+            self.shape = self._computeShape( params )
+            self.shapeKey = shapeKey
+        if self.spectrum == "jonswap" and params[ "gamma" ] != 1.0:
+            base, r = self.shape
+            np.multiply( r, np.log( params[ "gamma" ] ), out=out )
+            np.exp( out, out=out )
+            out *= base
+            out *= self._scale( params )
+        else:
+            np.multiply( self.shape[ 0 ], self._scale( params ), out=out )
+
+    def evaluate( self, *args, out=None, **kwargs ):
+        '''
+        Evaluate the spectrum on the grid for a parameter set.
+
+        Parameters
+        ----------
+        args, kwargs: scalar
+            Parameters of the spectrum in the same order and with the same
+            names and defaults as the spectrum function without w, e.g.,
+            wp, alpha, beta, gamma, g for jonswapSpectrum.
+        out: 1d array, optional
+            Float array in the shape of w to write the result into, so repeated
+            evaluations can reuse one buffer. Default to a new array.
+
+        Returns
+        -------
+        rst: 1d array
+            Spectrum values on the grid, out if out is given.
+
+        Raises
+        ------
+        ValueError
+            If a parameter is unknown, given twice, missing, or not a scalar.
+            If out is not a float array in the shape of w.
+
+        Examples
+        --------
+        >>> import numpy as np
+        >>> from ffpack.lsm import SpectrumTemplate
+        >>> w = np.linspace( 0.1, 3.0, 2000 )
+        >>> template = SpectrumTemplate( w, "jonswap" )
+        >>> out = np.empty( len( w ) )
+        >>> for gamma in [ 1.0, 2.0, 3.3, 5.0 ]:
+        ...     rst = template.evaluate( 0.5, gamma=gamma, out=out )
+        '''
+        params = self._bindParameters( args, kwargs )
+        if out is None:
+            out = np.empty( self.w.shape )
+        elif not isinstance( out, np.ndarray ) or out.shape != self.w.shape or \
+                out.dtype != np.float64:
+            raise ValueError( "out should be a float array in the shape of w" )
+
+        key = tuple( params.values() )
+        if key in self.cache:
+            self.hits += 1
+            self.cache.move_to_end( key )
+            np.copyto( out, self.cache[ key ] )
+            return out
+        self.misses += 1
+        self._evaluate( params, out )
+        if self.maxCacheSize > 0:
+            self.cache[ key ] = out.copy()
+            if len( self.cache ) > self.maxCacheSize:
+                self.cache.popitem( last=False )
+        return out
+
+    def clearCache( self ):
+        '''
+        Remove all the memoized results and the kept shape, and reset the hit and
+        miss counters.
+
+        Examples
+        --------
+        >>> template.clearCache()
+        '''
+        self.cache.clear()
+        self.shapeKey = None
+        self.shape = None
+        self.hits = 0
+        self.misses = 0
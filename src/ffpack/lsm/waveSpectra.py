@@ -4,6 +4,30 @@ import numpy as np
 from scipy import special
 
 
+def _checkSpectrumInput( **inputs ):
+    # Convert the scalar or array inputs to float arrays and check that they can
+    # be broadcast together, the arrays are returned in the input order
+    arrays = [ ]
+    for name, value in inputs.items():
+        try:
+            array = np.asarray( value, dtype=float )
+        except ( TypeError, ValueError ):
+            raise ValueError( "{} should be a scalar or an array".format( name ) )
+        if array.size == 0:
+            raise ValueError( "{} should not be empty".format( name ) )
+        arrays.append( array )
+    try:
+        np.broadcast( *arrays )
+    except ValueError:
+        raise ValueError( "{} should be broadcastable".format( ", ".join( inputs ) ) )
+    return arrays
+
+
+def _spectrumResult( rst ):
+    # Return a scalar for scalar inputs and the broadcast array otherwise
+    return np.asarray( rst )[ () ]
+
+
 def piersonMoskowitzSpectrum( w, Uw, alpha=0.0081, beta=0.74, g=9.81 ):
     '''
     Pierson Moskowitz spectrum is an empirical relationship 
@@ -11,9 +35,9 @@ def piersonMoskowitzSpectrum( w, Uw, alpha=0.0081, beta=0.74, g=9.81 ):
 
     Parameters
     ----------
-    w: scalar
+    w: scalar or array
         Wave frequency.
-    Uw: scalar
+    Uw: scalar or array
         Wind speed at a height of 19.5m above the sea surface.
     alpha: scalar, optional
         Intensity of the Spectra.
@@ -25,14 +49,16 @@ def piersonMoskowitzSpectrum( w, Uw, alpha=0.0081, beta=0.74, g=9.81 ):
     
     Returns
     -------
-    rst: scalar
-        The wave spectrum density value at wave frequency w.
+    rst: scalar or array
+        The wave spectrum density value at wave frequency w. The shape is the
+        broadcast shape of the array inputs, and a scalar is returned when all
+        the inputs are scalars.
     
     Raises
     ------
     ValueError
-        If w is not a scalar.
-        If wp is not a scalar.
+        If w or Uw is not a scalar or an array, or is empty.
+        If the inputs cannot be broadcast together.
 
     Examples
     --------
@@ -42,14 +68,11 @@ def piersonMoskowitzSpectrum( w, Uw, alpha=0.0081, beta=0.74, g=9.81 ):
     >>> rst = piersonMoskowitzSpectrum( w, Uw, alpha=0.0081, 
     ...                                 beta=1.25, g=9.81 )
     '''
-    if not isinstance( w, int ) and not isinstance( w, float ):
-        raise ValueError( "w should be a scalar" )
-    if not isinstance( Uw, int ) and not isinstance( Uw, float ):
-        raise ValueError( "Uw should be a scalar" )
+    w, Uw = _checkSpectrumInput( w=w, Uw=Uw )
 
     rst = alpha * g * g / np.power( w, 5 ) * \
         np.exp( -beta * np.power( ( g / Uw ) / w, 4 ) )
-    return rst
+    return _spectrumResult( rst )
 
 
 def jonswapSpectrum( w, wp, alpha=0.0081, beta=1.25, gamma=3.3, g=9.81 ):
@@ -59,15 +82,15 @@ def jonswapSpectrum( w, wp, alpha=0.0081, beta=1.25, gamma=3.3, g=9.81 ):
 
     Parameters
     ----------
-    w: scalar
+    w: scalar or array
         Wave frequency.
-    wp: scalar
+    wp: scalar or array
         Peak wave frequency.
     alpha: scalar, optional
         Intensity of the Spectra.
     beta: scalar, optional
         Shape factor, fixed value 1.25.
-    gamma: scalar, optional
+    gamma: scalar or array, optional
         Peak enhancement factor.
     g: scalar, optional
         Acceleration due to gravity, a constant.
@@ -75,14 +98,16 @@ def jonswapSpectrum( w, wp, alpha=0.0081, beta=1.25, gamma=3.3, g=9.81 ):
     
     Returns
     -------
-    rst: scalar
-        The wave spectrum density value at wave frequency w.
+    rst: scalar or array
+        The wave spectrum density value at wave frequency w. The shape is the
+        broadcast shape of the array inputs, and a scalar is returned when all
+        the inputs are scalars.
     
     Raises
     ------
     ValueError
-        If w is not a scalar.
-        If wp is not a scalar.
+        If w, wp or gamma is not a scalar or an array, or is empty.
+        If the inputs cannot be broadcast together.
 
     Examples
     --------
@@ -90,19 +115,23 @@ def jonswapSpectrum( w, wp, alpha=0.0081, beta=1.25, gamma=3.3, g=9.81 ):
     >>> w = 0.02
     >>> wp = 0.51
     >>> rst = jonswapSpectrum( w, wp, alpha=0.0081, beta=1.25, gamma=3.3, g=9.81 )
+
+    The sea states broadcast against the frequencies, e.g., a states by
+    frequencies matrix for a scatter diagram
+
+    >>> import numpy as np
+    >>> w = np.linspace( 0.1, 3.0, 2000 )
+    >>> wp = np.array( [ 0.4, 0.5, 0.6 ] )
+    >>> gamma = np.array( [ 1.0, 2.0, 3.3 ] )
+    >>> rst = jonswapSpectrum( w, wp[ :, None ], gamma=gamma[ :, None ] )
     '''
-    if not isinstance( w, int ) and not isinstance( w, float ):
-        raise ValueError( "w should be a scalar" )
-    if not isinstance( wp, int ) and not isinstance( wp, float ):
-        raise ValueError( "wp should be a scalar" )
-
-    sigma = 0.07 
-    if ( w > wp ):
-        sigma = 0.09
+    w, wp, gamma = _checkSpectrumInput( w=w, wp=wp, gamma=gamma )
+
+    sigma = np.where( w > wp, 0.09, 0.07 )
     r = np.exp( -( w - wp ) * ( w - wp ) / ( 2 * wp * wp * sigma * sigma ) )
     rst = alpha * g * g / np.power( w, 5 ) * \
         np.exp( -beta * np.power( wp / w, 4 ) ) * np.power( gamma, r )
-    return rst
+    return _spectrumResult( rst )
 
 
 def isscSpectrum( w, wp, Hs ):
@@ -111,24 +140,25 @@ def isscSpectrum( w, wp, Hs ):
 
     Parameters
     ----------
-    w: scalar
+    w: scalar or array
         Wave frequency.
-    wp: scalar
+    wp: scalar or array
         Peak wave frequency.
-    Hs: scalar
+    Hs: scalar or array
         Significant wave height.
     
     Returns
     -------
-    rst: scalar
-        The wave spectrum density value at wave frequency w.
+    rst: scalar or array
+        The wave spectrum density value at wave frequency w. The shape is the
+        broadcast shape of the array inputs, and a scalar is returned when all
+        the inputs are scalars.
     
     Raises
     ------
     ValueError
-        If w is not a scalar.
-        If wp is not a scalar.
-        If Hs is not a scalar.
+        If w, wp or Hs is not a scalar or an array, or is empty.
+        If the inputs cannot be broadcast together.
 
     Examples
     --------
@@ -138,16 +168,11 @@ def isscSpectrum( w, wp, Hs ):
     >>> Hs = 20
     >>> rst = isscSpectrum( w, wp, Hs )
     '''
-    if not isinstance( w, int ) and not isinstance( w, float ):
-        raise ValueError( "w should be a scalar" )
-    if not isinstance( wp, int ) and not isinstance( wp, float ):
-        raise ValueError( "wp should be a scalar" )
-    if not isinstance( Hs, int ) and not isinstance( Hs, float ):
-        raise ValueError( "Hs should be a scalar" )
+    w, wp, Hs = _checkSpectrumInput( w=w, wp=wp, Hs=Hs )
     
     wwp4 = np.power( wp / w, 4 )
     rst = 5 / 16 * Hs * Hs * wwp4 / w * np.exp( -1.25 * wwp4 )
-    return rst
+    return _spectrumResult( rst )
 
 
 def gaussianSwellSpectrum( w, wp, Hs, sigma ):
@@ -157,27 +182,27 @@ def gaussianSwellSpectrum( w, wp, Hs, sigma ):
 
     Parameters
     ----------
-    w: scalar
+    w: scalar or array
         Wave frequency.
-    wp: scalar
+    wp: scalar or array
         Peak wave frequency.
-    Hs: scalar
+    Hs: scalar or array
         Significant wave height.
-    sigma: scalar
+    sigma: scalar or array
         peakedness parameter for Gaussian spectral width.
     
     Returns
     -------
-    rst: scalar
-        The wave spectrum density value at wave frequency w.
+    rst: scalar or array
+        The wave spectrum density value at wave frequency w. The shape is the
+        broadcast shape of the array inputs, and a scalar is returned when all
+        the inputs are scalars.
     
     Raises
     ------
     ValueError
-        If w is not a scalar.
-        If wp is not a scalar.
-        If Hs is not a scalar.
-        If sigma is not a scalar.
+        If w, wp, Hs or sigma is not a scalar or an array, or is empty.
+        If the inputs cannot be broadcast together.
 
     Examples
     --------
@@ -193,19 +218,12 @@ def gaussianSwellSpectrum( w, wp, Hs, sigma ):
     .. [Guidance2016A] Guidance Notes on Selecting Design Wave by Long 
        Term Stochastic Method
     '''
-    if not isinstance( w, int ) and not isinstance( w, float ):
-        raise ValueError( "w should be a scalar" )
-    if not isinstance( wp, int ) and not isinstance( wp, float ):
-        raise ValueError( "wp should be a scalar" )
-    if not isinstance( Hs, int ) and not isinstance( Hs, float ):
-        raise ValueError( "Hs should be a scalar" )
-    if not isinstance( sigma, int ) and not isinstance( sigma, float ):
-        raise ValueError( "sigma should be a scalar" )
+    w, wp, Hs, sigma = _checkSpectrumInput( w=w, wp=wp, Hs=Hs, sigma=sigma )
     
     twoPi = 2 * np.pi
     pexp = np.power( ( w - wp ) / ( twoPi * sigma ), 2 ) / 2
     rst = Hs * Hs / ( 16 * sigma * np.power( twoPi, 1.5 ) ) * np.exp( -pexp )
-    return rst
+    return _spectrumResult( rst )
 
 
 def ochiHubbleSpectrum( w, wp1, wp2, Hs1, Hs2, lambda1, lambda2 ):
@@ -215,26 +233,27 @@ def ochiHubbleSpectrum( w, wp1, wp2, Hs1, Hs2, lambda1, lambda2 ):
 
     Parameters
     ----------
-    w: scalar
+    w: scalar or array
         Wave frequency.
-    wp1, wp2: scalar
+    wp1, wp2: scalar or array
         Peak wave frequency.
-    Hs1, Hs2: scalar
+    Hs1, Hs2: scalar or array
         Significant wave height.
-    lambda1, lambda2: scalar
+    lambda1, lambda2: scalar or array
     
     Returns
     -------
-    rst: scalar
-        The wave spectrum density value at wave frequency w.
+    rst: scalar or array
+        The wave spectrum density value at wave frequency w. The shape is the
+        broadcast shape of the array inputs, and a scalar is returned when all
+        the inputs are scalars.
     
     Raises
     ------
     ValueError
-        If w is not a scalar.
-        If wp1 or wp2 is not a scalar.
-        If Hs1 or Hs2 is not a scalar.
-        If lambda1 or lambda2 is not a scalar.
+        If w, wp1, wp2, Hs1, Hs2, lambda1 or lambda2 is not a scalar or an array,
+        or is empty.
+        If the inputs cannot be broadcast together.
         If wp1 is not smaller than wp2.
 
     Notes
@@ -259,21 +278,9 @@ def ochiHubbleSpectrum( w, wp1, wp2, Hs1, Hs2, lambda1, lambda2 ):
     .. [Guidance2016B] Guidance Notes on Selecting Design Wave by Long 
        Term Stochastic Method
     '''
-    if not isinstance( w, int ) and not isinstance( w, float ):
-        raise ValueError( "w should be a scalar" )
-    if not isinstance( wp1, int ) and not isinstance( wp1, float ):
-        raise ValueError( "wp1 should be a scalar" )
-    if not isinstance( wp2, int ) and not isinstance( wp2, float ):
-        raise ValueError( "wp2 should be a scalar" )
-    if not isinstance( Hs1, int ) and not isinstance( Hs1, float ):
-        raise ValueError( "Hs1 should be a scalar" )
-    if not isinstance( Hs2, int ) and not isinstance( Hs2, float ):
-        raise ValueError( "Hs2 should be a scalar" )
-    if not isinstance( lambda1, int ) and not isinstance( lambda1, float ):
-        raise ValueError( "lambda1 should be a scalar" )
-    if not isinstance( lambda2, int ) and not isinstance( lambda2, float ):
-        raise ValueError( "lambda2 should be a scalar" )
-    if wp1 >= wp2:
+    w, wp1, wp2, Hs1, Hs2, lambda1, lambda2 = _checkSpectrumInput( 
+        w=w, wp1=wp1, wp2=wp2, Hs1=Hs1, Hs2=Hs2, lambda1=lambda1, lambda2=lambda2 )
+    if np.any( wp1 >= wp2 ):
         raise ValueError( "wp1 must be less than wp2" )
     
     def oneTerm( w, wp, Hs, lambdaVal ):
@@ -285,4 +292,4 @@ def ochiHubbleSpectrum( w, wp1, wp2, Hs1, Hs2, lambda1, lambda2 ):
         return rst
     
     rst = ( oneTerm( w, wp1, Hs1, lambda1 ) + oneTerm( w, wp2, Hs2, lambda2 ) ) / 4
-    return rst
+    return _spectrumResult( rst )
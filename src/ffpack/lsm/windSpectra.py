@@ -1,6 +1,25 @@
 #!/usr/bin/env python3
 
 import numpy as np
+from .waveSpectra import _checkSpectrumInput, _spectrumResult
+
+
+# Roughness length and minimum height for each terrain category in EC1 Table 4.1
+_ec1TerrainOptions = { 0: [ 0.003, 1 ], 
+                       1: [ 0.01, 1 ],
+                       2: [ 0.05, 2 ],
+                       3: [ 0.3, 5 ],
+                       4: [ 1.0, 10 ] }
+
+# Standard deviation and integral scale factors for each IEC velocity component
+_iecDirectionFactors = { 1: [ 1, 8.1 ],
+                         2: [ 0.8, 2.7 ],
+                         3: [ 0.5, 0.66 ] }
+
+
+def _davenportRightPart( x ):
+    # Shape function shared by the Davenport spectra
+    return 4.0 * x * x / np.power( 1 + x * x, 4 / 3 )
 
 
 def davenportSpectrumWithDragCoef( n, delta1, kappa=0.005, normalized=True ):
@@ -9,12 +28,12 @@ def davenportSpectrumWithDragCoef( n, delta1, kappa=0.005, normalized=True ):
 
     Parameters
     ----------
-    n: scalar
+    n: scalar or array
         Frequency ( Hz ) when normalized=False.
         Normalized frequency when normalized=True.
-    delta1: scalar
+    delta1: scalar or array
         Velocity ( m/s ) at standard reference height of 10 m.
-    kappa: scalar, optional
+    kappa: scalar or array, optional
         Drag coefficient referred to mean velocity at 10 m.  Default value 0.005 
         corresponding to open unobstructed country [Davenport1961]_.
         The recommended value for heavilly built-up urban centers with 
@@ -25,15 +44,16 @@ def davenportSpectrumWithDragCoef( n, delta1, kappa=0.005, normalized=True ):
     
     Returns
     -------
-    rst: scalar
+    rst: scalar or array
         Power spectrum density ( m^2 s^-2 Hz^-1 ) when normalized=False.
         Normalized power spectrum density when normalized=True.
+        The shape is the broadcast shape of the array inputs.
     
     Raises
     ------
     ValueError
-        If n is not a scalar.
-        If delta1 is not a scalar.
+        If n, delta1 or kappa is not a scalar or an array, or is empty.
+        If the inputs cannot be broadcast together.
 
     Examples
     --------
@@ -49,22 +69,15 @@ def davenportSpectrumWithDragCoef( n, delta1, kappa=0.005, normalized=True ):
        near the ground in high winds. Quarterly Journal of the Royal Meteorological 
        Society, 87(372), pp.194-211.
     '''
-    if not isinstance( n, int ) and not isinstance( n, float ):
-        raise ValueError( "n should be a scalar" )
-    if not isinstance( delta1, int ) and not isinstance( delta1, float ):
-        raise ValueError( "delta1 should be a scalar" )
-
-    def rightPart( x ):
-        rst = 4.0 * x * x / np.power( 1 + x * x, 4 / 3 )
-        return rst
+    n, delta1, kappa = _checkSpectrumInput( n=n, delta1=delta1, kappa=kappa )
 
     if normalized:
         x = 120 * n
-        return rightPart( x )
+        return _spectrumResult( _davenportRightPart( x ) * np.ones( np.broadcast( n, delta1, kappa ).shape ) )
     
     x = 1200 * n / delta1
-    rst = rightPart( x ) * kappa * delta1 * delta1 / n
-    return rst
+    rst = _davenportRightPart( x ) * kappa * delta1 * delta1 / n
+    return _spectrumResult( rst )
 
 
 def davenportSpectrumWithRoughnessLength( n, uz, z=10, z0=0.03, normalized=True ):
@@ -73,14 +86,14 @@ def davenportSpectrumWithRoughnessLength( n, uz, z=10, z0=0.03, normalized=True
 
     Parameters
     ----------
-    n: scalar
+    n: scalar or array
         Frequency ( Hz ) when normalized=False.
         Normalized frequency when normalized=True.
-    uz: scalar
+    uz: scalar or array
         Mean wind speed ( m/s ) measured at height z.
-    z: scalar, optional
+    z: scalar or array, optional
         Height above the ground ( m ), default to 10 m. 
-    z0: scalar, optional
+    z0: scalar or array, optional
         Roughness length ( m ), default to 0.03 m corresponding to open 
         exposure case in [Ho2003]_.
     normalized: bool, optional
@@ -88,15 +101,16 @@ def davenportSpectrumWithRoughnessLength( n, uz, z=10, z0=0.03, normalized=True
     
     Returns
     -------
-    rst: scalar
+    rst: scalar or array
         Power spectrum density ( m^2 s^-2 Hz^-1 ) when normalized=False.
         Normalized power spectrum density when normalized=True.
+        The shape is the broadcast shape of the array inputs.
     
     Raises
     ------
     ValueError
-        If n is not a scalar.
-        If uz is not a scalar.
+        If n, uz, z or z0 is not a scalar or an array, or is empty.
+        If the inputs cannot be broadcast together.
 
     Examples
     --------
@@ -116,23 +130,16 @@ def davenportSpectrumWithRoughnessLength( n, uz, z=10, z0=0.03, normalized=True
        low buildings. London, Canada: BLWTSS20-2003, Boundary-Layer Wind Tunnel 
        Laboratory, Univ. of Western Ontario.
     '''
-    if not isinstance( n, int ) and not isinstance( n, float ):
-        raise ValueError( "n should be a scalar" )
-    if not isinstance( uz, int ) and not isinstance( uz, float ):
-        raise ValueError( "uz should be a scalar" )
+    n, uz, z, z0 = _checkSpectrumInput( n=n, uz=uz, z=z, z0=z0 )
 
-    def rightPart( x ):
-        rst = 4.0 * x * x / np.power( 1 + x * x, 4 / 3 )
-        return rst
-    
     if normalized:
         x = 1200 / z * n
-        return rightPart( x )
+        return _spectrumResult( _davenportRightPart( x ) * np.ones( np.broadcast( n, uz, z, z0 ).shape ) )
     
     x = 1200 * n / uz
     uf = 0.4 * uz / np.log( z / z0 )
-    rst = rightPart( x ) * uf * uf / n
-    return rst
+    rst = _davenportRightPart( x ) * uf * uf / n
+    return _spectrumResult( rst )
 
 
 def ec1Spectrum( n, uz, sigma=0.03, z=10, tcat=0, normalized=True ):
@@ -141,14 +148,14 @@ def ec1Spectrum( n, uz, sigma=0.03, z=10, tcat=0, normalized=True ):
 
     Parameters
     ----------
-    n: scalar
+    n: scalar or array
         Frequency ( Hz ) when normalized=False.
         Normalized frequency when normalized=True.
-    uz: scalar
+    uz: scalar or array
         Mean wind speed ( m/s ) measured at height z.
-    sigma: scalar, optional
+    sigma: scalar or array, optional
         Standard derivation of wind.  
-    z: scalar, optional
+    z: scalar or array, optional
         Height above the ground ( m ), default to 10 m. 
     tcat: scalar, optional
         Terrain category, could be 0, 1, 2, 3, 4
@@ -158,15 +165,16 @@ def ec1Spectrum( n, uz, sigma=0.03, z=10, tcat=0, normalized=True ):
     
     Returns
     -------
-    rst: scalar
+    rst: scalar or array
         Power spectrum density ( m^2 s^-2 Hz^-1 ) when normalized=False.
         Normalized power spectrum density when normalized=True.
+        The shape is the broadcast shape of the array inputs.
     
     Raises
     ------
     ValueError
-        If n is not a scalar.
-        If uz is not a scalar.
+        If n, uz, sigma or z is not a scalar or an array, or is empty.
+        If the inputs cannot be broadcast together.
         If tcat is not int or not within range of 0 to 4
 
     Examples
@@ -180,34 +188,27 @@ def ec1Spectrum( n, uz, sigma=0.03, z=10, tcat=0, normalized=True ):
     ----------
     .. [EN1991-1-42005] EN1991-1-4, 2005. Eurocode 1: Actions on structures.
     '''
-    if not isinstance( n, int ) and not isinstance( n, float ):
-        raise ValueError( "n should be a scalar" )
-    if not isinstance( uz, int ) and not isinstance( uz, float ):
-        raise ValueError( "uz should be a scalar" )
     if not isinstance( tcat, int ):
         raise ValueError( "tcat should be an integer" )
     if tcat < 0 or tcat > 4:
         raise ValueError( "tcat could only be 0, 1, 2, 3, or 4" )
+    n, uz, sigma, z = _checkSpectrumInput( n=n, uz=uz, sigma=sigma, z=z )
 
     def rightPart( x ):
         rst = 6.8 * x / np.power( 1 + 10.2 * x, 5 / 3 )
         return rst
     
     if normalized:
-        return rightPart( n )
+        return _spectrumResult( rightPart( n ) * np.ones( np.broadcast( n, uz, sigma, z ).shape ) )
     
-    options = { 0: [ 0.003, 1 ], 
-                1: [ 0.01, 1 ],
-                2: [ 0.05, 2 ],
-                3: [ 0.3, 5 ],
-                4: [ 1.0, 10 ] }
-    [ z0, zmin ] = options[ tcat ]
+    [ z0, zmin ] = _ec1TerrainOptions[ tcat ]
 
+    # Turbulent length scale only depends on the height
     alpha = 0.67 + 0.05 * np.log( z0 )
-    lz = 300 * np.power( max( z, zmin ) / 200, alpha )
+    lz = 300 * np.power( np.maximum( z, zmin ) / 200, alpha )
     f = n * lz / uz
     rst = rightPart( f ) * sigma * sigma / n
-    return rst
+    return _spectrumResult( rst )
 
 
 def iecSpectrum( f, vhub, sigma=0.03, z=10, k=1, normalized=True ):
@@ -216,14 +217,14 @@ def iecSpectrum( f, vhub, sigma=0.03, z=10, k=1, normalized=True ):
 
     Parameters
     ----------
-    f: scalar
+    f: scalar or array
         Frequency ( Hz ) when normalized=False.
         Normalized frequency when normalized=True.
-    vhub: scalar
+    vhub: scalar or array
         Mean wind speed ( m/s ).
-    sigma: scalar, optional
+    sigma: scalar or array, optional
         Standard derivation of the turblent wind speed component.  
-    z: scalar, optional
+    z: scalar or array, optional
         Height above the ground ( m ), default to 10 m. 
     k: scalar, optional
         Wind speed direction, could be 1, 2, 3
@@ -234,17 +235,18 @@ def iecSpectrum( f, vhub, sigma=0.03, z=10, k=1, normalized=True ):
     
     Returns
     -------
-    rst: scalar
+    rst: scalar or array
         Single-sided velocity component power spectrum density ( m^2 s^-2 Hz^-1 ) 
         when normalized=False.
         Normalized single-sided velocity component power spectrum density 
         when normalized=True.
+        The shape is the broadcast shape of the array inputs.
     
     Raises
     ------
     ValueError
-        If n is not a scalar.
-        If uz is not a scalar.
+        If f, vhub, sigma or z is not a scalar or an array, or is empty.
+        If the inputs cannot be broadcast together.
         If k is not int or not within range of 1 to 3
 
     Examples
@@ -254,38 +256,37 @@ def iecSpectrum( f, vhub, sigma=0.03, z=10, k=1, normalized=True ):
     >>> vhub = 10
     >>> rst = iecSpectrum( n, vhub, sigma=0.03, z=10, k=1, normalized=True )
 
+    The frequencies broadcast against the wind speeds and heights
+
+    >>> import numpy as np
+    >>> f = np.linspace( 0.01, 10, 1000 )
+    >>> vhub = np.array( [ 8.0, 10.0, 12.0 ] )
+    >>> rst = iecSpectrum( f, vhub[ :, None ], z=90, normalized=False )
+
     References
     ----------
     .. [IEC2005] IEC, 2005. IEC 61400-1, Wind turbines - Part 1: Design requirements.
     '''
-    if not isinstance( f, int ) and not isinstance( f, float ):
-        raise ValueError( "f should be a scalar" )
-    if not isinstance( vhub, int ) and not isinstance( vhub, float ):
-        raise ValueError( "vhub should be a scalar" )
     if not isinstance( k, int ):
         raise ValueError( "k should be an integer" )
     if k < 1 or k > 3:
         raise ValueError( "k could only be 1, 2, or 3" )
+    f, vhub, sigma, z = _checkSpectrumInput( f=f, vhub=vhub, sigma=sigma, z=z )
 
     def rightPart( f ):
         rst = 4 * f / np.power( 1 + 6 * f, 5 / 3 ) 
         return rst 
 
     if normalized:
-        return rightPart( f )
+        return _spectrumResult( rightPart( f ) * np.ones( np.broadcast( f, vhub, sigma, z ).shape ) )
 
-    lambda1 = 0.7 * z
-    if z >= 60:
-        lambda1 = 42
-    
-    factors = { 1: [ 1, 8.1 ],
-                2: [ 0.8, 2.7 ],
-                3: [ 0.5, 0.66 ] }[ k ]
-    sigmak = factors[ 0 ] * sigma
-    lk = factors[ 1 ] * lambda1
-    nf = f * lk / vhub
-    rst = rightPart( nf ) * sigmak * sigmak / f
-    return rst
+    # Parameter-only terms are computed once and broadcast over the frequencies
+    lambda1 = np.where( z >= 60, 42, 0.7 * z )
+    factors = _iecDirectionFactors[ k ]
+    sigmak2 = np.square( factors[ 0 ] * sigma )
+    lkv = factors[ 1 ] * lambda1 / vhub
+    rst = rightPart( f * lkv ) * sigmak2 / f
+    return _spectrumResult( rst )
 
 
 def apiSpectrum( f, u0, z=10 ):
@@ -294,21 +295,22 @@ def apiSpectrum( f, u0, z=10 ):
 
     Parameters
     ----------
-    f: scalar
+    f: scalar or array
         Frequency ( Hz ).
-    u0: scalar
+    u0: scalar or array
         1 hour mean wind speed ( m/s ) at 10 m above sea level.
     
     Returns
     -------
-    rst: scalar
+    rst: scalar or array
         Power spectrum density ( m^2 s^-2 Hz^-1 ).
+        The shape is the broadcast shape of the array inputs.
     
     Raises
     ------
     ValueError
-        If n is not a scalar.
-        If uz is not a scalar.
+        If f, u0 or z is not a scalar or an array, or is empty.
+        If the inputs cannot be broadcast together.
 
     Examples
     --------
@@ -323,13 +325,10 @@ def apiSpectrum( f, u0, z=10 ):
        Recommnded practice for planning, designing and constructing fixed offshore 
        platforms - working stress design.
     '''
-    if not isinstance( f, int ) and not isinstance( f, float ):
-        raise ValueError( "f should be a scalar" )
-    if not isinstance( u0, int ) and not isinstance( u0, float ):
-        raise ValueError( "u0 should be a scalar" )
+    f, u0, z = _checkSpectrumInput( f=f, u0=u0, z=z )
 
     n = 0.468
     ftilde = 172 * f * np.power( z / 10, 2 / 3 ) * np.power( u0 / 10, -0.75 )
     rst = 320 * np.power( u0 / 10, 2 ) * np.power( z / 10, 0.45 ) 
     rst = rst / np.power( 1 + np.power( ftilde, n ), 5 / ( 3 * n ) )
-    return rst
+    return _spectrumResult( rst )
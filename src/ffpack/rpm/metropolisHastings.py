@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 
 import numpy as np
+from ffpack.config import getRng
 
 
 class MetropolisHastingsSampler:
@@ -14,7 +15,7 @@ class MetropolisHastingsSampler:
        dissertation, Université Clermont Auvergne).
     '''
     def __init__( self, initialVal=None, targetPdf=None, proposalCSampler=None, 
-                  sampleDomain=None, randomSeed=None, **sdKwargs ):
+                  sampleDomain=None, randomSeed=None, rng=None, **sdKwargs ):
         r'''
         Initialize the Metropolis-Hastings sampler
         
@@ -43,8 +44,13 @@ class MetropolisHastingsSampler:
             where cur, nxt are the same type as initivalVal, and a boolean value 
             should be returned.
         randomSeed: integer, optional
-            Random seed. If randomSeed is none or is not an integer, the random seed in 
-            global config will be used. 
+            Random seed for the global legacy random state. If randomSeed is none or is 
+            not an integer, globalConfig.rng will be used if it is set, otherwise the 
+            global legacy random state. 
+        rng: numpy.random.Generator, optional
+            Random number generator. If rng is given, the acceptance test draws 
+            from rng and randomSeed is ignored. The proposalCSampler should draw 
+            from the same rng for a reproducible chain.
         
         Raises
         ------
@@ -75,8 +81,7 @@ class MetropolisHastingsSampler:
         self.targetPdf = targetPdf
         self.proposalCSampler = proposalCSampler
         self.sampleDomain = sampleDomain
-        if isinstance( randomSeed, ( int, type( None ) ) ):
-            np.random.seed( randomSeed )
+        self.rng = getRng( randomSeed, rng )
     
     def getAcceptanceRatio( self, candi ):
         fcur = self.targetPdf( self.cur )
@@ -103,7 +108,7 @@ class MetropolisHastingsSampler:
         '''
         candi = np.array( self.getCandidate() )
         acceptanceRatio = self.getAcceptanceRatio( candi )
-        u = np.random.uniform()
+        u = self.rng.uniform()
         if u <= acceptanceRatio:
             np.copyto( self.nxt, candi )
         else:
@@ -124,7 +129,7 @@ class AuModifiedMHSampler:
        engineering mechanics, 16(4), pp.263-277.
     '''
     def __init__( self, initialVal=None, targetPdf=None, proposalCSampler=None, 
-                  sampleDomain=None, randomSeed=None, **sdKwargs ):
+                  sampleDomain=None, randomSeed=None, rng=None, **sdKwargs ):
         r'''
         Initialize the Au modified Metropolis-Hastings sampler
         
@@ -157,8 +162,13 @@ class AuModifiedMHSampler:
             where cur, nxt are lists in which each element is the same type as 
             initivalVal[ i ], and a boolean value should be returned.
         randomSeed: integer, optional
-            Random seed. If randomSeed is none or is not an integer, the random seed in 
-            global config will be used. 
+            Random seed for the global legacy random state. If randomSeed is none or is 
+            not an integer, globalConfig.rng will be used if it is set, otherwise the 
+            global legacy random state. 
+        rng: numpy.random.Generator, optional
+            Random number generator. If rng is given, the acceptance test draws 
+            from rng and randomSeed is ignored. The proposalCSampler should draw 
+            from the same rng for a reproducible chain.
 
         Raises
         ------
@@ -198,8 +208,7 @@ class AuModifiedMHSampler:
         self.targetPdf = targetPdf
         self.proposalCSampler = proposalCSampler
         self.sampleDomain = sampleDomain
-        if isinstance( randomSeed, ( int, type( None ) ) ):
-            np.random.seed( randomSeed )
+        self.rng = getRng( randomSeed, rng )
         
     def getAcceptanceRatio( self, candi, i ):
         fcur = self.targetPdf[ i ]( self.cur[ i ] )
@@ -227,7 +236,7 @@ class AuModifiedMHSampler:
         for i in range( self.dim ):
             candi = np.array( self.getCandidate( i ), dtype=float )
             acceptanceRatio = self.getAcceptanceRatio( candi, i )
-            u = np.random.uniform()
+            u = self.rng.uniform()
             if u <= acceptanceRatio:
                 self.nxt[ i ] = candi
             else:
@@ -24,6 +24,7 @@ in reference [2]_.
 '''
 
 import numpy as np
+from ffpack.config import getRng
 from scipy import stats, optimize
 
 
@@ -31,7 +32,8 @@ class NatafTransformation:
     '''
     Nataf distribution for correlated marginal distributions.
     '''
-    def __init__( self, distObjs, corrMat, quadDeg=99, quadRange=8, randomSeed=None ):
+    def __init__( self, distObjs, corrMat, quadDeg=99, quadRange=8, randomSeed=None, 
+                  rng=None ):
         '''
         Initialize the Nataf distribution.
         
@@ -48,8 +50,12 @@ class NatafTransformation:
             Quadrature range. The integral will be performed in the range
             [ -quadRange, quadRange ].
         randomSeed: integer, optional
-            Random seed. If randomSeed is none or is not an integer, the random seed in 
-            global config will be used. 
+            Random seed for the global legacy random state. If randomSeed is none or is 
+            not an integer, globalConfig.rng will be used if it is set, otherwise the 
+            global legacy random state. 
+        rng: numpy.random.Generator, optional
+            Random number generator. If rng is given, the random numbers are drawn 
+            from rng and randomSeed is ignored.
         
         Raises
         ------
@@ -91,8 +97,7 @@ class NatafTransformation:
         except np.linalg.LinAlgError:
             raise ValueError( "corrMat should be positive definite" )
 
-        if isinstance( randomSeed, ( int, type( None ) ) ):
-            np.random.seed( randomSeed )
+        self.rng = getRng( randomSeed, rng )
         
         self.distObjs = distObjs
         self.rhoX = np.array( corrMat )
@@ -393,6 +398,9 @@ class NatafTransformation:
         --------
         >>> X = natafDist.getSample()
         '''
-        U = np.random.randn( self.dim )
+        if isinstance( self.rng, np.random.Generator ):
+            U = self.rng.standard_normal( self.dim )
+        else:
+            U = self.rng.randn( self.dim )
         X, _ = self.getX( U )
         return X
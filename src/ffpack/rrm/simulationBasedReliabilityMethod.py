@@ -3,10 +3,12 @@
 import numpy as np
 from scipy.stats import norm
 from ffpack.rpm import metropolisHastings, nataf
+from ffpack.config import getRng
 
 
 def subsetSimulation( dim, g, distObjs, corrMat, numSamples, 
-                      maxSubsets, probLevel=0.1, quadDeg=99, quadRange=8, randomSeed=None ):
+                      maxSubsets, probLevel=0.1, quadDeg=99, quadRange=8, randomSeed=None, 
+                      rng=None ):
     '''
     Second order reliability method based on Breitung algorithm.
 
@@ -33,8 +35,12 @@ def subsetSimulation( dim, g, distObjs, corrMat, numSamples,
         Quadrature range for Nataf transformation. The integral will be performed 
         in the range [ -quadRange, quadRange ].
     randomSeed: integer, optional
-        Random seed. If randomSeed is none or is not an integer, the random seed in 
-        global config will be used. 
+        Random seed for the global legacy random state. If randomSeed is none or is 
+        not an integer, globalConfig.rng will be used if it is set, otherwise the 
+        global legacy random state. 
+    rng: numpy.random.Generator, optional
+        Random number generator. If rng is given, the random numbers are drawn 
+        from rng and randomSeed is ignored.
     
     Returns
     -------
@@ -96,7 +102,8 @@ def subsetSimulation( dim, g, distObjs, corrMat, numSamples,
 
     # Perform Nataf transformation
     natafTrans = nataf.NatafTransformation( distObjs=distObjs, corrMat=corrMat,
-                                            quadDeg=quadDeg, quadRange=quadRange )
+                                            quadDeg=quadDeg, quadRange=quadRange, 
+                                            rng=rng )
 
     # Define paramters for MCMC sampling
     def tpdf( x ):
@@ -104,11 +111,10 @@ def subsetSimulation( dim, g, distObjs, corrMat, numSamples,
     
     targetPdf = [ tpdf ] * dim
     
-    if isinstance( randomSeed, ( int, type( None ) ) ):
-        np.random.seed( randomSeed )
+    randomSource = getRng( randomSeed, rng )
     
     def pcs( x ):
-        return x - 0.5 + np.random.uniform()
+        return x - 0.5 + randomSource.uniform()
     
     proposalCSampler = [ pcs ] * dim 
 
@@ -136,7 +142,7 @@ def subsetSimulation( dim, g, distObjs, corrMat, numSamples,
     allLsfValues = np.zeros( [ maxSubsets, numSamples ] )
     
     # Use curde Monte Carlo to run the first iteration 
-    curUSamples[ : ] = np.random.normal( loc=0, scale=1.0, size=( numSamples, dim  ) )
+    curUSamples[ : ] = randomSource.normal( loc=0, scale=1.0, size=( numSamples, dim  ) )
     for idx, curU in enumerate( curUSamples ):
         curX, _ = natafTrans.getX( curU )
         curXSamples[ idx ] = curX
@@ -174,6 +180,7 @@ def subsetSimulation( dim, g, distObjs, corrMat, numSamples,
                                      sampleDomain=sampleDomainFunc,
                                      lsfFunc=g,
                                      lsfLevel=lsfLevel,
+                                     rng=rng,
                                      natafTrans=natafTrans )
 
             for _ in range( numSamplesEachChain - 1 ):
@@ -143,3 +143,62 @@ def sequenceHysteresisFilter( data, gateSize ):
             rst.append( data[ i ] )
     
     return rst
+
+
+def sequencePeakValleyFilterBatch( data ):
+    '''
+    Get the peaks and valleys of each row of a 2d array with the two ends kept.
+
+    Each row gives the same peaks and valleys as sequencePeakValleyFilter with 
+    keepEnds=True, but all rows are processed together with array operations.
+
+    Parameters
+    ----------
+    data: 2d array
+        Sequence data in rows, e.g., [ sequence1, sequence2, ... ].
+    
+    Returns
+    -------
+    rst: 2d array
+        Peaks and valleys of each row. Rows are padded with nan at the end 
+        when they have fewer peaks and valleys than the longest row.
+    lengths: 1d array
+        Number of peaks and valleys, including the two ends, of each row.
+    
+    Raises
+    ------
+    ValueError
+        If the data dimension is not 2.
+        If the data length of each row is less than 2.
+
+    Examples
+    --------
+    >>> from ffpack.utils import sequencePeakValleyFilterBatch
+    >>> data = [ [ -0.5, 1.0, -2.0, 3.0, -1.0, 4.5 ], 
+    ...          [ 1.0, 2.0, 2.0, 3.0, -1.0, 0.5 ] ]
+    >>> rst, lengths = sequencePeakValleyFilterBatch( data )
+    '''
+    # Egde cases
+    data = np.array( data, dtype=float )
+    if len( data.shape ) != 2:
+        raise ValueError( "Input data dimension should be 2" )
+    if data.shape[ 1 ] < 2:
+        raise ValueError( "Input data length of each row should be at least 2" )
+
+    numRows, n = data.shape
+    sign = np.sign( np.diff( data, axis=1 ) )
+    # Index of the last non-zero slope before each point, plateaus are skipped
+    lastIdx = np.where( sign != 0, np.arange( n - 1 ), -1 )
+    np.maximum.accumulate( lastIdx, axis=1, out=lastIdx )
+    lastSign = np.take_along_axis( sign, np.maximum( lastIdx, 0 ), axis=1 )
+    lastSign[ lastIdx < 0 ] = 0
+
+    # An inner point is kept if the slope changes its sign at this point
+    keep = np.ones( ( numRows, n ), dtype=bool )
+    keep[ :, 1:-1 ] = ( sign[ :, 1: ] != 0 ) & ( lastSign[ :, :-1 ] == -sign[ :, 1: ] )
+
+    lengths = keep.sum( axis=1 )
+    rst = np.full( ( numRows, lengths.max() ), np.nan )
+    rows, cols = np.nonzero( keep )
+    rst[ rows, np.cumsum( keep, axis=1 )[ rows, cols ] - 1 ] = data[ rows, cols ]
+    return rst, lengths
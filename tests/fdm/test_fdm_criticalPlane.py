@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+
+from ffpack import fdm, lcc
+import numpy as np
+import pytest
+
+
+###############################################################################
+# Test criticalPlaneSearch
+###############################################################################
+def test_criticalPlaneSearch_irregularInput_valueError():
+    stressHistory = [ [ 10.0, 2.0, 0.0, 1.0, 0.0, 0.0 ],
+                      [ -5.0, 1.0, 0.0, -3.0, 0.0, 0.0 ] ]
+    snData = [ [ 10, 30 ], [ 1000000, 2 ] ]
+    fatigueLimit = 1.0
+
+    with pytest.raises( ValueError ):
+        _ = fdm.criticalPlaneSearch( [ 1.0, 2.0 ], snData, fatigueLimit )
+
+    with pytest.raises( ValueError ):
+        _ = fdm.criticalPlaneSearch( [ [ 1.0, 2.0, 3.0 ] ], snData, fatigueLimit )
+
+    with pytest.raises( ValueError ):
+        _ = fdm.criticalPlaneSearch( stressHistory[ : 1 ], snData, fatigueLimit )
+
+    with pytest.raises( ValueError ):
+        _ = fdm.criticalPlaneSearch( stressHistory, snData, fatigueLimit, 
+                                     stressType="bending" )
+
+    with pytest.raises( ValueError ):
+        _ = fdm.criticalPlaneSearch( stressHistory, snData, fatigueLimit, numTheta=0 )
+
+    with pytest.raises( ValueError ):
+        _ = fdm.criticalPlaneSearch( stressHistory, snData, fatigueLimit, numWorkers=0 )
+
+
+def test_criticalPlaneSearch_uniaxialStress_planeNormalToLoad():
+    randomState = np.random.RandomState( 2 )
+    stressHistory = np.zeros( ( 200, 6 ) )
+    stressHistory[ :, 0 ] = np.cumsum( randomState.normal( size=200 ) )
+    snData = [ [ 10, 30 ], [ 1000000, 2 ] ]
+    fatigueLimit = 1.0
+
+    calRst, calPlane, _, _ = fdm.criticalPlaneSearch( stressHistory, snData, 
+                                                      fatigueLimit )
+    lccData = lcc.astmRainflowCounting( stressHistory[ :, 0 ] )
+    expectedRst = fdm.minerDamageModelClassic( lccData, snData, fatigueLimit )
+    np.testing.assert_allclose( calRst, expectedRst )
+    np.testing.assert_allclose( calPlane, [ np.pi / 2, 0.0, 0.0 ], atol=1e-12 )
+
+    # maximum shear stress is half of the uniaxial stress
+    calRst, _, _, _ = fdm.criticalPlaneSearch( stressHistory, snData, fatigueLimit,
+                                               stressType="shear", refine=True )
+    lccData = lcc.astmRainflowCounting( stressHistory[ :, 0 ] / 2 )
+    expectedRst = fdm.minerDamageModelClassic( lccData, snData, fatigueLimit )
+    np.testing.assert_allclose( calRst, expectedRst )
+
+
+def test_criticalPlaneSearch_shearStress_sameAsSinglePlaneCounting():
+    randomState = np.random.RandomState( 7 )
+    stressHistory = randomState.normal( scale=5.0, size=( 100, 6 ) )
+    tensorHistory = np.zeros( ( 100, 3, 3 ) )
+    for k, ( i, j ) in enumerate( [ ( 0, 0 ), ( 1, 1 ), ( 2, 2 ), 
+                                    ( 0, 1 ), ( 1, 2 ), ( 0, 2 ) ] ):
+        tensorHistory[ :, i, j ] = stressHistory[ :, k ]
+        tensorHistory[ :, j, i ] = stressHistory[ :, k ]
+    snData = [ [ 10, 30 ], [ 1000000, 2 ] ]
+    fatigueLimit = 1.0
+
+    calRst, _, planeDamages, planes = fdm.criticalPlaneSearch( 
+        tensorHistory, snData, fatigueLimit, stressType="shear", 
+        numTheta=4, numPhi=6, numPsi=3, tileSize=5, numWorkers=3 )
+    np.testing.assert_allclose( calRst, np.max( planeDamages ) )
+
+    for ( theta, phi, psi ), calDamage in zip( planes, planeDamages ):
+        n = [ np.sin( theta ) * np.cos( phi ), np.sin( theta ) * np.sin( phi ), 
+              np.cos( theta ) ]
+        e1 = np.array( [ np.cos( theta ) * np.cos( phi ), np.cos( theta ) * np.sin( phi ), 
+                         -np.sin( theta ) ] )
+        e2 = np.array( [ -np.sin( phi ), np.cos( phi ), 0.0 ] )
+        t = np.cos( psi ) * e1 + np.sin( psi ) * e2
+        history = np.einsum( "i,kij,j->k", t, tensorHistory, n )
+        lccData = lcc.astmRainflowCounting( history )
+        expectedDamage = fdm.minerDamageModelClassic( lccData, snData, fatigueLimit )
+        np.testing.assert_allclose( calDamage, expectedDamage )
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+
+from ffpack import fdm, lcc
+import numpy as np
+import pytest
+
+
+###############################################################################
+# Test hotSpotDamageMapping
+###############################################################################
+def test_hotSpotDamageMapping_irregularInput_valueError():
+    coeffs = [ [ 1.0, 0.5 ], [ 0.2, 2.0 ] ]
+    loads = [ [ -2.0, 1.0, -3.0, 5.0 ], [ 1.0, -2.0, 3.0, -1.0 ] ]
+    snData = [ [ 10, 30 ], [ 1000, 10 ] ]
+    fatigueLimit = 2.0
+
+    with pytest.raises( ValueError ):
+        _ = fdm.hotSpotDamageMapping( [ 1.0, 0.5 ], loads, snData, fatigueLimit )
+
+    with pytest.raises( ValueError ):
+        _ = fdm.hotSpotDamageMapping( coeffs, [ 1.0, 0.5 ], snData, fatigueLimit )
+
+    with pytest.raises( ValueError ):
+        _ = fdm.hotSpotDamageMapping( coeffs, loads[ : 1 ], snData, fatigueLimit )
+
+    with pytest.raises( ValueError ):
+        _ = fdm.hotSpotDamageMapping( coeffs, [ [ 1.0 ], [ 2.0 ] ], snData, fatigueLimit )
+
+    with pytest.raises( ValueError ):
+        _ = fdm.hotSpotDamageMapping( coeffs, loads, snData, fatigueLimit, tileSize=0 )
+
+    with pytest.raises( ValueError ):
+        _ = fdm.hotSpotDamageMapping( coeffs, loads, snData, fatigueLimit, numWorkers=0 )
+
+
+def test_hotSpotDamageMapping_randomLoads_sameAsMinerDamageModelClassic():
+    randomState = np.random.RandomState( 3 )
+    coeffs = randomState.normal( size=( 20, 3 ) )
+    loads = np.cumsum( randomState.normal( size=( 3, 200 ) ), axis=1 )
+    snData = [ [ 10, 30 ], [ 1000000, 2 ] ]
+    fatigueLimit = 1.0
+
+    expectedRst = [ ]
+    for c in coeffs:
+        lccData = lcc.astmRainflowCounting( c @ loads )
+        expectedRst.append( fdm.minerDamageModelClassic( lccData, snData, fatigueLimit ) )
+
+    calRst = fdm.hotSpotDamageMapping( coeffs, loads, snData, fatigueLimit )
+    np.testing.assert_allclose( calRst, expectedRst )
+
+    calRst = fdm.hotSpotDamageMapping( coeffs, loads, snData, fatigueLimit, 
+                                       tileSize=3, numWorkers=4 )
+    np.testing.assert_allclose( calRst, expectedRst )
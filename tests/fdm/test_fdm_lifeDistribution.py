@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+
+from ffpack import fdm
+import numpy as np
+import pytest
+from scipy import stats
+
+
+###############################################################################
+# Test minerLifeDistribution
+###############################################################################
+def test_minerLifeDistribution_irregularInput_valueError():
+    lccData = [ [ 1, 100 ], [ 2, 10 ] ]
+    slopeDist = stats.norm( loc=-1.0, scale=0.05 )
+    interceptDist = stats.norm( loc=5.0, scale=0.2 )
+    fatigueLimit = 0.5
+
+    with pytest.raises( ValueError ):
+        _ = fdm.minerLifeDistribution( [ [ ] ], slopeDist, interceptDist, fatigueLimit )
+
+    with pytest.raises( ValueError ):
+        _ = fdm.minerLifeDistribution( [ [ -1, 100 ] ], slopeDist, interceptDist, 
+                                       fatigueLimit )
+
+    with pytest.raises( ValueError ):
+        _ = fdm.minerLifeDistribution( lccData, slopeDist, interceptDist, 0 )
+
+    with pytest.raises( ValueError ):
+        _ = fdm.minerLifeDistribution( lccData, slopeDist, interceptDist, 
+                                       fatigueLimit, numSamples=0 )
+
+    with pytest.raises( ValueError ):
+        _ = fdm.minerLifeDistribution( lccData, slopeDist, interceptDist, 
+                                       fatigueLimit, quantiles=[ 1.5 ] )
+
+
+def test_minerLifeDistribution_constantParameters_sameAsClassicBatch():
+    lccData = [ [ 1, 100 ], [ 2, 10 ], [ 0.2, 1000 ] ]
+    fatigueLimit = 0.5
+    calRst, calSamples = fdm.minerLifeDistribution( lccData, -1.0, 5.0, fatigueLimit,
+                                                    criticalDamageDist=0.7, 
+                                                    numSamples=10 )
+    damage = fdm.minerDamageModelClassicBatch( lccData, [ -1.0, 5.0 ], fatigueLimit )
+    np.testing.assert_allclose( calSamples, np.full( 10, 0.7 / damage[ 0 ] ) )
+    np.testing.assert_allclose( calRst, np.full( 3, 0.7 / damage[ 0 ] ) )
+
+    # no damage below the fatigue limit
+    calRst, calSamples = fdm.minerLifeDistribution( lccData, -1.0, 5.0, 3.0,
+                                                    numSamples=10 )
+    assert np.all( np.isinf( calSamples ) )
+    assert np.all( np.isinf( calRst ) )
+
+
+def test_minerLifeDistribution_randomSeed_reproducible():
+    lccData = [ [ 1, 100 ], [ 2, 10 ] ]
+    slopeDist = stats.norm( loc=-1.0, scale=0.05 )
+    interceptDist = stats.norm( loc=5.0, scale=0.2 )
+    criticalDamageDist = stats.lognorm( s=0.3 )
+    fatigueLimit = 0.5
+    rst1, samples1 = fdm.minerLifeDistribution( lccData, slopeDist, interceptDist, 
+                                                fatigueLimit, criticalDamageDist,
+                                                numSamples=5000, randomSeed=3 )
+    rst2, samples2 = fdm.minerLifeDistribution( lccData, slopeDist, interceptDist, 
+                                                fatigueLimit, criticalDamageDist,
+                                                numSamples=5000, chunkSize=77, 
+                                                randomSeed=3 )
+    np.testing.assert_allclose( samples1, samples2 )
+    np.testing.assert_allclose( rst1, rst2 )
+    np.testing.assert_allclose( rst1, np.quantile( samples1, [ 0.05, 0.5, 0.95 ] ) )
+    assert rst1[ 0 ] < rst1[ 1 ] < rst1[ 2 ]
+
+
+def test_minerLifeDistribution_rng_reproducible():
+    lccData = [ [ 1, 100 ], [ 2, 10 ] ]
+    slopeDist = stats.norm( loc=-1.0, scale=0.05 )
+    interceptDist = stats.norm( loc=5.0, scale=0.2 )
+    _, samples1 = fdm.minerLifeDistribution( lccData, slopeDist, interceptDist, 0.5,
+                                             numSamples=500, 
+                                             rng=np.random.default_rng( 2023 ) )
+    _, samples2 = fdm.minerLifeDistribution( lccData, slopeDist, interceptDist, 0.5,
+                                             numSamples=500, randomSeed=1,
+                                             rng=np.random.default_rng( 2023 ) )
+    np.testing.assert_array_equal( samples1, samples2 )
@@ -179,3 +179,132 @@ def test_minerDamageModelClassic_threePairsHighFatigueLimit_scalarOutput( mocker
     calRst = fdm.minerDamageModelClassic( lccData, snData, fatigueLimit )
     expectedRst = 0
     np.testing.assert_allclose( calRst, expectedRst )
+
+
+###############################################################################
+# Test minerDamageModelClassicBatch
+###############################################################################
+def test_minerDamageModelClassicBatch_irregularInput_valueError():
+    snCoefs = [ [ -1.0, 5.0 ] ]
+    fatigueLimit = 0.5
+    with pytest.raises( ValueError ):
+        _ = fdm.minerDamageModelClassicBatch( [ [ ] ], snCoefs, fatigueLimit )
+
+    with pytest.raises( ValueError ):
+        _ = fdm.minerDamageModelClassicBatch( [ 1.0, 2.0 ], snCoefs, fatigueLimit )
+
+    lccData = [ [ 1, 1000 ], [ -2, 100 ] ]
+    with pytest.raises( ValueError ):
+        _ = fdm.minerDamageModelClassicBatch( lccData, snCoefs, fatigueLimit )
+
+    lccData = [ [ 1, 1000 ], [ 2, 0 ] ]
+    with pytest.raises( ValueError ):
+        _ = fdm.minerDamageModelClassicBatch( lccData, snCoefs, fatigueLimit )
+
+    lccData = [ [ 1, 1000 ], [ 2, 100 ] ]
+    with pytest.raises( ValueError ):
+        _ = fdm.minerDamageModelClassicBatch( lccData, [ [ 1.0, 2.0, 3.0 ] ], fatigueLimit )
+
+    with pytest.raises( ValueError ):
+        _ = fdm.minerDamageModelClassicBatch( lccData, snCoefs, [ 0.5, 0.5 ] )
+
+    with pytest.raises( ValueError ):
+        _ = fdm.minerDamageModelClassicBatch( lccData, snCoefs, 0 )
+
+    with pytest.raises( ValueError ):
+        _ = fdm.minerDamageModelClassicBatch( lccData, snCoefs, fatigueLimit, chunkSize=0 )
+
+
+def test_minerDamageModelClassicBatch_singleCurve_sameAsClassic():
+    lccData = [ [ 1, 1000 ], [ 2, 100 ], [ 4, 10 ] ]
+    snData = [ [ 10, 5 ], [ 100, 4 ], [ 100000, 1 ] ]
+    fatigueLimit = 0.5
+    snCurveFitter = SnCurveFitter( snData, fatigueLimit )
+    calRst = fdm.minerDamageModelClassicBatch( lccData, snCurveFitter.fitter.coef,
+                                               fatigueLimit )
+    expectedRst = fdm.minerDamageModelClassic( lccData, snData, fatigueLimit )
+    np.testing.assert_allclose( calRst, [ expectedRst ] )
+
+
+def test_minerDamageModelClassicBatch_multipleCurves_sameAsClassic():
+    lccData = [ [ 1, 1000 ], [ 2, 100 ], [ 3, 20 ], [ 4, 10 ] ]
+    snDataList = [ [ [ 10, 5 ], [ 100, 4 ], [ 100000, 1 ] ],
+                   [ [ 100, 5 ], [ 1000000, 1 ] ],
+                   [ [ 20, 6 ], [ 500, 3 ], [ 50000, 2 ] ] ]
+    fatigueLimits = [ 0.5, 1.5, 2.5 ]
+    snCoefs = [ SnCurveFitter( snData, fl ).fitter.coef 
+                for snData, fl in zip( snDataList, fatigueLimits ) ]
+    expectedRst = [ fdm.minerDamageModelClassic( lccData, snData, fl ) 
+                    for snData, fl in zip( snDataList, fatigueLimits ) ]
+
+    calRst = fdm.minerDamageModelClassicBatch( lccData, snCoefs, fatigueLimits )
+    np.testing.assert_allclose( calRst, expectedRst )
+
+    # chunkSize does not change the results
+    calRst = fdm.minerDamageModelClassicBatch( lccData, snCoefs, fatigueLimits, 
+                                               chunkSize=2 )
+    np.testing.assert_allclose( calRst, expectedRst )
+
+
+def test_minerDamageModelClassicBatch_highFatigueLimit_zeroDamage():
+    lccData = [ [ 1, 1000 ], [ 2, 100 ], [ 4, 10 ] ]
+    snCoefs = [ [ -1.0, 5.0 ], [ -1.0, 6.0 ] ]
+    calRst = fdm.minerDamageModelClassicBatch( lccData, snCoefs, 4 )
+    np.testing.assert_allclose( calRst, [ 0.0, 0.0 ] )
+
+
+def test_minerDamageModelNaive_irregularInput_invalidRowsReported():
+    fatigueData = [ [ 10, 100 ], [ -1, 100 ], [ 200, 2000 ], [ -5, 10 ] ]
+    with pytest.raises( ValueError, match=r"invalid rows: \[ 1, 3 \]" ):
+        _ = fdm.minerDamageModelNaive( fatigueData )
+
+    fatigueData = [ [ 10, 100 ], [ 101, 100 ] ]
+    with pytest.raises( ValueError, match=r"invalid rows: \[ 1 \]" ):
+        _ = fdm.minerDamageModelNaive( fatigueData )
+
+
+###############################################################################
+# Test minerDamageModelNaiveBatch
+###############################################################################
+def test_minerDamageModelNaiveBatch_irregularInput_valueError():
+    with pytest.raises( ValueError ):
+        _ = fdm.minerDamageModelNaiveBatch( [ ] )
+
+    with pytest.raises( ValueError ):
+        _ = fdm.minerDamageModelNaiveBatch( [ [ [ 10, 100, 1 ] ] ] )
+
+    with pytest.raises( ValueError ):
+        _ = fdm.minerDamageModelNaiveBatch( [ [ [ 10, 100 ] ], [ ] ] )
+
+    fatigueData = [ [ [ 10, 100 ], [ 200, 2000 ] ], [ [ 10, 100 ], [ 0, 0 ] ] ]
+    with pytest.raises( ValueError, match=r"invalid rows: \[ \[1, 1\] \]" ):
+        _ = fdm.minerDamageModelNaiveBatch( fatigueData )
+
+    fatigueData = [ [ 10, 100 ], [ 200, 2000 ], [ 2001, 2000 ] ]
+    with pytest.raises( ValueError, match=r"invalid rows: \[ \[1, 1\] \]" ):
+        _ = fdm.minerDamageModelNaiveBatch( fatigueData, offsets=[ 0, 1 ] )
+
+    with pytest.raises( ValueError ):
+        _ = fdm.minerDamageModelNaiveBatch( fatigueData, offsets=[ 1, 2 ] )
+
+    with pytest.raises( ValueError ):
+        _ = fdm.minerDamageModelNaiveBatch( fatigueData, offsets=[ 0, 3 ] )
+
+
+def test_minerDamageModelNaiveBatch_allForms_sameAsNaive():
+    cases = [ [ [ 10, 100 ], [ 200, 2000 ] ], 
+              [ [ 10, 1000 ], [ 200, 20000 ], [ 50, 500 ] ],
+              [ [ 1, 100 ], [ 2, 2000 ], [ 3, 30 ], [ 4, 40 ] ] ]
+    expectedRst = [ fdm.minerDamageModelNaive( case ) for case in cases ]
+
+    # ragged list
+    calRst = fdm.minerDamageModelNaiveBatch( cases )
+    np.testing.assert_allclose( calRst, expectedRst )
+
+    # concatenated array with offsets
+    calRst = fdm.minerDamageModelNaiveBatch( np.concatenate( cases ), offsets=[ 0, 2, 5 ] )
+    np.testing.assert_allclose( calRst, expectedRst )
+
+    # 3d array
+    calRst = fdm.minerDamageModelNaiveBatch( np.array( [ cases[ 0 ], cases[ 0 ] ] ) )
+    np.testing.assert_allclose( calRst, [ expectedRst[ 0 ], expectedRst[ 0 ] ] )
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+
+from ffpack import fdm, lsm, utils
+import numpy as np
+import pytest
+
+
+###############################################################################
+# Test scatterDiagramFatigueDamage
+###############################################################################
+def _transferFunction( w ):
+    return 20.0 / np.sqrt( ( 1 - ( w / 1.2 ) ** 2 ) ** 2 + ( 0.2 * w ) ** 2 )
+
+
+def test_scatterDiagramFatigueDamage_irregularInput_valueError():
+    scatterTable = [ [ 1.5, 6.0, 0.3 ], [ 2.5, 8.0, 0.7 ] ]
+    w = np.linspace( 0.1, 3.0, 200 )
+    transferFunction = _transferFunction( w )
+    snData = [ [ 1e5, 200 ], [ 1e7, 50 ] ]
+
+    with pytest.raises( ValueError ):
+        _ = fdm.scatterDiagramFatigueDamage( [ 1.5, 6.0, 0.3 ], w, transferFunction,
+                                             snData, 10.0, 1.0 )
+
+    with pytest.raises( ValueError ):
+        _ = fdm.scatterDiagramFatigueDamage( [ [ 1.5, 6.0 ] ], w, transferFunction,
+                                             snData, 10.0, 1.0 )
+
+    with pytest.raises( ValueError ):
+        _ = fdm.scatterDiagramFatigueDamage( [ [ -1.5, 6.0, 0.3 ] ], w, transferFunction,
+                                             snData, 10.0, 1.0 )
+
+    with pytest.raises( ValueError ):
+        _ = fdm.scatterDiagramFatigueDamage( [ [ 1.5, 0.0, 0.3 ] ], w, transferFunction,
+                                             snData, 10.0, 1.0 )
+
+    with pytest.raises( ValueError ):
+        _ = fdm.scatterDiagramFatigueDamage( [ [ 1.5, 6.0, 0.0 ] ], w, transferFunction,
+                                             snData, 10.0, 1.0 )
+
+    with pytest.raises( ValueError ):
+        _ = fdm.scatterDiagramFatigueDamage( scatterTable, w[ :: -1 ], transferFunction,
+                                             snData, 10.0, 1.0 )
+
+    with pytest.raises( ValueError ):
+        _ = fdm.scatterDiagramFatigueDamage( scatterTable, w, transferFunction[ : -1 ],
+                                             snData, 10.0, 1.0 )
+
+    with pytest.raises( ValueError ):
+        _ = fdm.scatterDiagramFatigueDamage( scatterTable, w, transferFunction,
+                                             snData, 10.0, -1.0 )
+
+    with pytest.raises( ValueError ):
+        _ = fdm.scatterDiagramFatigueDamage( scatterTable, w, transferFunction,
+                                             snData, 10.0, 1.0, cellBlockSize=0 )
+
+    with pytest.raises( ValueError ):
+        _ = fdm.scatterDiagramFatigueDamage( scatterTable, w, transferFunction,
+                                             snData, 10.0, 1.0, numWorkers=0 )
+
+
+def test_scatterDiagramFatigueDamage_singleCell_sameAsRayleighIntegration():
+    Hs, Tp = 3.0, 8.0
+    w = np.linspace( 0.05, 4.0, 4000 )
+    transferFunction = _transferFunction( w )
+    snData = [ [ 1e5, 200 ], [ 1e7, 50 ] ]
+    fatigueLimit = 10.0
+    duration = 3600.0
+
+    calDamage, calCellDamage = fdm.scatterDiagramFatigueDamage(
+        [ [ Hs, Tp, 1.0 ] ], w, transferFunction, snData, fatigueLimit, duration )
+
+    waveSpectrum = lsm.jonswapSpectrum( w, 2 * np.pi / Tp, alpha=1.0 )
+    waveSpectrum *= Hs ** 2 / 16 / np.trapz( waveSpectrum, w )
+    responseSpectrum = waveSpectrum * transferFunction ** 2
+    m0 = np.trapz( responseSpectrum, w )
+    m2 = np.trapz( w ** 2 * responseSpectrum, w )
+    slope, intercept = utils.SnCurveFitter( snData, fatigueLimit=fatigueLimit ).fitter.coef
+    stressRange = np.linspace( fatigueLimit, 20 * np.sqrt( m0 ), 200000 )
+    density = stressRange / ( 4 * m0 ) * np.exp( -stressRange ** 2 / ( 8 * m0 ) )
+    cycles = np.power( 10.0, slope * stressRange + intercept )
+    expectedDamage = duration * np.sqrt( m2 / m0 ) / ( 2 * np.pi ) * \
+        np.trapz( density / cycles, stressRange )
+
+    np.testing.assert_allclose( calDamage, expectedDamage, rtol=1e-5 )
+    np.testing.assert_allclose( calCellDamage, [ expectedDamage ], rtol=1e-5 )
+
+
+def test_scatterDiagramFatigueDamage_blocksAndWorkers_sameResult():
+    randomState = np.random.RandomState( 5 )
+    Hs = randomState.uniform( 0.5, 8.0, 300 )
+    Tp = randomState.uniform( 4.0, 16.0, 300 )
+    counts = randomState.randint( 0, 50, 300 )
+    scatterTable = np.stack( [ Hs, Tp, counts ], axis=1 )
+    w = np.linspace( 0.05, 4.0, 500 )
+    transferFunction = _transferFunction( w ) * np.exp( 1j * w )
+    snData = [ [ 1e5, 200 ], [ 1e7, 50 ] ]
+
+    expectedDamage, expectedCellDamage = fdm.scatterDiagramFatigueDamage(
+        scatterTable, w, transferFunction, snData, 10.0, 1e8, cellBlockSize=1000 )
+    calDamage, calCellDamage = fdm.scatterDiagramFatigueDamage(
+        scatterTable, w, transferFunction, snData, 10.0, 1e8, cellBlockSize=7,
+        numWorkers=4 )
+    np.testing.assert_allclose( calCellDamage, expectedCellDamage )
+    np.testing.assert_allclose( calDamage, expectedDamage )
+    np.testing.assert_allclose( np.sum( calCellDamage ), calDamage )
+    np.testing.assert_array_equal( calCellDamage[ counts == 0 ], 0.0 )
+
+
+def test_scatterDiagramFatigueDamage_countsAndZeroWave_weightedSum():
+    w = np.linspace( 0.05, 4.0, 500 )
+    transferFunction = _transferFunction( w )
+    snData = [ [ 1e5, 200 ], [ 1e7, 50 ] ]
+
+    _, cellDamage = fdm.scatterDiagramFatigueDamage(
+        [ [ 2.0, 7.0, 1.0 ], [ 4.0, 9.0, 1.0 ], [ 0.0, 5.0, 1.0 ] ], w,
+        transferFunction, snData, 10.0, 3.0 )
+    calDamage, _ = fdm.scatterDiagramFatigueDamage(
+        [ [ 2.0, 7.0, 10.0 ], [ 4.0, 9.0, 30.0 ], [ 0.0, 5.0, 60.0 ] ], w,
+        transferFunction, snData, 10.0, 1.0 )
+    np.testing.assert_allclose( cellDamage[ 2 ], 0.0 )
+    np.testing.assert_allclose( calDamage, 0.1 * cellDamage[ 0 ] + 0.3 * cellDamage[ 1 ] )
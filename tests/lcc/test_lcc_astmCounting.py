@@ -1177,3 +1177,40 @@ def test_astmRainflowRepeatHistoryCounting_normalUseCase_pass( mock_get ):
     calRst = lcc.astmRainflowRepeatHistoryCounting( data, aggregate=True )
     expectedRst = [ [ 3.0, 1 ], [ 4.0, 1 ], [ 7.0, 1 ], [ 9.0, 1 ] ]
     np.testing.assert_allclose( calRst, expectedRst )
+
+
+###############################################################################
+# Test astmRainflowCountingBatch
+###############################################################################
+def test_astmRainflowCountingBatch_incorrectDim_valueError():
+    data = [ 1.0, 2.0, 3.0 ]
+    with pytest.raises( ValueError ):
+        _ = lcc.astmRainflowCountingBatch( data )
+
+    data = [ [ 1.0 ], [ 2.0 ] ]
+    with pytest.raises( ValueError ):
+        _ = lcc.astmRainflowCountingBatch( data )
+
+
+def test_astmRainflowCountingBatch_normalUseCase_pass():
+    # rainflow counting data from E1049-85(2017) Fig.6
+    data = [ [ -2.0, 1.0, -3.0, 5.0, -1.0, 3.0, -4.0, 4.0, -2.0 ],
+             [ 0.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 0.0 ] ]
+    calRanges, calCounts = lcc.astmRainflowCountingBatch( data )
+    expectedRanges = [ [ 3.0, 4.0, 4.0, 8.0, 9.0, 8.0, 6.0 ],
+                       [ 1.0, 1.0, 0.0, 0.0, 0.0, 0.0, 0.0 ] ]
+    expectedCounts = [ [ 0.5, 0.5, 1.0, 0.5, 0.5, 0.5, 0.5 ],
+                       [ 0.5, 0.5, 0.0, 0.0, 0.0, 0.0, 0.0 ] ]
+    np.testing.assert_allclose( calRanges, expectedRanges )
+    np.testing.assert_allclose( calCounts, expectedCounts )
+
+
+def test_astmRainflowCountingBatch_randomSequences_sameAsRainflowCounting():
+    randomState = np.random.RandomState( 5 )
+    data = randomState.randint( -5, 6, size=( 20, 50 ) ).astype( float )
+    calRanges, calCounts = lcc.astmRainflowCountingBatch( data )
+    for row, ranges, counts in zip( data, calRanges, calCounts ):
+        rstSeq = lcc.astmRainflowCounting( row, aggregate=False )
+        expectedRst = sorted( [ [ abs( p[ 1 ] - p[ 0 ] ), p[ 2 ] ] for p in rstSeq ] )
+        calRst = sorted( [ [ r, c ] for r, c in zip( ranges, counts ) if c > 0 ] )
+        np.testing.assert_allclose( calRst, expectedRst )
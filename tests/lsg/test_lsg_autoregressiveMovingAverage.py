@@ -100,6 +100,66 @@ def test_arNormal_ar2FourStepsCase_threePointsOutput( mock_get ):
     np.testing.assert_allclose( calRst, expectedRst )
 
 
+@patch( "numpy.random.normal" )
+def test_arNormal_longSequenceCase_matchRecursion( mock_get ):
+    eps = np.sin( np.arange( 200 ) )
+    mock_get.return_value = eps
+    obs = [ 1.0, -1.0, 0.5 ]
+    phis = [ 0.5, -0.3, 0.1 ]
+    calRst = lsg.arNormal( 200, obs, phis, 0, 0.5 )
+    expectedRst = obs + [ 0.0 ] * 197
+    for i in range( 3, 200 ):
+        expectedRst[ i ] = eps[ i ] + sum( phis[ j ] * expectedRst[ i - j - 1 ] 
+                                           for j in range( 3 ) )
+    assert isinstance( calRst, np.ndarray )
+    assert calRst.dtype == np.float64
+    np.testing.assert_allclose( calRst, expectedRst )
+
+
+def test_arNormal_rngCase_reproducibleAndGlobalStateUntouched():
+    obs = [ 0, 1 ]
+    phis = [ 0.5, 0.3 ]
+    np.random.seed( 2023 )
+    expectedGlobal = np.random.uniform()
+    np.random.seed( 2023 )
+    rst1 = lsg.arNormal( 50, obs, phis, 0, 0.5, rng=np.random.default_rng( 1 ) )
+    rst2 = lsg.arNormal( 50, obs, phis, 0, 0.5, randomSeed=7, 
+                         rng=np.random.default_rng( 1 ) )
+    np.testing.assert_array_equal( rst1, rst2 )
+    np.testing.assert_allclose( np.random.uniform(), expectedGlobal )
+
+    with pytest.raises( ValueError ):
+        _ = lsg.arNormal( 50, obs, phis, 0, 0.5, rng=2023 )
+
+
+def test_arNormal_globalConfigRng_usedWithoutSeed():
+    from ffpack.config import globalConfig
+    obs = [ 0, 1 ]
+    phis = [ 0.5, 0.3 ]
+    try:
+        globalConfig.rng = np.random.default_rng( 5 )
+        rst1 = lsg.arNormal( 50, obs, phis, 0, 0.5 )
+        globalConfig.rng = np.random.default_rng( 5 )
+        rst2 = lsg.arNormal( 50, obs, phis, 0, 0.5 )
+        rst3 = lsg.arNormal( 50, obs, phis, 0, 0.5, rng=np.random.default_rng( 5 ) )
+        np.testing.assert_array_equal( rst1, rst2 )
+        np.testing.assert_array_equal( rst1, rst3 )
+
+        # an integer randomSeed still seeds the global legacy random state
+        rst4 = lsg.arNormal( 50, obs, phis, 0, 0.5, randomSeed=2023 )
+        rst5 = lsg.arNormal( 50, obs, phis, 0, 0.5, randomSeed=2023 )
+        np.testing.assert_array_equal( rst4, rst5 )
+
+        globalConfig.setSeed( 7 )
+        rst6 = lsg.arNormal( 50, obs, phis, 0, 0.5 )
+        globalConfig.setSeed( 7 )
+        rst7 = lsg.arNormal( 50, obs, phis, 0, 0.5 )
+        np.testing.assert_array_equal( rst6, rst7 )
+    finally:
+        globalConfig.setSeed( None )
+    assert globalConfig.rng is None
+
+
 ###############################################################################
 # Test maNormal
 ###############################################################################
@@ -375,6 +435,66 @@ def test_armaNormal_threeStepCase_outputDepends( mock_get ):
     np.testing.assert_allclose( calRst, expectedRst )
 
 
+@patch( "numpy.random.normal" )
+def test_armaNormal_obsLongerThanStepsCase_obsOutput( mock_get ):
+    mock_get.return_value = [ 1.0, 2.0 ]
+    obs = [ 1.0, 2.0, 3.0 ]
+    phis = [ 0.5 ]
+    thetas = [ 0.8 ]
+    calRst = lsg.armaNormal( 2, obs, phis, thetas, 0, 0.5 )
+    expectedRst = [ 1.0, 2.0 ]
+    np.testing.assert_allclose( calRst, expectedRst )
+
+
+###############################################################################
+# Test armaNormalBatch
+###############################################################################
+def test_armaNormalBatch_invalidInputCase_valueError():
+    obs = [ 0, 1 ]
+    phis = [ 0.5, 0.3 ]
+    thetas = [ 0.8, 0.5 ]
+    with pytest.raises( ValueError ):
+        _ = lsg.armaNormalBatch( 0, 10, obs, phis, thetas, 0, 0.5 )
+
+    with pytest.raises( ValueError ):
+        _ = lsg.armaNormalBatch( 2, 0, obs, phis, thetas, 0, 0.5 )
+
+    with pytest.raises( ValueError ):
+        _ = lsg.armaNormalBatch( 2, 10, obs, [ ], thetas, 0, 0.5 )
+
+    with pytest.raises( ValueError ):
+        _ = lsg.armaNormalBatch( 2, 10, obs, phis, [ ], 0, 0.5 )
+
+    with pytest.raises( ValueError ):
+        _ = lsg.armaNormalBatch( 2, 10, obs, phis, thetas, 0, 0.5, chunkSize=0 )
+
+
+def test_armaNormalBatch_chunkSizeCase_sameOutput():
+    obs = [ 0, 1 ]
+    phis = [ 0.5, 0.3 ]
+    thetas = [ 0.8, 0.5 ]
+    expectedRst = lsg.armaNormalBatch( 7, 50, obs, phis, thetas, 0.1, 0.5, 
+                                       randomSeed=2023 )
+    calRst = lsg.armaNormalBatch( 7, 50, obs, phis, thetas, 0.1, 0.5, 
+                                  randomSeed=2023, chunkSize=3 )
+    assert calRst.shape == ( 7, 50 )
+    np.testing.assert_allclose( calRst[ :, : 2 ], [ obs ] * 7 )
+    np.testing.assert_array_equal( calRst, expectedRst )
+
+
+def test_armaNormalBatch_eachRealizationCase_matchArmaNormal():
+    obs = [ 0, 1 ]
+    phis = [ 0.5, 0.3 ]
+    thetas = [ 0.8, 0.5 ]
+    calRst = lsg.armaNormalBatch( 4, 30, obs, phis, thetas, 0.1, 0.5, randomSeed=2023 )
+    streams = np.random.SeedSequence( 2023 ).spawn( 4 )
+    for i in range( 4 ):
+        eps = np.random.default_rng( streams[ i ] ).normal( 0.1, 0.5, 30 )
+        with patch( "numpy.random.normal", return_value=eps ):
+            expectedRst = lsg.armaNormal( 30, obs, phis, thetas, 0.1, 0.5 )
+        np.testing.assert_allclose( calRst[ i ], expectedRst )
+
+
 ###############################################################################
 # Test arimaNormal
 ###############################################################################
@@ -478,3 +598,47 @@ def test_arimaNormal_fourStepCase_outputDepends( mock_get ):
     calRst = lsg.arimaNormal( 4, 1.0, phis, thetas, 0, 0.5 )
     expectedRst = [ 2.0, 3.8, 7.0, 10.54 ]
     np.testing.assert_allclose( calRst, expectedRst )
+
+
+@patch( "numpy.random.normal" )
+def test_arimaNormal_longSequenceCase_matchRecursion( mock_get ):
+    eps = np.cos( np.arange( 200 ) )
+    mock_get.return_value = eps
+    phis = [ 0.5, 0.3, -0.2 ]
+    thetas = [ 0.8, 0.5 ]
+    calRst = lsg.arimaNormal( 200, 0.5, phis, thetas, 0, 0.5 )
+    expectedRst = [ 0.0 ] * 200
+    for i in range( 200 ):
+        expectedRst[ i ] = 0.5 + eps[ i ]
+        for j in range( 3 ):
+            if i > j + 1:
+                expectedRst[ i ] += phis[ j ] * ( expectedRst[ i - j - 1 ] - 
+                                                  expectedRst[ i - j - 2 ] )
+        for j in range( 2 ):
+            if i > j:
+                expectedRst[ i ] += thetas[ j ] * eps[ i - j - 1 ]
+    assert isinstance( calRst, np.ndarray )
+    np.testing.assert_allclose( calRst, expectedRst )
+
+
+def test_armaNormalBatch_rngCase_reproducible():
+    obs = [ 0, 1 ]
+    phis = [ 0.5, 0.3 ]
+    thetas = [ 0.8, 0.5 ]
+    rst1 = lsg.armaNormalBatch( 4, 30, obs, phis, thetas, 0, 0.5, 
+                                rng=np.random.default_rng( 1 ) )
+    rst2 = lsg.armaNormalBatch( 4, 30, obs, phis, thetas, 0, 0.5, chunkSize=3, 
+                                rng=np.random.default_rng( 1 ) )
+    np.testing.assert_array_equal( rst1, rst2 )
+
+
+def test_armaNormalBatch_globalConfigRng_reproducible():
+    from ffpack.config import globalConfig
+    try:
+        globalConfig.setSeed( 0 )
+        rst1 = lsg.armaNormalBatch( 2, 5, [ 0 ], [ 0.5 ], [ 0.3 ], 0, 1 )
+        globalConfig.setSeed( 0 )
+        rst2 = lsg.armaNormalBatch( 2, 5, [ 0 ], [ 0.5 ], [ 0.3 ], 0, 1 )
+        np.testing.assert_array_equal( rst1, rst2 )
+    finally:
+        globalConfig.setSeed( None )
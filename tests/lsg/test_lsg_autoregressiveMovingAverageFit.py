@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+
+from ffpack import lsg
+import numpy as np
+import pytest
+from scipy import linalg
+
+
+###############################################################################
+# Test arLevinsonDurbinFit
+###############################################################################
+def test_arLevinsonDurbinFit_invalidInputCase_valueError():
+    data = np.sin( np.arange( 100 ) )
+    with pytest.raises( ValueError ):
+        _ = lsg.arLevinsonDurbinFit( [ data ], 2 )
+
+    with pytest.raises( ValueError ):
+        _ = lsg.arLevinsonDurbinFit( data, 0 )
+
+    with pytest.raises( ValueError ):
+        _ = lsg.arLevinsonDurbinFit( data[ : 4 ], 2 )
+
+    with pytest.raises( ValueError ):
+        _ = lsg.arLevinsonDurbinFit( data, 2, criterion="hqic" )
+
+    with pytest.raises( ValueError ):
+        _ = lsg.arLevinsonDurbinFit( np.ones( 100 ), 2 )
+
+
+def test_arLevinsonDurbinFit_fixedOrderCase_matchYuleWalker():
+    data = np.cos( 0.3 * np.arange( 200 ) ) + np.sin( 0.05 * np.arange( 200 ) ** 1.5 )
+    phis, mu, sigma = lsg.arLevinsonDurbinFit( data, 4, criterion=None )
+    centered = data - np.mean( data )
+    acov = np.array( [ centered[ : 200 - k ] @ centered[ k: ] / 200 
+                       for k in range( 5 ) ] )
+    expectedPhis = linalg.solve_toeplitz( acov[ : 4 ], acov[ 1: ] )
+    np.testing.assert_allclose( phis, expectedPhis )
+    np.testing.assert_allclose( sigma ** 2, acov[ 0 ] - expectedPhis @ acov[ 1: ] )
+    np.testing.assert_allclose( mu, np.mean( data ) * ( 1 - np.sum( expectedPhis ) ) )
+
+
+def test_arLevinsonDurbinFit_ar2Case_recoverModel():
+    data = lsg.arNormal( 50000, [ 0, 1 ], [ 0.5, 0.3 ], 0.2, 0.5, 
+                         rng=np.random.default_rng( 2023 ) )
+    phis, mu, sigma = lsg.arLevinsonDurbinFit( data, 10, criterion="bic" )
+    np.testing.assert_allclose( phis, [ 0.5, 0.3 ], atol=0.02 )
+    np.testing.assert_allclose( mu, 0.2, atol=0.02 )
+    np.testing.assert_allclose( sigma, 0.5, atol=0.01 )
+
+    # plug into the generator
+    rst = lsg.arNormal( 100, data[ -len( phis ): ], phis, mu, sigma )
+    assert len( rst ) == 100
+
+
+###############################################################################
+# Test armaHannanRissanenFit
+###############################################################################
+def test_armaHannanRissanenFit_invalidInputCase_valueError():
+    data = np.sin( np.arange( 1000 ) ) + np.cos( 0.1 * np.arange( 1000 ) ** 1.3 )
+    with pytest.raises( ValueError ):
+        _ = lsg.armaHannanRissanenFit( data, 0, 1 )
+
+    with pytest.raises( ValueError ):
+        _ = lsg.armaHannanRissanenFit( data, 1, 0 )
+
+    with pytest.raises( ValueError ):
+        _ = lsg.armaHannanRissanenFit( data, 1, 1, arOrder=0 )
+
+    with pytest.raises( ValueError ):
+        _ = lsg.armaHannanRissanenFit( data[ : 20 ], 2, 2 )
+
+    with pytest.raises( ValueError ):
+        _ = lsg.armaHannanRissanenFit( data, 1, 1, criterion="hqic" )
+
+
+def test_armaHannanRissanenFit_arma11Case_recoverModel():
+    data = lsg.armaNormal( 50000, [ ], [ 0.6 ], [ 0.4 ], 0.3, 0.5, 
+                           rng=np.random.default_rng( 2023 ) )
+    phis, thetas, mu, sigma = lsg.armaHannanRissanenFit( data, 3, 3 )
+    np.testing.assert_allclose( phis, [ 0.6 ], atol=0.03 )
+    np.testing.assert_allclose( thetas, [ 0.4 ], atol=0.03 )
+    np.testing.assert_allclose( mu, 0.3, atol=0.03 )
+    np.testing.assert_allclose( sigma, 0.5, atol=0.01 )
+
+    # plug into the generator
+    rst = lsg.armaNormal( 100, [ ], phis, thetas, mu, sigma )
+    assert len( rst ) == 100
+
+
+def test_armaHannanRissanenFit_fixedOrderCase_maxOrders():
+    data = lsg.armaNormal( 5000, [ ], [ 0.6 ], [ 0.4 ], 0, 0.5, 
+                           rng=np.random.default_rng( 2023 ) )
+    phis, thetas, _, _ = lsg.armaHannanRissanenFit( data, 2, 3, criterion=None )
+    assert len( phis ) == 2
+    assert len( thetas ) == 3
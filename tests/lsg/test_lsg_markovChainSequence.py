@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+
+from ffpack import lsg
+import numpy as np
+import pytest
+
+
+def getTransitionMatrix():
+    return np.array( [ [ 0.0, 0.25, 0.75 ], 
+                       [ 1.0, 0.0, 1.0 ], 
+                       [ 0.4, 0.6, 0.0 ] ] ), np.array( [ -1.0, 0.0, 1.0 ] )
+
+
+###############################################################################
+# Test countingMatrixToTransitionMatrix
+###############################################################################
+def test_countingMatrixToTransitionMatrix_invalidInputCase_valueError():
+    with pytest.raises( ValueError ):
+        _ = lsg.countingMatrixToTransitionMatrix( [ [ ] ], [ ] )
+
+    with pytest.raises( ValueError ):
+        _ = lsg.countingMatrixToTransitionMatrix( [ [ 0, 1 ] ], [ "0.0", "1.0" ] )
+
+    with pytest.raises( ValueError ):
+        _ = lsg.countingMatrixToTransitionMatrix( [ [ 0, 1 ], [ 0, 0 ] ], [ "0.0" ] )
+
+    with pytest.raises( ValueError ):
+        _ = lsg.countingMatrixToTransitionMatrix( [ [ 0, -1 ], [ 0, 0 ] ], [ 0, 1 ] )
+
+    with pytest.raises( ValueError ):
+        _ = lsg.countingMatrixToTransitionMatrix( [ [ 1, 0 ], [ 0, 2 ] ], [ 0, 1 ] )
+
+
+def test_countingMatrixToTransitionMatrix_normalCase_symmetrizedRows():
+    countingMatrix = [ [ 0, 1, 0 ], [ 0, 0, 0 ], [ 3, 1, 0 ] ]
+    matrixIndexKey = [ "-1.00000000", "0.00000000", "1,000.00000000" ]
+    calTransition, calLevels = lsg.countingMatrixToTransitionMatrix( countingMatrix, 
+                                                                     matrixIndexKey )
+    expectedTransition = [ [ 0.0, 0.25, 0.75 ], [ 1.0, 0.0, 1.0 ], [ 0.75, 0.25, 0.0 ] ]
+    np.testing.assert_allclose( calTransition, expectedTransition )
+    np.testing.assert_allclose( calLevels, [ -1.0, 0.0, 1000.0 ] )
+
+
+def test_countingMatrixToTransitionMatrix_unsortedKeyCase_sortedLevels():
+    countingMatrix = [ [ 0, 2 ], [ 0, 0 ] ]
+    calTransition, calLevels = lsg.countingMatrixToTransitionMatrix( countingMatrix, 
+                                                                     [ 1.0, -1.0 ] )
+    np.testing.assert_allclose( calTransition, [ [ 0.0, 1.0 ], [ 1.0, 0.0 ] ] )
+    np.testing.assert_allclose( calLevels, [ -1.0, 1.0 ] )
+
+
+###############################################################################
+# Test markovChainTurningPoints
+###############################################################################
+def test_markovChainTurningPoints_invalidInputCase_valueError():
+    transitionMatrix, levels = getTransitionMatrix()
+    with pytest.raises( ValueError ):
+        _ = lsg.markovChainTurningPoints( 0, transitionMatrix, levels )
+
+    with pytest.raises( ValueError ):
+        _ = lsg.markovChainTurningPoints( 1.5, transitionMatrix, levels )
+
+    with pytest.raises( ValueError ):
+        _ = lsg.markovChainTurningPoints( 10, transitionMatrix, levels[ : 2 ] )
+
+    with pytest.raises( ValueError ):
+        _ = lsg.markovChainTurningPoints( 10, -transitionMatrix, levels )
+
+    with pytest.raises( ValueError ):
+        _ = lsg.markovChainTurningPoints( 10, transitionMatrix, levels, initLevel=1.0 )
+
+    with pytest.raises( ValueError ):
+        _ = lsg.markovChainTurningPoints( 10, [ [ 0, 1 ], [ 0, 0 ] ], [ 0, 1 ] )
+
+
+def test_markovChainTurningPoints_normalCase_alternatingTurningPoints():
+    transitionMatrix, levels = getTransitionMatrix()
+    calRst = lsg.markovChainTurningPoints( 1001, transitionMatrix, levels, 
+                                           randomSeed=2023 )
+    assert calRst.shape == ( 1001, )
+    assert calRst[ 0 ] == -1.0
+    np.testing.assert_array_less( 0, np.diff( calRst )[ 0:: 2 ] )
+    np.testing.assert_array_less( np.diff( calRst )[ 1:: 2 ], 0 )
+
+
+def test_markovChainTurningPoints_initLevelCase_startFromInitLevel():
+    transitionMatrix, levels = getTransitionMatrix()
+    calRst = lsg.markovChainTurningPoints( 10, transitionMatrix, levels, initLevel=0.0,
+                                           randomSeed=2023 )
+    assert calRst[ 0 ] == 0.0
+    assert calRst[ 1 ] == 1.0
+
+
+def test_markovChainTurningPoints_longSequenceCase_matchTransitionMatrix():
+    transitionMatrix, levels = getTransitionMatrix()
+    calRst = lsg.markovChainTurningPoints( 200001, transitionMatrix, levels, 
+                                           rng=np.random.default_rng( 2023 ) )
+    index = np.searchsorted( levels, calRst )
+    counts = np.zeros( ( 3, 3 ) )
+    np.add.at( counts, ( index[ : -1 ], index[ 1: ] ), 1 )
+    # The highest minimum has no upward and the lowest maximum no downward
+    # transitions, so their rows stay zero
+    up = np.triu( counts, 1 )
+    upSum = up.sum( axis=1, keepdims=True )
+    calTransition = np.divide( up, upSum, out=np.zeros_like( up ), where=upSum > 0 )
+    np.testing.assert_allclose( calTransition, np.triu( transitionMatrix, 1 ), atol=0.01 )
+    down = np.tril( counts, -1 )
+    downSum = down.sum( axis=1, keepdims=True )
+    calTransition = np.divide( down, downSum, out=np.zeros_like( down ), where=downSum > 0 )
+    np.testing.assert_allclose( calTransition, np.tril( transitionMatrix, -1 ), atol=0.01 )
+
+
+def test_markovChainTurningPoints_seedCase_reproducible():
+    transitionMatrix, levels = getTransitionMatrix()
+    rst1 = lsg.markovChainTurningPoints( 100, transitionMatrix, levels, 
+                                         rng=np.random.default_rng( 1 ) )
+    rst2 = lsg.markovChainTurningPoints( 100, transitionMatrix, levels, 
+                                         rng=np.random.default_rng( 1 ) )
+    np.testing.assert_array_equal( rst1, rst2 )
+    rst1 = lsg.markovChainTurningPoints( 100, transitionMatrix, levels, randomSeed=1 )
+    rst2 = lsg.markovChainTurningPoints( 100, transitionMatrix, levels, randomSeed=1 )
+    np.testing.assert_array_equal( rst1, rst2 )
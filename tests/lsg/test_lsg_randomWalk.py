@@ -49,3 +49,42 @@ def test_randomWalkUniform_normalUseCase_diffByOne():
     sumRowRst = np.sum( np.array( calRst ), axis=1 ).astype( int )
     for i in range( 1, len( sumRowRst ) ):
         assert abs( sumRowRst[ i ] - sumRowRst[ i - 1 ] ) == 1
+
+
+def test_randomWalkUniform_numWalksLessThanOneCase_valueError():
+    with pytest.raises( ValueError ):
+        _ = lsg.randomWalkUniform( 1, numWalks=0 )
+
+    with pytest.raises( ValueError ):
+        _ = lsg.randomWalkUniform( 1, numWalks=1.5 )
+
+
+def test_randomWalkUniform_normalUseCase_intArrayFromOrigin():
+    calRst = lsg.randomWalkUniform( 100, dim=3, randomSeed=2023 )
+    assert calRst.shape == ( 101, 3 )
+    assert calRst.dtype.kind == "i"
+    np.testing.assert_array_equal( calRst[ 0 ], [ 0, 0, 0 ] )
+
+    # same steps as drawing the directions one by one
+    np.random.seed( 2023 )
+    expectedRst = [ [ 0, 0, 0 ] ]
+    for i in range( 100 ):
+        randomInt = np.random.randint( 6 )
+        lastCoords = list( expectedRst[ -1 ] )
+        lastCoords[ randomInt % 3 ] += 1 if randomInt >= 3 else -1
+        expectedRst.append( lastCoords )
+    np.testing.assert_array_equal( calRst, expectedRst )
+
+
+def test_randomWalkUniform_numWalksCase_unitSteps():
+    calRst = lsg.randomWalkUniform( 100, dim=2, randomSeed=2023, numWalks=5 )
+    assert calRst.shape == ( 5, 101, 2 )
+    np.testing.assert_array_equal( calRst[ :, 0 ], np.zeros( ( 5, 2 ) ) )
+    np.testing.assert_array_equal( np.abs( np.diff( calRst, axis=1 ) ).sum( axis=2 ), 1 )
+
+
+def test_randomWalkUniform_rngCase_reproducible():
+    rst1 = lsg.randomWalkUniform( 100, dim=2, rng=np.random.default_rng( 2023 ) )
+    rst2 = lsg.randomWalkUniform( 100, dim=2, rng=np.random.default_rng( 2023 ) )
+    np.testing.assert_array_equal( rst1, rst2 )
+    np.testing.assert_array_equal( np.abs( np.diff( rst1, axis=0 ) ).sum( axis=1 ), 1 )
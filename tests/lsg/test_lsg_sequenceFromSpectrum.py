@@ -54,9 +54,15 @@ def test_spectralRepresentation_freqIncorrect_valueError():
     freq = [ 0.2, 0.1, 0.2, 0.3, 0.4, 0.5 ]
     with pytest.raises( ValueError ):
         _ = lsg.spectralRepresentation( fs, time, freq, psd )
-    freq = [ 0, 0.1, 0.2, 0.3, 0.5 ]
+
+    # case 5: freq is not equally spaced for the fft method or with freqBandwidth
+    freq = [ 0, 0.1, 0.2, 0.3, 0.5, 0.6 ]
     with pytest.raises( ValueError ):
-        _ = lsg.spectralRepresentation( fs, time, freq, psd )
+        _ = lsg.spectralRepresentation( fs, time, freq, psd, method="fft" )
+    with pytest.raises( ValueError ):
+        _ = lsg.spectralRepresentation( fs, time, freq, psd, freqBandwidth=0.2 )
+    ts, amps = lsg.spectralRepresentation( fs, time, freq, psd )
+    assert len( amps ) == fs * time
 
 
 def test_spectralRepresentation_psdIncorrect_valueError():    
@@ -97,3 +103,278 @@ def test_randomWalkUniform_normalUseCase_diffByOne():
     # case 2: user defined freqBandwidth
     ts, rst = lsg.spectralRepresentation( fs, time, freq, psd, freqBandwidth=0.2 )
     np.testing.assert_allclose( len( ts ), fs * time )
+
+
+def test_spectralRepresentation_methodIncorrect_valueError():
+    fs = 100
+    time = 10
+    freq = [ 0, 0.1, 0.2, 0.3, 0.4, 0.5 ]
+    psd = [ 0.01, 2, 0.05, 0.04, 0.01, 0.03 ]
+    with pytest.raises( ValueError ):
+        _ = lsg.spectralRepresentation( fs, time, freq, psd, method="ifft" )
+
+    # fs is not an integer multiple of the frequency spacing
+    with pytest.raises( ValueError ):
+        _ = lsg.spectralRepresentation( 100.05, time, freq, psd, method="fft" )
+
+
+def test_spectralRepresentation_unequalFreqIncorrect_valueError():
+    fs = 20
+    time = 10
+    freq = [ 0, 0.1, 0.3, 0.7 ]
+    psd = [ 1, 1, 1, 1 ]
+
+    # case 1: fft method needs equally spaced freq
+    with pytest.raises( ValueError ):
+        _ = lsg.spectralRepresentation( fs, time, freq, psd, method="fft" )
+
+    # case 2: freqBandwidth is not defined for unequally spaced freq
+    with pytest.raises( ValueError ):
+        _ = lsg.spectralRepresentation( fs, time, freq, psd, freqBandwidth=0.2 )
+
+
+def test_spectralRepresentation_unequalFreq_varianceMatchPsdIntegral():
+    fs = 20
+    time = 2000
+    freq = np.sort( np.random.RandomState( 7 ).uniform( 0.05, 2.0, 300 ) )
+    psd = np.exp( -np.square( freq - 0.8 ) / 0.1 )
+
+    ts, rst = lsg.spectralRepresentation( fs, time, freq, psd, randomSeed=2023 )
+    assert len( ts ) == fs * time
+    np.testing.assert_allclose( np.var( rst ), np.trapz( psd, freq ), rtol=0.05 )
+
+    # blocks of time give the same sequence for unequally spaced freq
+    _, calRst = lsg.spectralRepresentation( fs, time, freq, psd, randomSeed=2023,
+                                            blockSize=999, numWorkers=2 )
+    np.testing.assert_allclose( calRst, rst )
+
+    # a small unequally spaced freq set is accepted by the direct method
+    ts, rst = lsg.spectralRepresentation( 20, 5.0, [ 0, 0.1, 0.3, 0.7 ], [ 1, 1, 1, 1 ] )
+    assert len( rst ) == 100
+
+
+def test_spectralRepresentation_fftMethod_matchDirectMethod():
+    # case 1: frequencies on the FFT grid, one period
+    fs = 100
+    freq = [ 0, 0.1, 0.2, 0.3, 0.4, 0.5 ]
+    psd = [ 0.01, 2, 0.05, 0.04, 0.01, 0.03 ]
+    _, expectedRst = lsg.spectralRepresentation( fs, 10, freq, psd, randomSeed=2023 )
+    _, calRst = lsg.spectralRepresentation( fs, 10, freq, psd, randomSeed=2023, 
+                                            method="fft" )
+    np.testing.assert_allclose( calRst, expectedRst, atol=1e-10 )
+
+    # case 2: shifted frequencies, tiled periods and freqBandwidth
+    fs = 10
+    freq = 0.03 + 0.1 * np.arange( 20 )
+    psd = np.linspace( 1.0, 0.1, 20 )
+    _, expectedRst = lsg.spectralRepresentation( fs, 35, freq, psd, freqBandwidth=0.2, 
+                                                 randomSeed=2023 )
+    ts, calRst = lsg.spectralRepresentation( fs, 35, freq, psd, freqBandwidth=0.2, 
+                                             randomSeed=2023, method="fft" )
+    assert len( ts ) == 350
+    np.testing.assert_allclose( calRst, expectedRst, atol=1e-10 )
+
+
+def test_spectralRepresentation_blockSizeOrNumWorkersIncorrect_valueError():
+    fs = 100
+    time = 10
+    freq = [ 0, 0.1, 0.2, 0.3, 0.4, 0.5 ]
+    psd = [ 0.01, 2, 0.05, 0.04, 0.01, 0.03 ]
+    with pytest.raises( ValueError ):
+        _ = lsg.spectralRepresentation( fs, time, freq, psd, blockSize=0 )
+
+    with pytest.raises( ValueError ):
+        _ = lsg.spectralRepresentation( fs, time, freq, psd, numWorkers=0 )
+
+
+def test_spectralRepresentation_blocksAndWorkers_sameOutput():
+    fs = 100
+    time = 10
+    freq = [ 0, 0.1, 0.2, 0.3, 0.4, 0.5 ]
+    psd = [ 0.01, 2, 0.05, 0.04, 0.01, 0.03 ]
+    _, expectedRst = lsg.spectralRepresentation( fs, time, freq, psd, randomSeed=2023 )
+    _, calRst = lsg.spectralRepresentation( fs, time, freq, psd, randomSeed=2023, 
+                                            blockSize=7 )
+    np.testing.assert_allclose( calRst, expectedRst )
+
+    _, calRst = lsg.spectralRepresentation( fs, time, freq, psd, randomSeed=2023, 
+                                            blockSize=100, numWorkers=3 )
+    np.testing.assert_allclose( calRst, expectedRst )
+
+    # single block against the harmonic sum
+    np.random.seed( 2023 )
+    phis = -np.pi + 2 * np.pi * np.random.randn( len( freq ) )
+    ts = np.arange( fs * time ) / fs
+    expectedRst = np.zeros( fs * time )
+    for i in range( len( freq ) ):
+        expectedRst += np.sqrt( 2 * psd[ i ] * 0.1 ) * \
+            np.sin( 2 * np.pi * freq[ i ] * ts + phis[ i ] )
+    np.testing.assert_allclose( calRst, expectedRst, atol=1e-10 )
+
+
+###############################################################################
+# Test multivariateSpectralRepresentation
+###############################################################################
+def test_multivariateSpectralRepresentation_inputIncorrect_valueError():
+    fs = 10
+    time = 10
+    freq = [ 0.1, 0.2, 0.3, 0.4, 0.5 ]
+    psd = [ 0.01, 2, 0.05, 0.04, 0.01 ]
+    csd = np.multiply.outer( psd, [ [ 1.0, 0.6 ], [ 0.6, 1.0 ] ] )
+    with pytest.raises( ValueError ):
+        _ = lsg.multivariateSpectralRepresentation( -1, time, freq, csd )
+
+    with pytest.raises( ValueError ):
+        _ = lsg.multivariateSpectralRepresentation( fs, time, [ 0.1, 0.2, 0.4 ], csd[ : 3 ] )
+
+    # fs is not an integer multiple of the frequency spacing
+    with pytest.raises( ValueError ):
+        _ = lsg.multivariateSpectralRepresentation( 10.05, time, freq, csd )
+
+    with pytest.raises( ValueError ):
+        _ = lsg.multivariateSpectralRepresentation( fs, time, freq, csd[ :, 0 ] )
+
+    with pytest.raises( ValueError ):
+        _ = lsg.multivariateSpectralRepresentation( fs, time, freq, csd[ : 4 ] )
+
+    # coherence larger than 1
+    csd = np.multiply.outer( psd, [ [ 1.0, 1.5 ], [ 1.5, 1.0 ] ] )
+    with pytest.raises( ValueError ):
+        _ = lsg.multivariateSpectralRepresentation( fs, time, freq, csd )
+
+
+def test_multivariateSpectralRepresentation_singleChannel_matchHarmonicSum():
+    fs = 10
+    time = 25
+    freq = [ 0.1, 0.2, 0.3, 0.4, 0.5 ]
+    psd = [ 0.01, 2, 0.05, 0.04, 0.01 ]
+    ts, calRst = lsg.multivariateSpectralRepresentation( fs, time, freq, 
+                                                         np.reshape( psd, ( 5, 1, 1 ) ), 
+                                                         randomSeed=2023 )
+    assert calRst.shape == ( 250, 1 )
+
+    np.random.seed( 2023 )
+    phis = np.random.uniform( -np.pi, np.pi, ( 5, 1 ) )
+    expectedRst = np.zeros( 250 )
+    for i in range( 5 ):
+        expectedRst += np.sqrt( 2 * psd[ i ] * 0.1 ) * \
+            np.sin( 2 * np.pi * freq[ i ] * ts + phis[ i, 0 ] )
+    np.testing.assert_allclose( calRst[ :, 0 ], expectedRst, atol=1e-10 )
+
+
+def test_multivariateSpectralRepresentation_fullCoherence_sameChannels():
+    fs = 10
+    time = 10
+    freq = [ 0, 0.1, 0.2, 0.3, 0.4, 0.5 ]
+    psd = [ 0, 0.01, 2, 0.05, 0.04, 0.01 ]
+    csd = np.multiply.outer( psd, np.ones( ( 3, 3 ) ) )
+    _, calRst = lsg.multivariateSpectralRepresentation( fs, time, freq, csd, 
+                                                        randomSeed=2023 )
+    assert calRst.shape == ( 100, 3 )
+    assert np.std( calRst[ :, 0 ] ) > 0
+    np.testing.assert_allclose( calRst[ :, 1 ], calRst[ :, 0 ], atol=1e-6 )
+    np.testing.assert_allclose( calRst[ :, 2 ], calRst[ :, 0 ], atol=1e-6 )
+
+
+def test_spectralRepresentation_spawnedRng_reproducible():
+    from ffpack.config import globalConfig
+    fs = 100
+    time = 10
+    freq = [ 0, 0.1, 0.2, 0.3, 0.4, 0.5 ]
+    psd = [ 0.01, 2, 0.05, 0.04, 0.01, 0.03 ]
+    globalConfig.setSeed( 2023 )
+    rngs = globalConfig.spawnRng( 2 )
+    rst1 = [ lsg.spectralRepresentation( fs, time, freq, psd, rng=rng )[ 1 ] 
+             for rng in rngs ]
+    globalConfig.setSeed( 2023 )
+    rngs = globalConfig.spawnRng( 2 )
+    rst2 = [ lsg.spectralRepresentation( fs, time, freq, psd, rng=rng )[ 1 ] 
+             for rng in rngs ]
+    globalConfig.setSeed( None )
+    np.testing.assert_array_equal( rst1, rst2 )
+    assert not np.allclose( rst1[ 0 ], rst1[ 1 ] )
+
+    _, rst3 = lsg.multivariateSpectralRepresentation( fs, time, freq[ 1: ], 
+                                                      np.reshape( psd[ 1: ], ( 5, 1, 1 ) ), 
+                                                      rng=np.random.default_rng( 1 ) )
+    _, rst4 = lsg.multivariateSpectralRepresentation( fs, time, freq[ 1: ], 
+                                                      np.reshape( psd[ 1: ], ( 5, 1, 1 ) ), 
+                                                      rng=np.random.default_rng( 1 ) )
+    np.testing.assert_array_equal( rst3, rst4 )
+
+
+###############################################################################
+# Test directionalSpectralRepresentation
+###############################################################################
+def getDirectionalInput():
+    freq = np.arange( 1, 21 ) * 0.05
+    theta = np.linspace( -np.pi, np.pi, 13 )
+    dirPsd = np.outer( np.exp( -np.square( freq - 0.4 ) / 0.02 ), 
+                       np.square( np.cos( theta / 2 ) ) )
+    return freq, theta, dirPsd
+
+
+def test_directionalSpectralRepresentation_invalidInputCase_valueError():
+    freq, theta, dirPsd = getDirectionalInput()
+    with pytest.raises( ValueError ):
+        _ = lsg.directionalSpectralRepresentation( -1, 10, freq, theta, dirPsd )
+
+    with pytest.raises( ValueError ):
+        _ = lsg.directionalSpectralRepresentation( 1.234, 10, freq, theta, dirPsd )
+
+    with pytest.raises( ValueError ):
+        _ = lsg.directionalSpectralRepresentation( 2, 10, freq, theta[ :: -1 ], dirPsd )
+
+    with pytest.raises( ValueError ):
+        _ = lsg.directionalSpectralRepresentation( 2, 10, freq, theta, dirPsd.T )
+
+    with pytest.raises( ValueError ):
+        _ = lsg.directionalSpectralRepresentation( 2, 10, freq, theta, -dirPsd )
+
+    with pytest.raises( ValueError ):
+        _ = lsg.directionalSpectralRepresentation( 2, 10, freq, theta, dirPsd, 
+                                                   points=[ 0, 0 ] )
+
+    with pytest.raises( ValueError ):
+        _ = lsg.directionalSpectralRepresentation( 2, 10, freq, theta, dirPsd, 
+                                                   depth=0 )
+
+
+def test_directionalSpectralRepresentation_pointsCase_expectedShape():
+    freq, theta, dirPsd = getDirectionalInput()
+    points = [ [ 0, 0 ], [ 10, 0 ], [ 0, 0 ] ]
+    ts, amps = lsg.directionalSpectralRepresentation( 2, 40, freq, theta, dirPsd, 
+                                                      points=points, randomSeed=2023 )
+    assert ts.shape == ( 80, )
+    assert amps.shape == ( 80, 3 )
+    np.testing.assert_allclose( amps[ :, 0 ], amps[ :, 2 ] )
+    assert not np.allclose( amps[ :, 0 ], amps[ :, 1 ] )
+
+    _, calRst = lsg.directionalSpectralRepresentation( 2, 40, freq, theta, dirPsd, 
+                                                       randomSeed=2023 )
+    np.testing.assert_allclose( calRst, amps[ :, 0 ] )
+
+
+def test_directionalSpectralRepresentation_longCrestedCase_crestParallelPointsEqual():
+    freq, theta, _ = getDirectionalInput()
+    dirPsd = np.zeros( ( len( freq ), len( theta ) ) )
+    dirPsd[ :, 6 ] = np.exp( -np.square( freq - 0.4 ) / 0.02 )
+    points = [ [ 0, 0 ], [ 0, 25 ], [ 25, 0 ] ]
+    for depth in [ None, 20 ]:
+        _, amps = lsg.directionalSpectralRepresentation( 2, 40, freq, theta, dirPsd, 
+                                                         points=points, depth=depth,
+                                                         rng=np.random.default_rng( 1 ) )
+        np.testing.assert_allclose( amps[ :, 0 ], amps[ :, 1 ], atol=1e-10 )
+        assert not np.allclose( amps[ :, 0 ], amps[ :, 2 ] )
+
+
+def test_directionalSpectralRepresentation_ensembleCase_expectedVariance():
+    freq, theta, dirPsd = getDirectionalInput()
+    dtheta = np.full( len( theta ), theta[ 1 ] - theta[ 0 ] )
+    dtheta[ [ 0, -1 ] ] /= 2
+    expectedRst = np.sum( dirPsd * 0.05 * dtheta )
+    rng = np.random.default_rng( 2023 )
+    variances = [ np.var( lsg.directionalSpectralRepresentation( 
+        2, 20, freq, theta, dirPsd, points=[ [ 30, 40 ] ], rng=rng )[ 1 ] ) 
+        for _ in range( 400 ) ]
+    np.testing.assert_allclose( np.mean( variances ), expectedRst, rtol=0.1 )
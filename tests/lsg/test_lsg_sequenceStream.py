@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+
+from ffpack import lsg
+import numpy as np
+import pytest
+from unittest.mock import patch
+
+
+blockSizes = [ 1, 2, 3, 7, 50, 100 ]
+
+
+def getBlocks( stream ):
+    return np.concatenate( [ stream.nextBlock( n ) for n in blockSizes ] )
+
+
+def getNoise( randomSeed, mu, sigma ):
+    return np.random.default_rng( randomSeed ).normal( mu, sigma, sum( blockSizes ) )
+
+
+###############################################################################
+# Test ArNormalStream
+###############################################################################
+def test_ArNormalStream_invalidInputCase_valueError():
+    with pytest.raises( ValueError ):
+        _ = lsg.ArNormalStream( [ 0, 0 ], [ 0.3 ], 0, 0.5 )
+
+    with pytest.raises( ValueError ):
+        _ = lsg.ArNormalStream( [ ], [ ], 0, 0.5 )
+
+    stream = lsg.ArNormalStream( [ 0, 0 ], [ 0.5, 0.3 ], 0, 0.5 )
+    with pytest.raises( ValueError ):
+        _ = stream.nextBlock( 0 )
+
+    with pytest.raises( ValueError ):
+        _ = stream.nextBlock( 1.5 )
+
+
+def test_ArNormalStream_blocksCase_matchArNormal():
+    obs = [ 1.0, -1.0, 0.5 ]
+    phis = [ 0.5, -0.3, 0.1 ]
+    stream = lsg.ArNormalStream( obs, phis, 0.1, 0.5, randomSeed=2023 )
+    calRst = getBlocks( stream )
+    with patch( "numpy.random.normal", return_value=getNoise( 2023, 0.1, 0.5 ) ):
+        expectedRst = lsg.arNormal( sum( blockSizes ), obs, phis, 0.1, 0.5 )
+    np.testing.assert_allclose( calRst, expectedRst )
+
+
+def test_ArNormalStream_rngCase_matchArNormal():
+    obs = [ 1.0, -1.0, 0.5 ]
+    phis = [ 0.5, -0.3, 0.1 ]
+    stream = lsg.ArNormalStream( obs, phis, 0.1, 0.5, randomSeed=7,
+                                 rng=np.random.default_rng( 2023 ) )
+    calRst = getBlocks( stream )
+    expectedRst = lsg.arNormal( sum( blockSizes ), obs, phis, 0.1, 0.5,
+                                rng=np.random.default_rng( 2023 ) )
+    np.testing.assert_allclose( calRst, expectedRst )
+
+    with pytest.raises( ValueError ):
+        _ = lsg.ArNormalStream( obs, phis, 0.1, 0.5, rng=2023 )
+
+
+def test_ArNormalStream_globalConfigRng_reproducible():
+    from ffpack.config import globalConfig
+    try:
+        globalConfig.setSeed( 0 )
+        rst1 = lsg.ArNormalStream( [ 0 ], [ 0.5 ], 0, 1 ).nextBlock( 3 )
+        globalConfig.setSeed( 0 )
+        rst2 = lsg.ArNormalStream( [ 0 ], [ 0.5 ], 0, 1 ).nextBlock( 3 )
+        np.testing.assert_array_equal( rst1, rst2 )
+    finally:
+        globalConfig.setSeed( None )
+
+
+###############################################################################
+# Test MaNormalStream
+###############################################################################
+def test_MaNormalStream_invalidInputCase_valueError():
+    with pytest.raises( ValueError ):
+        _ = lsg.MaNormalStream( [ 0 ], [ 0.8, 0.5 ], 0, 0.5 )
+
+    with pytest.raises( ValueError ):
+        _ = lsg.MaNormalStream( 0, [ ], 0, 0.5 )
+
+
+def test_MaNormalStream_blocksCase_matchMaNormal():
+    thetas = [ 0.8, 0.5 ]
+    stream = lsg.MaNormalStream( 0.3, thetas, 0.1, 0.5, randomSeed=2023 )
+    calRst = getBlocks( stream )
+    with patch( "numpy.random.normal", return_value=getNoise( 2023, 0.1, 0.5 ) ):
+        expectedRst = lsg.maNormal( sum( blockSizes ), 0.3, thetas, 0.1, 0.5 )
+    np.testing.assert_allclose( calRst, expectedRst )
+
+
+###############################################################################
+# Test ArmaNormalStream
+###############################################################################
+def test_ArmaNormalStream_invalidInputCase_valueError():
+    with pytest.raises( ValueError ):
+        _ = lsg.ArmaNormalStream( [ 0 ], [ ], [ 0.8 ], 0, 0.5 )
+
+    with pytest.raises( ValueError ):
+        _ = lsg.ArmaNormalStream( [ 0 ], [ 0.5 ], [ ], 0, 0.5 )
+
+
+def test_ArmaNormalStream_blocksCase_matchArmaNormal():
+    phis = [ 0.5, 0.3, -0.2 ]
+    thetas = [ 0.8, 0.5 ]
+    for obs in [ [ ], [ 1.0, 2.0 ], [ 1.0, 2.0, 0.5, -1.0 ] ]:
+        stream = lsg.ArmaNormalStream( obs, phis, thetas, 0.1, 0.5, randomSeed=2023 )
+        calRst = getBlocks( stream )
+        with patch( "numpy.random.normal", return_value=getNoise( 2023, 0.1, 0.5 ) ):
+            expectedRst = lsg.armaNormal( sum( blockSizes ), obs, phis, thetas, 0.1, 0.5 )
+        np.testing.assert_allclose( calRst, expectedRst )
+
+
+###############################################################################
+# Test ArimaNormalStream
+###############################################################################
+def test_ArimaNormalStream_invalidInputCase_valueError():
+    with pytest.raises( ValueError ):
+        _ = lsg.ArimaNormalStream( [ 0 ], [ 0.5 ], [ 0.8 ], 0, 0.5 )
+
+    with pytest.raises( ValueError ):
+        _ = lsg.ArimaNormalStream( 0, [ ], [ 0.8 ], 0, 0.5 )
+
+    with pytest.raises( ValueError ):
+        _ = lsg.ArimaNormalStream( 0, [ 0.5 ], [ ], 0, 0.5 )
+
+
+def test_ArimaNormalStream_blocksCase_matchArimaNormal():
+    phis = [ 0.5, 0.3, -0.2 ]
+    thetas = [ 0.8, 0.5 ]
+    stream = lsg.ArimaNormalStream( 0.5, phis, thetas, 0.1, 0.5, randomSeed=2023 )
+    calRst = getBlocks( stream )
+    with patch( "numpy.random.normal", return_value=getNoise( 2023, 0.1, 0.5 ) ):
+        expectedRst = lsg.arimaNormal( sum( blockSizes ), 0.5, phis, thetas, 0.1, 0.5 )
+    np.testing.assert_allclose( calRst, expectedRst )
+
+
+###############################################################################
+# Test RandomWalkUniformStream
+###############################################################################
+def test_RandomWalkUniformStream_invalidInputCase_valueError():
+    with pytest.raises( ValueError ):
+        _ = lsg.RandomWalkUniformStream( dim=0 )
+
+    with pytest.raises( ValueError ):
+        _ = lsg.RandomWalkUniformStream( dim=1.5 )
+
+
+def test_RandomWalkUniformStream_blocksCase_unitSteps():
+    stream = lsg.RandomWalkUniformStream( dim=3, randomSeed=2023 )
+    calRst = getBlocks( stream )
+    assert calRst.shape == ( sum( blockSizes ), 3 )
+    np.testing.assert_array_equal( np.abs( calRst[ 0 ] ).sum(), 1 )
+    np.testing.assert_array_equal( np.abs( np.diff( calRst, axis=0 ) ).sum( axis=1 ), 1 )
+
+
+###############################################################################
+# Test SpectralRepresentationStream
+###############################################################################
+def test_SpectralRepresentationStream_invalidInputCase_valueError():
+    freq = [ 0, 0.1, 0.2, 0.3, 0.4, 0.5 ]
+    psd = [ 0.01, 2, 0.05, 0.04, 0.01, 0.03 ]
+    with pytest.raises( ValueError ):
+        _ = lsg.SpectralRepresentationStream( -1, freq, psd )
+
+    with pytest.raises( ValueError ):
+        _ = lsg.SpectralRepresentationStream( 100, [ 0, 0.1, 0.3 ], [ 1, 2, 3 ] )
+
+    with pytest.raises( ValueError ):
+        _ = lsg.SpectralRepresentationStream( 100, freq, psd, chunkSize=0 )
+
+
+def test_SpectralRepresentationStream_blocksCase_matchSpectralRepresentation():
+    freq = [ 0, 0.1, 0.2, 0.3, 0.4, 0.5 ]
+    psd = [ 0.01, 2, 0.05, 0.04, 0.01, 0.03 ]
+    stream = lsg.SpectralRepresentationStream( 100, freq, psd, freqBandwidth=0.2, 
+                                               randomSeed=2023, chunkSize=5 )
+    calRst = getBlocks( stream )
+    randn = np.random.default_rng( 2023 ).standard_normal( len( freq ) )
+    with patch( "numpy.random.standard_normal", return_value=randn ):
+        _, expectedRst = lsg.spectralRepresentation( 100, sum( blockSizes ) / 100, 
+                                                     freq, psd, freqBandwidth=0.2 )
+    np.testing.assert_allclose( calRst, expectedRst, atol=1e-10 )
+
+
+###############################################################################
+# Test MarkovChainTurningPointStream
+###############################################################################
+def test_MarkovChainTurningPointStream_invalidInputCase_valueError():
+    with pytest.raises( ValueError ):
+        _ = lsg.MarkovChainTurningPointStream( [ [ 0, 1 ], [ 1, 0 ] ], [ 0, 1, 2 ] )
+
+    with pytest.raises( ValueError ):
+        _ = lsg.MarkovChainTurningPointStream( [ [ 0, 1 ], [ 1, 0 ] ], [ 0, 1 ], 
+                                               initLevel=1 )
+
+    stream = lsg.MarkovChainTurningPointStream( [ [ 0, 1 ], [ 1, 0 ] ], [ 0, 1 ] )
+    with pytest.raises( ValueError ):
+        _ = stream.nextBlock( 0 )
+
+
+def test_MarkovChainTurningPointStream_blocksCase_matchMarkovChainTurningPoints():
+    transitionMatrix = [ [ 0.0, 0.25, 0.75 ], [ 1.0, 0.0, 1.0 ], [ 0.4, 0.6, 0.0 ] ]
+    levels = [ -1.0, 0.0, 1.0 ]
+    stream = lsg.MarkovChainTurningPointStream( transitionMatrix, levels, 
+                                                randomSeed=2023 )
+    calRst = getBlocks( stream )
+    expectedRst = lsg.markovChainTurningPoints( sum( blockSizes ), transitionMatrix, 
+                                                levels, 
+                                                rng=np.random.default_rng( 2023 ) )
+    np.testing.assert_array_equal( calRst, expectedRst )
+
+
+def test_MarkovChainTurningPointStream_rngCase_matchMarkovChainTurningPoints():
+    transitionMatrix = [ [ 0.0, 0.25, 0.75 ], [ 1.0, 0.0, 1.0 ], [ 0.4, 0.6, 0.0 ] ]
+    levels = [ -1.0, 0.0, 1.0 ]
+    stream = lsg.MarkovChainTurningPointStream( transitionMatrix, levels,
+                                                rng=np.random.default_rng( 5 ) )
+    calRst = getBlocks( stream )
+    expectedRst = lsg.markovChainTurningPoints( sum( blockSizes ), transitionMatrix,
+                                                levels, rng=np.random.default_rng( 5 ) )
+    np.testing.assert_array_equal( calRst, expectedRst )
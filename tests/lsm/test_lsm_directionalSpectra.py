@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+
+from ffpack import lsm
+import numpy as np
+import pytest
+
+
+theta = np.linspace( -np.pi, np.pi, 361 )
+w = np.linspace( 0.1, 3.0, 300 )
+
+
+###############################################################################
+# Test cos2sSpreading
+###############################################################################
+def test_cos2sSpreading_invalidInputCase_valueError():
+    with pytest.raises( ValueError ):
+        _ = lsm.cos2sSpreading( [ ] )
+
+    with pytest.raises( ValueError ):
+        _ = lsm.cos2sSpreading( theta, s=-1 )
+
+
+def test_cos2sSpreading_normalUseCase_unitIntegral():
+    for thetaMean, s in [ ( 0.0, 1.0 ), ( 0.5, 10.0 ), ( 3.0, 30.0 ) ]:
+        calRst = lsm.cos2sSpreading( theta, thetaMean=thetaMean, s=s )
+        np.testing.assert_allclose( np.trapz( calRst, theta ), 1.0, rtol=1e-6 )
+        assert np.isclose( theta[ np.argmax( calRst ) ], thetaMean, atol=0.01 )
+
+    calRst = lsm.cos2sSpreading( theta, s=np.array( [ 1.0, 5.0 ] )[ :, None ] )
+    assert calRst.shape == ( 2, 361 )
+    np.testing.assert_allclose( lsm.cos2sSpreading( 0.0, s=1.0 ), 1 / np.pi )
+
+
+###############################################################################
+# Test wrappedNormalSpreading
+###############################################################################
+def test_wrappedNormalSpreading_invalidInputCase_valueError():
+    with pytest.raises( ValueError ):
+        _ = lsm.wrappedNormalSpreading( [ ] )
+
+    with pytest.raises( ValueError ):
+        _ = lsm.wrappedNormalSpreading( theta, sigma=0 )
+
+
+def test_wrappedNormalSpreading_normalUseCase_unitIntegral():
+    for thetaMean, sigma in [ ( 0.0, 0.1 ), ( 3.0, 0.5 ), ( -1.0, 4.0 ) ]:
+        calRst = lsm.wrappedNormalSpreading( theta, thetaMean=thetaMean, sigma=sigma )
+        np.testing.assert_allclose( np.trapz( calRst, theta ), 1.0, rtol=1e-6 )
+
+    # Narrow spreading is the normal density
+    calRst = lsm.wrappedNormalSpreading( 0.1, sigma=0.2 )
+    expectedRst = np.exp( -0.125 ) / ( 0.2 * np.sqrt( 2 * np.pi ) )
+    np.testing.assert_allclose( calRst, expectedRst )
+
+
+###############################################################################
+# Test directionalSpectrum
+###############################################################################
+def test_directionalSpectrum_invalidInputCase_valueError():
+    with pytest.raises( ValueError ):
+        _ = lsm.directionalSpectrum( 1.0, np.ones( 3 ) )
+
+    with pytest.raises( ValueError ):
+        _ = lsm.directionalSpectrum( np.ones( ( 2, 5 ) ), np.ones( ( 3, 4 ) ) )
+
+
+def test_directionalSpectrum_normalUseCase_outerProduct():
+    psd = lsm.jonswapSpectrum( w, 0.5 )
+    spreading = lsm.cos2sSpreading( theta )
+    calRst = lsm.directionalSpectrum( psd, spreading )
+    assert calRst.shape == ( 300, 361 )
+    np.testing.assert_allclose( calRst, np.outer( psd, spreading ) )
+
+    wp = np.array( [ 0.4, 0.5 ] )
+    calRst = lsm.directionalSpectrum( lsm.jonswapSpectrum( w, wp[ :, None ] ), 
+                                      spreading )
+    assert calRst.shape == ( 2, 300, 361 )
+    np.testing.assert_allclose( calRst[ 1 ], np.outer( psd, spreading ) )
+
+
+###############################################################################
+# Test directionalMoments
+###############################################################################
+def test_directionalMoments_invalidInputCase_valueError():
+    dirPsd = np.ones( ( 300, 361 ) )
+    with pytest.raises( ValueError ):
+        _ = lsm.directionalMoments( w[ :: -1 ], theta, dirPsd )
+
+    with pytest.raises( ValueError ):
+        _ = lsm.directionalMoments( w, theta, dirPsd.T )
+
+
+def test_directionalMoments_normalUseCase_expectedRst():
+    psd = lsm.jonswapSpectrum( w, 0.5 )
+    dirPsd = lsm.directionalSpectrum( psd, lsm.wrappedNormalSpreading( theta, 0.3, 0.2 ) )
+    calRst = lsm.directionalMoments( w, theta, dirPsd )
+    expectedRst = lsm.SpectralMoments().getMoments( w, psd )
+    np.testing.assert_allclose( calRst, expectedRst, rtol=1e-6 )
+
+    # E[ cos^2( theta - heading ) ] of the wrapped normal distribution
+    calRst = lsm.directionalMoments( w, theta, dirPsd, orders=[ 0 ], heading=0.3 )
+    expectedRst = expectedRst[ 0 ] * ( 1 + np.exp( -2 * 0.2 * 0.2 ) ) / 2
+    np.testing.assert_allclose( calRst, [ expectedRst ], rtol=1e-6 )
+
+
+###############################################################################
+# Test directionalMeanAndSpread
+###############################################################################
+def test_directionalMeanAndSpread_normalUseCase_expectedRst():
+    psd = lsm.jonswapSpectrum( w, 0.5 )
+    dirPsd = lsm.directionalSpectrum( psd, lsm.wrappedNormalSpreading( 
+        theta, np.array( [ 0.3, -2.5 ] )[ :, None ], 0.2 ) )
+    meanDirection, spread = lsm.directionalMeanAndSpread( w, theta, dirPsd )
+    np.testing.assert_allclose( meanDirection, [ 0.3, -2.5 ], atol=1e-8 )
+    np.testing.assert_allclose( spread, np.sqrt( 2 * ( 1 - np.exp( -0.02 ) ) ), 
+                                rtol=1e-6 )
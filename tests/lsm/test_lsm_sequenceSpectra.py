@@ -2,6 +2,7 @@
 
 from ffpack import lsm
 import numpy as np
+from scipy import signal
 import pytest
 
 
@@ -199,3 +200,187 @@ def test_welchSpectrum_threePeaks_samePeaks():
     peak3 = max( gfreq[ ind ] )
     peak2 = sum( gfreq[ ind ] ) - peak1 - peak3
     np.testing.assert_allclose( [ peak1, peak2, peak3 ], [ fs1, fs2, fs3 ], atol=1 )
+
+
+###############################################################################
+# Test OnlineWelch
+###############################################################################
+def test_OnlineWelch_invalidInputCase_valueError():
+    with pytest.raises( ValueError ):
+        _ = lsm.OnlineWelch( -1 )
+
+    with pytest.raises( ValueError ):
+        _ = lsm.OnlineWelch( 10, nperseg=0 )
+
+    with pytest.raises( ValueError ):
+        _ = lsm.OnlineWelch( 10, nperseg=16, noverlap=16 )
+
+    with pytest.raises( ValueError ):
+        _ = lsm.OnlineWelch( 10, forgetting=1.0 )
+
+    onlineWelch = lsm.OnlineWelch( 10, nperseg=16 )
+    with pytest.raises( ValueError ):
+        onlineWelch.update( [ [ 1.0, 2.0 ] ] )
+
+    onlineWelch.update( np.ones( 15 ) )
+    with pytest.raises( ValueError ):
+        _ = onlineWelch.getSpectrum()
+
+
+def test_OnlineWelch_chunksCase_matchScipyWelch():
+    data = np.random.default_rng( 2023 ).normal( size=10007 )
+    chunkSizes = np.random.default_rng( 2024 ).integers( 1, 500, size=100 )
+    for nperseg, noverlap in [ ( 256, None ), ( 255, 100 ), ( 64, 0 ) ]:
+        onlineWelch = lsm.OnlineWelch( 50.0, nperseg=nperseg, noverlap=noverlap )
+        start = 0
+        for chunkSize in chunkSizes:
+            onlineWelch.update( data[ start: start + chunkSize ] )
+            start += chunkSize
+        onlineWelch.update( data[ start: ] )
+        calFreq, calPsd = onlineWelch.getSpectrum()
+        expectedFreq, expectedPsd = signal.welch( data, 50.0, nperseg=nperseg, 
+                                                  noverlap=noverlap )
+        np.testing.assert_allclose( calFreq, expectedFreq )
+        np.testing.assert_allclose( calPsd, expectedPsd, rtol=1e-10, atol=1e-14 )
+
+
+def test_OnlineWelch_forgettingCase_exponentialWeights():
+    data = np.random.default_rng( 2023 ).normal( size=2000 )
+    onlineWelch = lsm.OnlineWelch( 10, nperseg=64, forgetting=0.9 )
+    for chunk in np.array_split( data, 7 ):
+        onlineWelch.update( chunk )
+    _, calPsd = onlineWelch.getSpectrum()
+    _, _, periodograms = signal.spectrogram( data, 10, window="hann", nperseg=64, 
+                                             noverlap=32 )
+    weights = np.power( 0.9, np.arange( periodograms.shape[ 1 ] - 1, -1, -1 ) )
+    expectedPsd = periodograms @ weights / np.sum( weights )
+    assert onlineWelch.numSegments == periodograms.shape[ 1 ]
+    np.testing.assert_allclose( calPsd, expectedPsd, rtol=1e-10 )
+
+
+###############################################################################
+# Test welchCsdMatrix
+###############################################################################
+def test_welchCsdMatrix_invalidInputCase_valueError():
+    with pytest.raises( ValueError ):
+        _ = lsm.welchCsdMatrix( [ 1.0, 2.0, 3.0 ], 10 )
+
+    with pytest.raises( ValueError ):
+        _ = lsm.welchCsdMatrix( [ [ 1.0, 2.0 ] ], 10 )
+
+    data = np.ones( ( 100, 2 ) )
+    with pytest.raises( ValueError ):
+        _ = lsm.welchCsdMatrix( data, "10" )
+
+    with pytest.raises( ValueError ):
+        _ = lsm.welchCsdMatrix( data, 10, nperseg=32, noverlap=32 )
+
+    with pytest.raises( ValueError ):
+        _ = lsm.welchCsdMatrix( data, 10, chunkSize=0 )
+
+
+def test_welchCsdMatrix_normalUseCase_matchScipyCsd():
+    data = np.random.default_rng( 2023 ).normal( size=( 3001, 3 ) )
+    data[ :, 1 ] += 0.5 * np.roll( data[ :, 0 ], 2 )
+    for nperseg, chunkSize in [ ( 256, 256 ), ( 255, 4 ) ]:
+        calFreq, calCsd = lsm.welchCsdMatrix( data, 50.0, nperseg=nperseg, 
+                                              chunkSize=chunkSize )
+        assert calCsd.shape == ( len( calFreq ), 3, 3 )
+        for i in range( 3 ):
+            for j in range( 3 ):
+                expectedFreq, expectedCsd = signal.csd( data[ :, i ], data[ :, j ], 
+                                                        50.0, nperseg=nperseg )
+                np.testing.assert_allclose( calFreq, expectedFreq )
+                np.testing.assert_allclose( calCsd[ :, i, j ], expectedCsd, 
+                                            atol=1e-14 )
+
+
+###############################################################################
+# Test coherenceMatrix
+###############################################################################
+def test_coherenceMatrix_invalidInputCase_valueError():
+    with pytest.raises( ValueError ):
+        _ = lsm.coherenceMatrix( np.ones( ( 3, 2 ) ) )
+
+    with pytest.raises( ValueError ):
+        _ = lsm.coherenceMatrix( np.ones( ( 3, 2, 3 ) ) )
+
+
+def test_coherenceMatrix_normalUseCase_matchScipyCoherence():
+    data = np.random.default_rng( 2023 ).normal( size=( 3001, 3 ) )
+    data[ :, 1 ] += 0.5 * np.roll( data[ :, 0 ], 2 )
+    data[ :, 2 ] = 0.0
+    _, csd = lsm.welchCsdMatrix( data, 50.0, nperseg=256 )
+    calRst = lsm.coherenceMatrix( csd )
+    _, expectedRst = signal.coherence( data[ :, 0 ], data[ :, 1 ], 50.0, nperseg=256 )
+    np.testing.assert_allclose( calRst[ :, 0, 1 ], expectedRst )
+    np.testing.assert_allclose( calRst[ :, 1, 0 ], expectedRst )
+    np.testing.assert_allclose( calRst[ 1: -1, 0, 0 ], 1.0 )
+    np.testing.assert_allclose( calRst[ :, 2, : ], 0.0 )
+
+
+###############################################################################
+# Test spectrogramSpectrum
+###############################################################################
+def test_spectrogramSpectrum_invalidInputCase_valueError():
+    data = np.random.default_rng( 2023 ).normal( size=1000 )
+    with pytest.raises( ValueError ):
+        _ = lsm.spectrogramSpectrum( [ data ], 10 )
+
+    with pytest.raises( ValueError ):
+        _ = lsm.spectrogramSpectrum( data[ : 100 ], 10, nperseg=256 )
+
+    with pytest.raises( ValueError ):
+        _ = lsm.spectrogramSpectrum( data, -10 )
+
+    with pytest.raises( ValueError ):
+        _ = lsm.spectrogramSpectrum( data, 10, nperseg=64, noverlap=64 )
+
+    with pytest.raises( ValueError ):
+        _ = lsm.spectrogramSpectrum( data, 10, chunkSize=0 )
+
+    with pytest.raises( ValueError ):
+        _ = lsm.spectrogramSpectrum( data, 10, nperseg=64, out=np.zeros( ( 2, 2 ) ) )
+
+
+def test_spectrogramSpectrum_normalUseCase_matchScipySpectrogram():
+    data = np.random.default_rng( 2023 ).normal( size=5003 )
+    for nperseg, noverlap, chunkSize in [ ( 256, None, 1024 ), ( 199, 50, 3 ) ]:
+        calTimes, calFreq, calPsd, calMoments = lsm.spectrogramSpectrum( 
+            data, 50.0, nperseg=nperseg, noverlap=noverlap, orders=[ 0, 2 ], 
+            chunkSize=chunkSize )
+        if noverlap is None:
+            noverlap = nperseg // 2
+        expectedFreq, expectedTimes, expectedPsd = signal.spectrogram( 
+            data, 50.0, window="hann", nperseg=nperseg, noverlap=noverlap )
+        np.testing.assert_allclose( calTimes, expectedTimes )
+        np.testing.assert_allclose( calFreq, expectedFreq )
+        np.testing.assert_allclose( calPsd, expectedPsd.T, atol=1e-14 )
+        np.testing.assert_allclose( calMoments[ :, 0 ], np.trapz( calPsd, calFreq ) )
+        np.testing.assert_allclose( calMoments[ :, 1 ], 
+                                    np.trapz( calPsd * calFreq ** 2, calFreq ) )
+
+
+def test_spectrogramSpectrum_nonStationaryCase_trackVariance():
+    rng = np.random.default_rng( 2023 )
+    data = np.concatenate( [ rng.normal( size=20000 ), 3 * rng.normal( size=20000 ) ] )
+    _, _, _, calMoments = lsm.spectrogramSpectrum( data, 1.0, nperseg=1000, 
+                                                   noverlap=0, orders=[ 0 ] )
+    np.testing.assert_allclose( np.mean( calMoments[ : 20, 0 ] ), 1.0, rtol=0.1 )
+    np.testing.assert_allclose( np.mean( calMoments[ 20:, 0 ] ), 9.0, rtol=0.1 )
+
+
+def test_spectrogramSpectrum_memmapCase_writeToFile( tmp_path ):
+    data = np.random.default_rng( 2023 ).normal( size=5000 )
+    _, _, expectedPsd, _ = lsm.spectrogramSpectrum( data, 10, nperseg=128 )
+    path = str( tmp_path / "psd.npy" )
+    _, _, calPsd, _ = lsm.spectrogramSpectrum( data, 10, nperseg=128, chunkSize=5, 
+                                               out=path )
+    assert isinstance( calPsd, np.memmap )
+    np.testing.assert_allclose( np.load( path ), expectedPsd )
+
+    out = np.memmap( str( tmp_path / "psd.dat" ), dtype=float, mode="w+", 
+                     shape=expectedPsd.shape )
+    _, _, calPsd, _ = lsm.spectrogramSpectrum( data, 10, nperseg=128, out=out )
+    assert calPsd is out
+    np.testing.assert_allclose( out, expectedPsd )
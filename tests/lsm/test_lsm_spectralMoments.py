@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+
+from ffpack import lsm
+import numpy as np
+import pytest
+
+
+###############################################################################
+# Test SpectralMoments
+###############################################################################
+def test_SpectralMoments_invalidInputCase_valueError():
+    with pytest.raises( ValueError ):
+        _ = lsm.SpectralMoments( orders=[ ] )
+
+    with pytest.raises( ValueError ):
+        _ = lsm.SpectralMoments( orders=[ -1, 2 ] )
+
+    with pytest.raises( ValueError ):
+        _ = lsm.SpectralMoments( maxCacheSize=-1 )
+
+    spectralMoments = lsm.SpectralMoments()
+    with pytest.raises( ValueError ):
+        _ = spectralMoments.getMoments( [ 1.0 ], [ 1.0 ] )
+
+    with pytest.raises( ValueError ):
+        _ = spectralMoments.getMoments( [ 0.0, 2.0, 1.0 ], [ 1.0, 1.0, 1.0 ] )
+
+    with pytest.raises( ValueError ):
+        _ = spectralMoments.getMoments( [ 0.0, 1.0, 2.0 ], [ 1.0, 1.0 ] )
+
+
+def test_SpectralMoments_getMomentsCase_matchTrapz():
+    freq = np.sort( np.random.default_rng( 2023 ).uniform( 0, 2, 50 ) )
+    psd = np.exp( -np.square( freq[ None, : ] - np.array( [ [ 0.5 ], [ 1.0 ] ] ) ) )
+    spectralMoments = lsm.SpectralMoments( orders=[ 0, 1, 2, 4, 0.75 ] )
+    calRst = spectralMoments.getMoments( freq, psd )
+    assert calRst.shape == ( 2, 5 )
+    for i, order in enumerate( [ 0, 1, 2, 4, 0.75 ] ):
+        expectedRst = np.trapz( psd * np.power( freq, order ), freq, axis=-1 )
+        np.testing.assert_allclose( calRst[ :, i ], expectedRst )
+
+    calRst = spectralMoments.getMoments( freq, psd[ 0 ] )
+    assert calRst.shape == ( 5, )
+
+
+def test_SpectralMoments_bandwidthCase_expectedRst():
+    # Narrow band spectrum concentrated around 2 Hz
+    freq = np.linspace( 1.9, 2.1, 2001 )
+    psd = np.ones( len( freq ) )
+    calRst = lsm.SpectralMoments().getBandwidthParameters( freq, psd )
+    np.testing.assert_allclose( calRst[ "m0" ], 0.2 )
+    np.testing.assert_allclose( calRst[ "zeroCrossingRate" ], 2.0, rtol=1e-3 )
+    np.testing.assert_allclose( calRst[ "peakRate" ], 2.0, rtol=1e-2 )
+    np.testing.assert_allclose( calRst[ "irregularityFactor" ], 1.0, rtol=1e-2 )
+    np.testing.assert_allclose( calRst[ "alpha1" ], 1.0, rtol=1e-3 )
+    assert calRst[ "spectralWidth" ] < 0.1
+
+    # White noise between 0 and 1 Hz
+    freq = np.linspace( 0, 1, 2001 )
+    psd = np.ones( len( freq ) )
+    calRst = lsm.SpectralMoments().getBandwidthParameters( freq, psd )
+    np.testing.assert_allclose( calRst[ "zeroCrossingRate" ], np.sqrt( 1 / 3 ), 
+                                rtol=1e-6 )
+    np.testing.assert_allclose( calRst[ "peakRate" ], np.sqrt( 3 / 5 ), rtol=1e-6 )
+    np.testing.assert_allclose( calRst[ "irregularityFactor" ], np.sqrt( 5 ) / 3, 
+                                rtol=1e-6 )
+
+
+def test_SpectralMoments_bandwidthFromMomentsCase_matchBandwidthParameters():
+    spectralMoments = lsm.SpectralMoments()
+    with pytest.raises( ValueError ):
+        _ = spectralMoments.getBandwidthParametersFromMoments( [ 1.0, 1.0, 1.0 ] )
+
+    freq = np.linspace( 0.1, 3.0, 500 )
+    psd = lsm.jonswapSpectrum( freq, np.array( [ 0.5, 0.8 ] )[ :, None ] )
+    moments = lsm.SpectralMoments( orders=[ 0, 1, 2, 4 ] ).getMoments( freq, psd )
+    calRst = spectralMoments.getBandwidthParametersFromMoments( moments )
+    expectedRst = spectralMoments.getBandwidthParameters( freq, psd )
+    for key, value in expectedRst.items():
+        np.testing.assert_allclose( calRst[ key ], value )
+
+
+def test_SpectralMoments_parametricCase_memoized():
+    spectralMoments = lsm.SpectralMoments( maxCacheSize=2 )
+    w = np.linspace( 0.1, 3.0, 500 )
+    calRst = spectralMoments.getParametricMoments( lsm.jonswapSpectrum, w, 0.5, 
+                                                   gamma=2.0 )
+    expectedRst = spectralMoments.getMoments( w, lsm.jonswapSpectrum( w, 0.5, 
+                                                                      gamma=2.0 ) )
+    np.testing.assert_allclose( calRst, expectedRst )
+    assert spectralMoments.misses == 1 and spectralMoments.hits == 0
+
+    calRst = spectralMoments.getParametricMoments( lsm.jonswapSpectrum, w, 0.5, 
+                                                   gamma=2.0 )
+    np.testing.assert_allclose( calRst, expectedRst )
+    assert spectralMoments.misses == 1 and spectralMoments.hits == 1
+    calRst[ 0 ] = 0.0
+    calRst = spectralMoments.getParametricMoments( lsm.jonswapSpectrum, w, 0.5, 
+                                                   gamma=2.0 )
+    np.testing.assert_allclose( calRst, expectedRst )
+
+    calRst = spectralMoments.getParametricBandwidthParameters( lsm.jonswapSpectrum, 
+                                                               w, 0.5, gamma=2.0 )
+    assert spectralMoments.hits == 3
+    np.testing.assert_allclose( calRst[ "m0" ], expectedRst[ 0 ] )
+
+    _ = spectralMoments.getParametricMoments( lsm.jonswapSpectrum, w, 0.6 )
+    _ = spectralMoments.getParametricMoments( lsm.jonswapSpectrum, w, 0.7 )
+    assert len( spectralMoments.cache ) == 2
+    _ = spectralMoments.getParametricMoments( lsm.jonswapSpectrum, w, 0.5, gamma=2.0 )
+    assert spectralMoments.misses == 4
+
+    spectralMoments.clearCache()
+    assert len( spectralMoments.cache ) == 0
+    assert spectralMoments.hits == 0 and spectralMoments.misses == 0
+
+
+def test_SpectralMoments_parametricBatchCase_matchSingleRst():
+    spectralMoments = lsm.SpectralMoments()
+    w = np.linspace( 0.1, 3.0, 500 )
+    wp = np.array( [ 0.4, 0.5, 0.6 ] )
+    Hs = np.array( [ 2.0, 4.0, 6.0 ] )
+    calRst = spectralMoments.getParametricBandwidthParameters( lsm.isscSpectrum, w, 
+                                                               wp[ :, None ], 
+                                                               Hs[ :, None ] )
+    assert calRst[ "m0" ].shape == ( 3, )
+    for i in range( 3 ):
+        expectedRst = spectralMoments.getBandwidthParameters( 
+            w, lsm.isscSpectrum( w, wp[ i ], Hs[ i ] ) )
+        for key in expectedRst:
+            np.testing.assert_allclose( calRst[ key ][ i ], expectedRst[ key ] )
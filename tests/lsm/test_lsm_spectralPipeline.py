@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+
+from ffpack import lsm
+import numpy as np
+import pytest
+
+
+###############################################################################
+# Test SpectralPipeline
+###############################################################################
+def _transferFunction( w ):
+    return 1 / ( 1 - ( w / 1.2 ) ** 2 + 0.1j * w )
+
+
+def test_SpectralPipeline_invalidInputCase_valueError():
+    w = np.linspace( 0.1, 3.0, 100 )
+
+    with pytest.raises( ValueError ):
+        _ = lsm.SpectralPipeline( [ 0.1 ] )
+
+    with pytest.raises( ValueError ):
+        _ = lsm.SpectralPipeline( w[ :: -1 ] )
+
+    with pytest.raises( ValueError ):
+        _ = lsm.SpectralPipeline( w, spectrum=1.0 )
+
+    pipeline = lsm.SpectralPipeline( w )
+    with pytest.raises( ValueError ):
+        _ = pipeline.addTransferFunction( np.ones( 99 ) )
+
+    with pytest.raises( ValueError ):
+        _ = pipeline.addMoments( "moments", orders=[ ] )
+
+    with pytest.raises( ValueError ):
+        _ = pipeline.addMoments( "moments", orders=[ -1 ] )
+
+    with pytest.raises( ValueError ):
+        _ = pipeline.addMoments( "moments", band=( 2.0, 1.0 ) )
+
+    with pytest.raises( ValueError ):
+        _ = pipeline.addMoments( "moments", band=( 1.0, 1.01 ) )
+
+    with pytest.raises( ValueError ):
+        _ = pipeline.addMoments( "moments", function=1.0 )
+
+    with pytest.raises( ValueError ):
+        _ = pipeline.evaluate( np.ones( 100 ) )
+
+    _ = pipeline.addMoments( "moments" )
+    with pytest.raises( ValueError ):
+        _ = pipeline.addMoments( "moments" )
+
+    with pytest.raises( ValueError ):
+        _ = pipeline.evaluate( np.ones( 99 ) )
+
+
+def test_SpectralPipeline_psdInput_sameAsSpectralMoments():
+    w = np.linspace( 0.1, 3.0, 500 )
+    wp = np.array( [ 0.4, 0.5, 0.6 ] )
+    psd = lsm.jonswapSpectrum( w, wp[ :, None ] )
+    responsePsd = psd * np.abs( _transferFunction( w ) ) ** 2 * ( 2 * w ) ** 2
+
+    pipeline = lsm.SpectralPipeline( w )
+    pipeline = pipeline.addTransferFunction( _transferFunction ) \
+                       .addTransferFunction( 2 * w ) \
+                       .addMoments( "moments", orders=[ 0, 2, 4 ] ) \
+                       .addBandwidthParameters( "bandwidth" )
+    calRst = pipeline.evaluate( psd )
+
+    expectedMoments = lsm.SpectralMoments( orders=[ 0, 2, 4 ] ).getMoments( w, responsePsd )
+    np.testing.assert_allclose( calRst[ "moments" ], expectedMoments )
+    expectedRst = lsm.SpectralMoments().getBandwidthParameters( w, responsePsd )
+    for key, value in expectedRst.items():
+        np.testing.assert_allclose( calRst[ "bandwidth" ][ key ], value )
+
+
+def test_SpectralPipeline_spectrumInput_activeRangeOnly():
+    w = np.linspace( 0.1, 3.0, 500 )
+    band = ( 0.5, 1.5 )
+    mask = ( w >= band[ 0 ] ) & ( w <= band[ 1 ] )
+    calledFreqs = [ ]
+
+    def spectrum( freq, wp, gamma=3.3 ):
+        calledFreqs.append( freq )
+        return lsm.jonswapSpectrum( freq, wp, gamma=gamma )
+
+    pipeline = lsm.SpectralPipeline( w, spectrum )
+    pipeline = pipeline.addTransferFunction( _transferFunction ) \
+                       .addMoments( "moments", orders=[ 0, 2 ], band=band,
+                                    function=lambda m: np.sqrt( m[ ..., 1 ] / m[ ..., 0 ] ) )
+    wp = np.array( [ 0.4, 0.5, 0.6 ] )
+    calRst = pipeline.evaluate( wp[ :, None ], gamma=2.0 )
+    np.testing.assert_allclose( calledFreqs[ -1 ], w[ mask ] )
+
+    responsePsd = lsm.jonswapSpectrum( w[ mask ], wp[ :, None ], gamma=2.0 ) * \
+        np.abs( _transferFunction( w[ mask ] ) ) ** 2
+    m0, m2 = lsm.SpectralMoments( orders=[ 0, 2 ] ).getMoments( w[ mask ],
+                                                                responsePsd ).T
+    np.testing.assert_allclose( calRst[ "moments" ], np.sqrt( m2 / m0 ) )
+
+    # The compiled weights are reused for the following load cases
+    weights = pipeline.weights
+    _ = pipeline.evaluate( 0.7 )
+    assert pipeline.weights is weights
+
+
+def test_SpectralPipeline_zeroGain_zeroMoments():
+    w = np.linspace( 0.1, 3.0, 100 )
+    pipeline = lsm.SpectralPipeline( w, lsm.jonswapSpectrum )
+    pipeline = pipeline.addTransferFunction( np.zeros( 100 ) ).addMoments( "moments" )
+    calRst = pipeline.evaluate( np.array( [ 0.4, 0.5 ] )[ :, None ] )
+    np.testing.assert_array_equal( calRst[ "moments" ], np.zeros( ( 2, 4 ) ) )
+
+
+def test_SpectralPipeline_outBuffer_reused():
+    w = np.linspace( 0.1, 3.0, 200 )
+    pipeline = lsm.SpectralPipeline( w, lsm.jonswapSpectrum )
+    pipeline = pipeline.addMoments( "moments", orders=[ 0, 2 ] ) \
+                       .addBandwidthParameters( "bandwidth" )
+    wp = np.array( [ 0.4, 0.5, 0.6 ] )[ :, None ]
+    expectedRst = pipeline.evaluate( wp )
+
+    out = np.empty( ( 3, 6 ) )
+    calRst = pipeline.evaluate( wp, out=out )
+    assert np.shares_memory( calRst[ "moments" ], out )
+    np.testing.assert_allclose( calRst[ "moments" ], expectedRst[ "moments" ] )
+    np.testing.assert_allclose( calRst[ "bandwidth" ][ "m4" ], expectedRst[ "bandwidth" ][ "m4" ] )
+
+    with pytest.raises( ValueError ):
+        _ = pipeline.evaluate( wp, out=np.empty( ( 3, 5 ) ) )
+    with pytest.raises( ValueError ):
+        _ = pipeline.evaluate( wp, out=np.empty( ( 3, 6 ), dtype=np.float32 ) )
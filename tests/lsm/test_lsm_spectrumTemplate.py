@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+
+from ffpack import lsm
+import numpy as np
+import pytest
+
+
+###############################################################################
+# Test SpectrumTemplate
+###############################################################################
+def test_SpectrumTemplate_irregularInput_valueError():
+    w = np.linspace( 0.1, 3.0, 100 )
+
+    with pytest.raises( ValueError ):
+        _ = lsm.SpectrumTemplate( [ [ 0.1, 0.2 ] ] )
+
+    with pytest.raises( ValueError ):
+        _ = lsm.SpectrumTemplate( [ 0.0, 0.1 ] )
+
+    with pytest.raises( ValueError ):
+        _ = lsm.SpectrumTemplate( w, "unknown" )
+
+    with pytest.raises( ValueError ):
+        _ = lsm.SpectrumTemplate( w, maxCacheSize=-1 )
+
+    template = lsm.SpectrumTemplate( w, "jonswap" )
+    with pytest.raises( ValueError ):
+        _ = template.evaluate()
+
+    with pytest.raises( ValueError ):
+        _ = template.evaluate( 0.5, Hs=2.0 )
+
+    with pytest.raises( ValueError ):
+        _ = template.evaluate( 0.5, wp=0.5 )
+
+    with pytest.raises( ValueError ):
+        _ = template.evaluate( 0.5, 0.0081, 1.25, 3.3, 9.81, 1.0 )
+
+    with pytest.raises( ValueError ):
+        _ = template.evaluate( [ 0.4, 0.5 ] )
+
+    with pytest.raises( ValueError ):
+        _ = template.evaluate( 0.5, out=np.empty( 99 ) )
+
+
+def test_SpectrumTemplate_allSpectra_sameAsSpectrumFunctions():
+    w = np.linspace( 0.1, 3.0, 500 )
+
+    template = lsm.SpectrumTemplate( w, "piersonMoskowitz" )
+    np.testing.assert_allclose( template.evaluate( 10.0 ),
+                                lsm.piersonMoskowitzSpectrum( w, 10.0 ) )
+    np.testing.assert_allclose( template.evaluate( 12.0, beta=0.8, alpha=0.01 ),
+                                lsm.piersonMoskowitzSpectrum( w, 12.0, alpha=0.01,
+                                                              beta=0.8 ) )
+
+    template = lsm.SpectrumTemplate( w, "jonswap" )
+    for wp, gamma in [ ( 0.5, 3.3 ), ( 0.5, 1.0 ), ( 0.5, 5.0 ), ( 0.8, 2.0 ) ]:
+        np.testing.assert_allclose( template.evaluate( wp, gamma=gamma ),
+                                    lsm.jonswapSpectrum( w, wp, gamma=gamma ) )
+    np.testing.assert_allclose( template.evaluate( 0.6, 0.01, 1.3, 2.0, 9.8 ),
+                                lsm.jonswapSpectrum( w, 0.6, 0.01, 1.3, 2.0, 9.8 ) )
+
+    template = lsm.SpectrumTemplate( w, "issc" )
+    np.testing.assert_allclose( template.evaluate( 0.5, 2.0 ),
+                                lsm.isscSpectrum( w, 0.5, 2.0 ) )
+    np.testing.assert_allclose( template.evaluate( wp=0.5, Hs=3.0 ),
+                                lsm.isscSpectrum( w, 0.5, 3.0 ) )
+
+    template = lsm.SpectrumTemplate( w, "gaussianSwell" )
+    np.testing.assert_allclose( template.evaluate( 0.5, 2.0, 0.05 ),
+                                lsm.gaussianSwellSpectrum( w, 0.5, 2.0, 0.05 ) )
+    np.testing.assert_allclose( template.evaluate( 0.7, 2.0, 0.08 ),
+                                lsm.gaussianSwellSpectrum( w, 0.7, 2.0, 0.08 ) )
+
+
+def test_SpectrumTemplate_outBuffer_reusedAndCached():
+    w = np.linspace( 0.1, 3.0, 500 )
+    template = lsm.SpectrumTemplate( w, "jonswap", maxCacheSize=2 )
+    out = np.empty( len( w ) )
+
+    calRst = template.evaluate( 0.5, gamma=2.0, out=out )
+    assert calRst is out
+    assert ( template.hits, template.misses ) == ( 0, 1 )
+
+    _ = template.evaluate( 0.5, gamma=3.0, out=out )
+    calRst = template.evaluate( 0.5, gamma=2.0, out=out )
+    assert ( template.hits, template.misses ) == ( 1, 2 )
+    np.testing.assert_allclose( calRst, lsm.jonswapSpectrum( w, 0.5, gamma=2.0 ) )
+
+    # The cached results are not affected by changes of the out buffer
+    out[ : ] = 0.0
+    calRst = template.evaluate( 0.5, gamma=2.0 )
+    assert calRst is not out
+    np.testing.assert_allclose( calRst, lsm.jonswapSpectrum( w, 0.5, gamma=2.0 ) )
+
+    _ = template.evaluate( 0.5, gamma=4.0 )
+    _ = template.evaluate( 0.5, gamma=3.0 )
+    assert len( template.cache ) == 2
+    assert template.misses == 4
+
+    template.clearCache()
+    assert len( template.cache ) == 0
+    assert ( template.hits, template.misses ) == ( 0, 0 )
+    np.testing.assert_allclose( template.evaluate( 0.5, gamma=3.0 ),
+                                lsm.jonswapSpectrum( w, 0.5, gamma=3.0 ) )
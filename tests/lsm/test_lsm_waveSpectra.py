@@ -48,6 +48,22 @@ def test_piersonMoskowitzSpectrum_normalUseCase_expectedRst():
     np.testing.assert_allclose( np.round( calRst, 4 ), np.round( expectedRst, 4 ) )
 
 
+def test_piersonMoskowitzSpectrum_arrayInputCase_matchScalarRst():
+    w = np.linspace( 0.2, 2.0, 7 )
+    Uw = np.array( [ 10.0, 20.0, 30.0 ] )
+    calRst = lsm.piersonMoskowitzSpectrum( w, Uw[ :, None ] )
+    expectedRst = [ [ lsm.piersonMoskowitzSpectrum( float( wi ), float( Ui ) ) 
+                      for wi in w ] for Ui in Uw ]
+    assert calRst.shape == ( 3, 7 )
+    np.testing.assert_allclose( calRst, expectedRst )
+
+    with pytest.raises( ValueError ):
+        _ = lsm.piersonMoskowitzSpectrum( w, Uw )
+
+    with pytest.raises( ValueError ):
+        _ = lsm.piersonMoskowitzSpectrum( "w", 20 )
+
+
 ###############################################################################
 # Test jonswapSpectrum
 ###############################################################################
@@ -94,6 +110,20 @@ def test_jonswapSpectrum_normalUseCase_expectedRst():
     np.testing.assert_allclose( np.round( calRst, 4 ), np.round( expectedRst, 4 ) )
 
 
+def test_jonswapSpectrum_arrayInputCase_matchScalarRst():
+    w = np.linspace( 0.2, 2.0, 7 )
+    wp = np.array( [ 0.4, 0.5, 0.6 ] )
+    gamma = np.array( [ 1.0, 2.0, 3.3 ] )
+    calRst = lsm.jonswapSpectrum( w, wp[ :, None ], gamma=gamma[ :, None ] )
+    expectedRst = [ [ lsm.jonswapSpectrum( float( wi ), float( wpi ), gamma=float( gi ) ) 
+                      for wi in w ] for wpi, gi in zip( wp, gamma ) ]
+    assert calRst.shape == ( 3, 7 )
+    np.testing.assert_allclose( calRst, expectedRst )
+
+    with pytest.raises( ValueError ):
+        _ = lsm.jonswapSpectrum( w, wp )
+
+
 ###############################################################################
 # Test isscSpectrum
 ###############################################################################
@@ -143,6 +173,17 @@ def test_isscSpectrum_normalUseCase_expectedRst():
     np.testing.assert_allclose( np.round( calRst, 6 ), np.round( expectedRst, 6 ) )
 
 
+def test_isscSpectrum_arrayInputCase_matchScalarRst():
+    w = np.linspace( 0.2, 2.0, 7 )
+    wp = np.array( [ 0.4, 0.5, 0.6 ] )
+    Hs = np.array( [ 2.0, 4.0, 6.0 ] )
+    calRst = lsm.isscSpectrum( w, wp[ :, None ], Hs[ :, None ] )
+    expectedRst = [ [ lsm.isscSpectrum( float( wi ), float( wpi ), float( Hsi ) ) 
+                      for wi in w ] for wpi, Hsi in zip( wp, Hs ) ]
+    assert calRst.shape == ( 3, 7 )
+    np.testing.assert_allclose( calRst, expectedRst )
+
+
 ###############################################################################
 # Test gaussianSwellSpectrum
 ###############################################################################
@@ -206,6 +247,18 @@ def test_gaussianSwellSpectrum_normalUseCase_expectedRst():
     np.testing.assert_allclose( np.round( calRst, 4 ), np.round( expectedRst, 4 ) )
 
 
+def test_gaussianSwellSpectrum_arrayInputCase_matchScalarRst():
+    w = np.linspace( 0.2, 2.0, 7 )
+    wp = np.array( [ 0.4, 0.5, 0.6 ] )
+    Hs = np.array( [ 2.0, 4.0, 6.0 ] )
+    calRst = lsm.gaussianSwellSpectrum( w, wp[ :, None ], Hs[ :, None ], 0.07 )
+    expectedRst = [ [ lsm.gaussianSwellSpectrum( float( wi ), float( wpi ), 
+                                                 float( Hsi ), 0.07 ) 
+                      for wi in w ] for wpi, Hsi in zip( wp, Hs ) ]
+    assert calRst.shape == ( 3, 7 )
+    np.testing.assert_allclose( calRst, expectedRst )
+
+
 ###############################################################################
 # Test ochiHubbleSpectrum
 ###############################################################################
@@ -272,3 +325,19 @@ def test_ochiHubbleSpectrum_normalUseCase_expectedRst():
     calRst = lsm.ochiHubbleSpectrum( w, wp1, wp2, Hs1, Hs2, lambda1, lambda2 )
     expectedRst = 0.1156
     np.testing.assert_allclose( np.round( calRst, 4 ), np.round( expectedRst, 4 ) )
+
+
+def test_ochiHubbleSpectrum_arrayInputCase_matchScalarRst():
+    w = np.linspace( 0.2, 2.0, 7 )
+    wp1 = np.array( [ 0.2, 0.3 ] )
+    Hs1 = np.array( [ 4.0, 6.0 ] )
+    calRst = lsm.ochiHubbleSpectrum( w, wp1[ :, None ], 0.5, Hs1[ :, None ], 2.0, 
+                                     1.5, 2.5 )
+    expectedRst = [ [ lsm.ochiHubbleSpectrum( float( wi ), float( wpi ), 0.5, 
+                                              float( Hsi ), 2.0, 1.5, 2.5 ) 
+                      for wi in w ] for wpi, Hsi in zip( wp1, Hs1 ) ]
+    assert calRst.shape == ( 2, 7 )
+    np.testing.assert_allclose( calRst, expectedRst )
+
+    with pytest.raises( ValueError ):
+        _ = lsm.ochiHubbleSpectrum( 0.1, [ 0.2, 0.6 ], 0.5, 4.0, 2.0, 1.5, 2.5 )
@@ -40,6 +40,27 @@ def test_davenportSpectrumWithDragCoef_normalUseCase_expectedRst():
     np.testing.assert_allclose( np.round( calRst, 4 ), np.round( expectedRst, 4 ) )
 
 
+def test_davenportSpectrumWithDragCoef_arrayInputCase_matchScalarRst():
+    n = np.linspace( 0.1, 2.0, 5 )
+    delta1 = np.array( [ 8.0, 10.0, 12.0 ] )
+    calRst = lsm.davenportSpectrumWithDragCoef( n, delta1[ :, None ], 
+                                                normalized=False )
+    expectedRst = [ [ lsm.davenportSpectrumWithDragCoef( float( ni ), float( di ), 
+                                                         normalized=False ) 
+                      for ni in n ] for di in delta1 ]
+    assert calRst.shape == ( 3, 5 )
+    np.testing.assert_allclose( calRst, expectedRst )
+
+    with pytest.raises( ValueError ):
+        _ = lsm.davenportSpectrumWithDragCoef( n, delta1 )
+
+    kappa = np.array( [ [ 0.005 ], [ 0.01 ] ] )
+    calRst = lsm.davenportSpectrumWithDragCoef( n, 10, kappa=kappa, normalized=True )
+    assert calRst.shape == ( 2, 5 )
+    np.testing.assert_allclose( calRst[ 1 ], 
+                                lsm.davenportSpectrumWithDragCoef( n, 10 ) )
+
+
 ###############################################################################
 # Test davenportSpectrumWithRoughnessLength
 ###############################################################################
@@ -88,6 +109,27 @@ def test_davenportSpectrum_normalized_sameRst():
     np.testing.assert_allclose( calDrag, calRoughness )
 
 
+def test_davenportSpectrumWithRoughnessLength_arrayInputCase_matchScalarRst():
+    n = np.linspace( 0.1, 2.0, 5 )
+    uz = np.array( [ 8.0, 10.0, 12.0 ] )
+    z = np.array( [ 10.0, 20.0, 40.0 ] )
+    for normalized in [ True, False ]:
+        calRst = lsm.davenportSpectrumWithRoughnessLength( n, uz[ :, None ], 
+                                                           z=z[ :, None ],
+                                                           normalized=normalized )
+        expectedRst = [ [ lsm.davenportSpectrumWithRoughnessLength( 
+            float( ni ), float( ui ), z=float( zi ), normalized=normalized ) 
+            for ni in n ] for ui, zi in zip( uz, z ) ]
+        assert calRst.shape == ( 3, 5 )
+        np.testing.assert_allclose( calRst, expectedRst )
+
+    z0 = np.array( [ [ 0.01 ], [ 0.03 ] ] )
+    calRst = lsm.davenportSpectrumWithRoughnessLength( n, 10, z0=z0, normalized=True )
+    assert calRst.shape == ( 2, 5 )
+    np.testing.assert_allclose( calRst[ 1 ], 
+                                lsm.davenportSpectrumWithRoughnessLength( n, 10 ) )
+
+
 ###############################################################################
 # Test ec1Spectrum
 ###############################################################################
@@ -215,6 +257,24 @@ def test_ec1Spectrum_notNormalizedUseCase_expectedRst():
     np.testing.assert_allclose( np.round( calRst, 4 ), np.round( expectedRst, 4 ) )
 
 
+def test_ec1Spectrum_arrayInputCase_matchScalarRst():
+    n = np.linspace( 0.1, 2.0, 5 )
+    uz = np.array( [ 8.0, 10.0, 12.0 ] )
+    z = np.array( [ 0.5, 20.0, 40.0 ] )
+    calRst = lsm.ec1Spectrum( n, uz[ :, None ], z=z[ :, None ], tcat=2, 
+                              normalized=False )
+    expectedRst = [ [ lsm.ec1Spectrum( float( ni ), float( ui ), z=float( zi ), 
+                                       tcat=2, normalized=False ) 
+                      for ni in n ] for ui, zi in zip( uz, z ) ]
+    assert calRst.shape == ( 3, 5 )
+    np.testing.assert_allclose( calRst, expectedRst )
+
+    sigma = np.array( [ [ 0.03 ], [ 0.05 ] ] )
+    calRst = lsm.ec1Spectrum( n, 10, sigma=sigma, normalized=True )
+    assert calRst.shape == ( 2, 5 )
+    np.testing.assert_allclose( calRst[ 1 ], lsm.ec1Spectrum( n, 10 ) )
+
+
 ###############################################################################
 # Test iecSpectrum
 ###############################################################################
@@ -307,6 +367,28 @@ def test_iecSpectrum_notNormalizedUseCase_expectedRst():
     np.testing.assert_allclose( np.round( calRst, 4 ), np.round( expectedRst, 4 ) )
 
 
+def test_iecSpectrum_arrayInputCase_matchScalarRst():
+    f = np.linspace( 0.1, 2.0, 5 )
+    vhub = np.array( [ 8.0, 10.0, 12.0 ] )
+    z = np.array( [ 30.0, 60.0, 90.0 ] )
+    for k in [ 1, 2, 3 ]:
+        calRst = lsm.iecSpectrum( f, vhub[ :, None ], z=z[ :, None ], k=k, 
+                                  normalized=False )
+        expectedRst = [ [ lsm.iecSpectrum( float( fi ), float( vi ), z=float( zi ), 
+                                           k=k, normalized=False ) 
+                          for fi in f ] for vi, zi in zip( vhub, z ) ]
+        assert calRst.shape == ( 3, 5 )
+        np.testing.assert_allclose( calRst, expectedRst )
+
+    calRst = lsm.iecSpectrum( np.ones( ( 4, 5, 6 ) ), 10 )
+    assert calRst.shape == ( 4, 5, 6 )
+
+    sigma = np.array( [ [ 0.03 ], [ 0.05 ] ] )
+    calRst = lsm.iecSpectrum( f, 10, sigma=sigma, normalized=True )
+    assert calRst.shape == ( 2, 5 )
+    np.testing.assert_allclose( calRst[ 1 ], lsm.iecSpectrum( f, 10 ) )
+
+
 ###############################################################################
 # Test apiSpectrum
 ###############################################################################
@@ -333,3 +415,13 @@ def test_apiSpectrum_normalUseCase_expectedRst():
     expectedRst = 320 * np.power( u0 / 10, 2 ) 
     expectedRst = expectedRst / np.power( 1 + np.power( ftilde, n ), 5 / ( 3 * n ) )
     np.testing.assert_allclose( np.round( calRst, 4 ), np.round( expectedRst, 4 ) )
+
+
+def test_apiSpectrum_arrayInputCase_matchScalarRst():
+    f = np.linspace( 0.1, 2.0, 5 )
+    u0 = np.array( [ 8.0, 10.0, 12.0 ] )
+    calRst = lsm.apiSpectrum( f, u0[ :, None ], z=20 )
+    expectedRst = [ [ lsm.apiSpectrum( float( fi ), float( ui ), z=20 ) 
+                      for fi in f ] for ui in u0 ]
+    assert calRst.shape == ( 3, 5 )
+    np.testing.assert_allclose( calRst, expectedRst )
@@ -112,6 +112,20 @@ def test_MetropolisHastingsSampler_normalUseCase_diffByOne(
         sampleRst, candi if pseudoUniformVal <= acceptanceRatio else initialVal )
 
 
+def test_MetropolisHastingsSampler_rngCase_reproducible():
+    def targetPdf( x ):
+        return 0 if x < 0 else np.exp( -x )
+
+    def getChain( rng ):
+        mhSampler = rpm.MetropolisHastingsSampler( 
+            initialVal=1.0, targetPdf=targetPdf, 
+            proposalCSampler=lambda x: rng.normal( x, 1 ), rng=rng )
+        return [ mhSampler.getSample() for _ in range( 20 ) ]
+
+    np.testing.assert_array_equal( getChain( np.random.default_rng( 2023 ) ), 
+                                   getChain( np.random.default_rng( 2023 ) ) )
+
+
 ###############################################################################
 # Test AuModifiedMHSampler
 ###############################################################################
@@ -299,3 +313,19 @@ def test_AuModifiedMHSampler_normalUseCase_diffByOne(
         sampleRst[ 0 ], candi0 if pseudoUniformVal <= acceptanceRatio0 else initialVal[ 0 ] )
     np.testing.assert_allclose( 
         sampleRst[ 1 ], candi0 if pseudoUniformVal <= acceptanceRatio1 else initialVal[ 1 ] )
+
+
+def test_AuModifiedMHSampler_rngCase_reproducible():
+    def targetPdf( x ):
+        return 0 if x < 0 else np.exp( -x )
+
+    def getChain( rng ):
+        proposalCSampler = [ lambda x: rng.normal( x, 1 ) ] * 2
+        auMMHSampler = rpm.AuModifiedMHSampler( initialVal=[ 1.0, 1.0 ], 
+                                                targetPdf=[ targetPdf ] * 2, 
+                                                proposalCSampler=proposalCSampler, 
+                                                rng=rng )
+        return [ auMMHSampler.getSample() for _ in range( 20 ) ]
+
+    np.testing.assert_array_equal( getChain( np.random.default_rng( 2023 ) ), 
+                                   getChain( np.random.default_rng( 2023 ) ) )
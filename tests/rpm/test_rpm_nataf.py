@@ -655,3 +655,13 @@ def test_NatafTransformation_sampleDataPoint_1dArray( mock_randn ):
     calSample = natafDist.getSample()
     expectedSample = [ 0.5, 0.5 ]
     np.testing.assert_allclose( expectedSample, calSample )
+
+
+def test_NatafTransformation_rngCase_reproducible():
+    distObjs = [ stats.norm(), stats.norm() ]
+    corrMat = [ [ 1.0, 0.5 ], [ 0.5, 1.0 ] ]
+    natafDist1 = rpm.NatafTransformation( distObjs=distObjs, corrMat=corrMat, 
+                                          rng=np.random.default_rng( 2023 ) )
+    natafDist2 = rpm.NatafTransformation( distObjs=distObjs, corrMat=corrMat, 
+                                          rng=np.random.default_rng( 2023 ) )
+    np.testing.assert_allclose( natafDist1.getSample(), natafDist2.getSample() )
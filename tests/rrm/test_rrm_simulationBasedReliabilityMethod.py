@@ -298,3 +298,16 @@ def test_subsetSimulation_normalCase_scalar( mock_getX, mock_normal,
     np.testing.assert_allclose( expectedAllLsfValues, calAllLsfValues, atol=1e-6 )
     np.testing.assert_allclose( expectedAllUSamples, calAllUSamples, atol=1e-6 )
     np.testing.assert_allclose( expectedAllXSamples, calAllXSamples, atol=1e-6 )
+
+
+def test_subsetSimulation_rngCase_reproducible( ):
+    dim = 2
+    g = lambda X: -np.sum( X ) + 4
+    distObjs = [ stats.norm(), stats.norm() ]
+    corrMat = np.eye( dim )
+    pf1, lsf1, _, _ = rrm.subsetSimulation( dim, g, distObjs, corrMat, 50, 3, 
+                                            rng=np.random.default_rng( 2023 ) )
+    pf2, lsf2, _, _ = rrm.subsetSimulation( dim, g, distObjs, corrMat, 50, 3, 
+                                            rng=np.random.default_rng( 2023 ) )
+    np.testing.assert_allclose( pf1, pf2 )
+    np.testing.assert_array_equal( lsf1, lsf2 )
@@ -314,3 +314,38 @@ def test_sequenceHysteresisFilter_floatPoints_keepPeakValleys():
     expectedRst = [ -0.5, -1.0, 1.5, -1.0, 1.5, 4.5, 1.0, -1.0, 3.0, 1.5, -1.5, 
                     0.5, 1.0 ]
     np.testing.assert_allclose( calRst, expectedRst )
+
+
+###############################################################################
+# Test sequencePeakValleyFilterBatch
+###############################################################################
+def test_sequencePeakValleyFilterBatch_incorrectDim_valueError():
+    data = [ 1.0, 2.0, 3.0 ]
+    with pytest.raises( ValueError ):
+        _ = utils.sequencePeakValleyFilterBatch( data )
+
+    data = [ [ 1.0 ], [ 2.0 ] ]
+    with pytest.raises( ValueError ):
+        _ = utils.sequencePeakValleyFilterBatch( data )
+
+
+def test_sequencePeakValleyFilterBatch_twoRows_paddedRst():
+    data = [ [ -0.5, 1.0, -2.0, 3.0, -1.0, 4.5 ], 
+             [ 1.0, 2.0, 2.0, 3.0, -1.0, 0.5 ] ]
+    calRst, calLengths = utils.sequencePeakValleyFilterBatch( data )
+    expectedRst = [ [ -0.5, 1.0, -2.0, 3.0, -1.0, 4.5 ], 
+                    [ 1.0, 3.0, -1.0, 0.5, np.nan, np.nan ] ]
+    np.testing.assert_allclose( calRst, expectedRst )
+    np.testing.assert_allclose( calLengths, [ 6, 4 ] )
+
+
+def test_sequencePeakValleyFilterBatch_plateaus_sameAsSequencePeakValleyFilter():
+    data = [ [ 0, 1, 1, 0, 0, 2, 2, 2, 1, 3 ],
+             [ 1, 1, 0, 2, 1, 1, 2, 2, 2, 2 ],
+             [ 2, 2, 2, 2, 2, 2, 2, 2, 2, 2 ],
+             [ 0, 1, 2, 3, 3, 2, 1, 1, 2, 3 ] ]
+    calRst, calLengths = utils.sequencePeakValleyFilterBatch( data )
+    for row, rst, length in zip( data, calRst, calLengths ):
+        expectedRst = utils.sequencePeakValleyFilter( row, keepEnds=True )
+        np.testing.assert_allclose( rst[ : length ], expectedRst )
+        assert np.all( np.isnan( rst[ length: ] ) )